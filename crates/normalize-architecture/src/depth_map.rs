@@ -128,46 +128,52 @@ pub async fn analyze_depth_map(
         );
     }
 
-    // Build entries
-    let mut entries: Vec<DepthEntry> = all_modules
-        .iter()
-        .map(|module| {
-            let depth = depth_memo.get(module).copied().unwrap_or(0);
-            let fan_in = graph
-                .importers_by_file
-                .get(module)
-                .map(|s| s.len())
-                .unwrap_or(0);
-            let fan_out = graph
-                .imports_by_file
-                .get(module)
-                .map(|s| s.len())
-                .unwrap_or(0);
-            let downstream = compute_downstream(module, &graph.importers_by_file);
-            let ripple_score = fan_out * depth * downstream;
-
-            DepthEntry {
-                module: module.clone(),
-                depth,
-                fan_in,
-                fan_out,
-                downstream,
-                ripple_score,
-                delta: None,
-            }
-        })
-        .collect();
-
-    // Compute stats on full list before truncation
+    // Build entries, accumulating the summary stats (over the full list, before
+    // truncation) in the same pass.
+    let mut entries: Vec<DepthEntry> = Vec::with_capacity(all_modules.len());
+    let mut max_depth = 0;
+    let mut depth_sum = 0;
+    let mut max_ripple_score = 0;
+    let mut modules_at_depth_0 = 0;
+    for module in &all_modules {
+        let depth = depth_memo.get(module).copied().unwrap_or(0);
+        let fan_in = graph
+            .importers_by_file
+            .get(module)
+            .map(|s| s.len())
+            .unwrap_or(0);
+        let fan_out = graph
+            .imports_by_file
+            .get(module)
+            .map(|s| s.len())
+            .unwrap_or(0);
+        let downstream = compute_downstream(module, &graph.importers_by_file);
+        let ripple_score = fan_out * depth * downstream;
+
+        max_depth = max_depth.max(depth);
+        depth_sum += depth;
+        max_ripple_score = max_ripple_score.max(ripple_score);
+        if depth == 0 {
+            modules_at_depth_0 += 1;
+        }
+
+        entries.push(DepthEntry {
+            module: module.clone(),
+            depth,
+            fan_in,
+            fan_out,
+            downstream,
+            ripple_score,
+            delta: None,
+        });
+    }
+
     let total_modules = entries.len();
-    let max_depth = entries.iter().map(|e| e.depth).max().unwrap_or(0);
     let avg_depth = if total_modules > 0 {
-        entries.iter().map(|e| e.depth).sum::<usize>() as f64 / total_modules as f64
+        depth_sum as f64 / total_modules as f64
     } else {
         0.0
     };
-    let max_ripple_score = entries.iter().map(|e| e.ripple_score).max().unwrap_or(0);
-    let modules_at_depth_0 = entries.iter().filter(|e| e.depth == 0).count();
 
     let stats = DepthMapStats {
         total_modules,
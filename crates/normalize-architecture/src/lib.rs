@@ -515,22 +515,24 @@ pub fn compute_downstream(
     node: &str,
     importers_by_file: &HashMap<String, HashSet<String>>,
 ) -> usize {
-    let mut visited = HashSet::new();
-    let mut queue = VecDeque::new();
+    // Borrow names from the graph: only the count is returned, so there is no
+    // need to clone every reachable module name into the BFS state.
+    let mut visited: HashSet<&str> = HashSet::new();
+    let mut queue: VecDeque<&str> = VecDeque::new();
 
     if let Some(importers) = importers_by_file.get(node) {
         for imp in importers {
-            if visited.insert(imp.clone()) {
-                queue.push_back(imp.clone());
+            if visited.insert(imp) {
+                queue.push_back(imp);
             }
         }
     }
 
     while let Some(current) = queue.pop_front() {
-        if let Some(importers) = importers_by_file.get(&current) {
+        if let Some(importers) = importers_by_file.get(current) {
             for imp in importers {
-                if visited.insert(imp.clone()) {
-                    queue.push_back(imp.clone());
+                if visited.insert(imp) {
+                    queue.push_back(imp);
                 }
             }
         }
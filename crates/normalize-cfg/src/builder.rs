@@ -96,7 +96,7 @@ impl Builder {
 // ---------------------------------------------------------------------------
 
 /// Parsed classification of a node based on CFG query capture names.
-#[derive(Debug, Clone, PartialEq, Eq)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
 enum CaptureKind {
     Branch,
     BranchCondition,
@@ -175,6 +175,36 @@ fn parse_capture_name(name: &str) -> Option<CaptureKind> {
     }
 }
 
+impl CaptureKind {
+    /// Whether this capture marks a top-level control-flow node (branch/loop/match/try/exit).
+    fn is_structural(self) -> bool {
+        matches!(
+            self,
+            CaptureKind::Branch
+                | CaptureKind::Loop
+                | CaptureKind::Match
+                | CaptureKind::Try
+                | CaptureKind::ExitReturn
+                | CaptureKind::ExitBreak
+                | CaptureKind::ExitContinue
+                | CaptureKind::ExitThrow
+        )
+    }
+
+    fn effect_kind(self) -> Option<EffectKind> {
+        match self {
+            CaptureKind::EffectAwait => Some(EffectKind::Await),
+            CaptureKind::EffectDefer => Some(EffectKind::Defer),
+            CaptureKind::EffectYield => Some(EffectKind::Yield),
+            CaptureKind::EffectAcquire => Some(EffectKind::Acquire),
+            CaptureKind::EffectRelease => Some(EffectKind::Release),
+            CaptureKind::EffectSend => Some(EffectKind::Send),
+            CaptureKind::EffectReceive => Some(EffectKind::Receive),
+            _ => None,
+        }
+    }
+}
+
 // ---------------------------------------------------------------------------
 // Classified node
 // ---------------------------------------------------------------------------
@@ -242,51 +272,49 @@ pub fn build(
 
     // Build a list of top-level CFG control-flow nodes (branches, loops, exits).
     // We need to identify the top-level structure nodes and their children.
-    let capture_names = query.capture_names().to_vec();
+    // Classify each capture name once per query; the passes below dispatch on
+    // `capture_kinds[capture.index]` instead of re-comparing name strings per capture.
+    let capture_kinds: Vec<Option<CaptureKind>> = query
+        .capture_names()
+        .iter()
+        .map(|name| parse_capture_name(name))
+        .collect();
 
     // First pass: collect all "structural" nodes (branch/loop/match/try) and their sub-captures.
     // We'll build a flat list of events sorted by byte offset.
     let mut structural_nodes: Vec<ClassifiedNode> = Vec::new();
 
-    // Collect match data: (primary_capture_name_idx, primary_node_range, sub_captures)
+    // Collect match data: (primary_capture_kind, primary_node_range, sub_captures)
     // We collect into owned structures so we can release the borrow from the streaming iterator.
     struct MatchData {
-        primary_name_idx: usize,
+        primary_kind: CaptureKind,
         primary_start_byte: usize,
         primary_end_byte: usize,
         primary_start_row: usize,
         primary_end_row: usize,
-        sub_captures: Vec<(usize, usize, usize)>, // (name_idx, start_byte, end_byte)
+        sub_captures: Vec<(CaptureKind, usize, usize)>, // (kind, start_byte, end_byte)
     }
 
     let mut raw_matches: Vec<MatchData> = Vec::new();
     let mut matches_iter = cursor.matches(&query, tree.root_node(), source);
     while let Some(m) = matches_iter.next() {
-        let primary = m.captures.iter().find(|c| {
-            let name = capture_names[c.index as usize];
-            matches!(
-                name,
-                "cfg.branch"
-                    | "cfg.loop"
-                    | "cfg.match"
-                    | "cfg.try"
-                    | "cfg.exit.return"
-                    | "cfg.exit.break"
-                    | "cfg.exit.continue"
-                    | "cfg.exit.throw"
-            )
+        let primary = m.captures.iter().find_map(|c| {
+            capture_kinds[c.index as usize]
+                .filter(|k| k.is_structural())
+                .map(|k| (k, c.node))
         });
-        let Some(primary_cap) = primary else {
+        let Some((primary_kind, pnode)) = primary else {
             continue;
         };
-        let pnode = primary_cap.node;
         let subs: Vec<_> = m
             .captures
             .iter()
-            .map(|c| (c.index as usize, c.node.start_byte(), c.node.end_byte()))
+            .filter_map(|c| {
+                capture_kinds[c.index as usize].map(|k| (k, c.node.start_byte(), c.node.end_byte()))
+            })
             .collect();
         raw_matches.push(MatchData {
-            primary_name_idx: primary_cap.index as usize,
+            primary_kind,
             primary_start_byte: pnode.start_byte(),
             primary_end_byte: pnode.end_byte(),
             primary_start_row: pnode.start_position().row,
@@ -297,10 +325,7 @@ pub fn build(
     drop(matches_iter);
 
     for mat in &raw_matches {
-        let primary_name = capture_names[mat.primary_name_idx];
-        let Some(kind) = parse_capture_name(primary_name) else {
-            continue;
-        };
+        let kind = mat.primary_kind;
 
         let start = mat.primary_start_byte;
         let end = mat.primary_end_byte;
@@ -332,29 +357,28 @@ pub fn build(
         };
 
         // Collect sub-captures
-        for &(name_idx, sub_start, sub_end) in &mat.sub_captures {
-            let name = capture_names[name_idx];
+        for &(sub_kind, sub_start, sub_end) in &mat.sub_captures {
             let cr = sub_start..sub_end;
-            match name {
-                "cfg.branch.condition" => cn.branch_condition = Some(cr),
-                "cfg.branch.then" => cn.branch_then = Some(cr),
-                "cfg.branch.else" => cn.branch_else = Some(cr),
-                "cfg.loop.condition" => cn.loop_condition = Some(cr),
-                "cfg.loop.body" => cn.loop_body = Some(cr),
-                "cfg.match.arm" => cn.match_arms.push(cr),
-                "cfg.try.body" => cn.try_body = Some(cr),
-                "cfg.try.catch" => {
+            match sub_kind {
+                CaptureKind::BranchCondition => cn.branch_condition = Some(cr),
+                CaptureKind::BranchThen => cn.branch_then = Some(cr),
+                CaptureKind::BranchElse => cn.branch_else = Some(cr),
+                CaptureKind::LoopCondition => cn.loop_condition = Some(cr),
+                CaptureKind::LoopBody => cn.loop_body = Some(cr),
+                CaptureKind::MatchArm => cn.match_arms.push(cr),
+                CaptureKind::TryBody => cn.try_body = Some(cr),
+                CaptureKind::TryCatch => {
                     cn.try_catches.push(cr);
                     // Ensure parallel try_catch_types has an entry for this catch block.
                     cn.try_catch_types.push(Vec::new());
                 }
-                "cfg.try.finally" => cn.try_finally = Some(cr),
-                "cfg.exit.throw.type" => {
+                CaptureKind::TryFinally => cn.try_finally = Some(cr),
+                CaptureKind::ExitThrowType => {
                     let type_text =
                         String::from_utf8_lossy(&source[sub_start..sub_end]).into_owned();
                     cn.throw_type = Some(type_text);
                 }
-                "cfg.try.catch.type" => {
+                CaptureKind::TryCatchType => {
                     // Associate with the most recently seen catch block.
                     let type_text =
                         String::from_utf8_lossy(&source[sub_start..sub_end]).into_owned();
@@ -388,9 +412,12 @@ pub fn build(
     let mut raw_def_use: Vec<RawDefUse> = Vec::new();
 
     // We need to check if the query has any def/use captures at all.
-    let has_def_use = capture_names
-        .iter()
-        .any(|n| matches!(*n, "cfg.def" | "cfg.def.name" | "cfg.use" | "cfg.use.name"));
+    let has_def_use = capture_kinds.iter().any(|k| {
+        matches!(
+            k,
+            Some(CaptureKind::Def | CaptureKind::DefName | CaptureKind::Use | CaptureKind::UseName)
+        )
+    });
 
     if has_def_use {
         let mut cursor2 = tree_sitter::QueryCursor::new();
@@ -413,21 +440,28 @@ pub fn build(
 
         let mut du_iter = cursor2.matches(&query, tree.root_node(), source);
         while let Some(m) = du_iter.next() {
-            let primary = m.captures.iter().find(|c| {
-                let name = capture_names[c.index as usize];
-                matches!(name, "cfg.def" | "cfg.use")
-            });
-            let Some(primary_cap) = primary else {
+            let primary = m
+                .captures
+                .iter()
+                .find_map(|c| match capture_kinds[c.index as usize] {
+                    Some(CaptureKind::Def) => Some((true, c.node)),
+                    Some(CaptureKind::Use) => Some((false, c.node)),
+                    _ => None,
+                });
+            let Some((is_def, pnode)) = primary else {
                 continue;
             };
-            let is_def = capture_names[primary_cap.index as usize] == "cfg.def";
-            let pnode = primary_cap.node;
 
             // Look for the .name sub-capture
-            let name_cap = m.captures.iter().find(|c| {
-                let n = capture_names[c.index as usize];
-                (is_def && n == "cfg.def.name") || (!is_def && n == "cfg.use.name")
-            });
+            let name_kind = if is_def {
+                CaptureKind::DefName
+            } else {
+                CaptureKind::UseName
+            };
+            let name_cap = m
+                .captures
+                .iter()
+                .find(|c| capture_kinds[c.index as usize] == Some(name_kind));
 
             let (name_start, name_end, name_start_row, has_name) = if let Some(nc) = name_cap {
                 (
@@ -529,7 +563,9 @@ pub fn build(
 
     // --- Effects pass ---
     // Collect effect captures and assign them to blocks by byte range.
-    let has_effects = capture_names.iter().any(|n| n.starts_with("cfg.effect."));
+    let has_effects = capture_kinds
+        .iter()
+        .any(|k| k.and_then(CaptureKind::effect_kind).is_some());
 
     if has_effects {
         struct RawEffect {
@@ -545,7 +581,7 @@ pub fn build(
 
         // Collect all effect captures as owned data.
         struct EffMatchData {
-            name_idx: usize,
+            kind: EffectKind,
             start_byte: usize,
             end_byte: usize,
             start_row: usize,
@@ -554,10 +590,11 @@ pub fn build(
         let mut eff_iter = eff_cursor.matches(&query, tree.root_node(), source);
         while let Some(m) = eff_iter.next() {
             for cap in m.captures {
-                let cap_name = capture_names[cap.index as usize];
-                if cap_name.starts_with("cfg.effect.") {
+                if let Some(kind) =
+                    capture_kinds[cap.index as usize].and_then(CaptureKind::effect_kind)
+                {
                     eff_matches.push(EffMatchData {
-                        name_idx: cap.index as usize,
+                        kind,
                         start_byte: cap.node.start_byte(),
                         end_byte: cap.node.end_byte(),
                         start_row: cap.node.start_position().row,
@@ -567,21 +604,10 @@ pub fn build(
         }
         drop(eff_iter);
 
-        for mat in &eff_matches {
+        for mat in eff_matches {
             if mat.start_byte < body_range.start || mat.end_byte > body_range.end {
                 continue;
             }
-            let cap_name = capture_names[mat.name_idx];
-            let kind = match cap_name {
-                "cfg.effect.await" => EffectKind::Await,
-                "cfg.effect.defer" => EffectKind::Defer,
-                "cfg.effect.yield" => EffectKind::Yield,
-                "cfg.effect.acquire" => EffectKind::Acquire,
-                "cfg.effect.release" => EffectKind::Release,
-                "cfg.effect.send" => EffectKind::Send,
-                "cfg.effect.receive" => EffectKind::Receive,
-                _ => continue,
-            };
             let text = String::from_utf8_lossy(&source[mat.start_byte..mat.end_byte]).into_owned();
             // Truncate label to 120 chars so it stays useful without bloating the DB.
             let label = if text.len() > 120 {
@@ -590,7 +616,7 @@ pub fn build(
                 Some(text)
             };
             raw_effects.push(RawEffect {
-                kind,
+                kind: mat.kind,
                 byte_offset: mat.start_byte,
                 line: row_to_line(mat.start_row),
                 label,
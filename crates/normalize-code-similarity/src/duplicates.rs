@@ -1118,10 +1118,11 @@ pub fn build_duplicate_functions_report(cfg: DuplicateFunctionsConfig<'_>) -> Du
         0
     } else {
         let before = groups.len();
-        groups.retain(|g| {
-            let names: std::collections::HashSet<&str> =
-                g.locations.iter().map(|l| l.symbol.as_str()).collect();
-            names.len() > 1
+        // Keep groups with at least two distinct symbol names; no need to
+        // collect the full name set just to compare its size against 1.
+        groups.retain(|g| match g.locations.split_first() {
+            Some((first, rest)) => rest.iter().any(|l| l.symbol != first.symbol),
+            None => false,
         });
         before - groups.len()
     };
@@ -1771,6 +1772,12 @@ pub fn build_duplicate_types_report(
         .collect();
 
     let mut types: Vec<TypeInfo> = Vec::new();
+    // Field names are interned and their document frequencies counted as each
+    // type is collected, so IDF weights can be frozen in one pass afterwards.
+    let mut field_ids: HashMap<String, u32> = HashMap::new();
+    let mut field_names: Vec<String> = Vec::new();
+    let mut field_df: Vec<usize> = Vec::new();
+    let mut type_fields: Vec<Vec<u32>> = Vec::new();
     let mut files_scanned = 0;
     // normalize-syntax-allow: rust/unwrap-in-impl - compile-time constant regex pattern
     let field_re = Regex::new(r"(?m)^\s*(?:pub\s+)?(\w+)\s*:\s*\S").unwrap();
@@ -1831,6 +1838,25 @@ pub fn build_duplicate_types_report(
                     .display()
                     .to_string()
             };
+            let mut ids: Vec<u32> = fields
+                .iter()
+                .map(|f| match field_ids.get(f.as_str()) {
+                    Some(&id) => id,
+                    None => {
+                        let id = field_names.len() as u32;
+                        field_ids.insert(f.clone(), id);
+                        field_names.push(f.clone());
+                        field_df.push(0);
+                        id
+                    }
+                })
+                .collect();
+            ids.sort_unstable();
+            ids.dedup();
+            for &id in &ids {
+                field_df[id as usize] += 1;
+            }
+            type_fields.push(ids);
             types.push(TypeInfo {
                 file: rel_path,
                 name: sym.name.clone(),
@@ -1842,19 +1868,17 @@ pub fn build_duplicate_types_report(
     }
     pb.finish_and_clear();
 
+    // Freeze IDF weights once. Each type already carries its distinct field
+    // ids (sorted), so each pair below is a single merge walk over two sorted
+    // id lists instead of building two hash sets per comparison.
     let n = types.len() as f64;
-    let mut field_df: HashMap<&str, usize> = HashMap::new();
-    for t in &types {
-        for f in t.fields.iter() {
-            *field_df.entry(f.as_str()).or_insert(0) += 1;
-        }
-    }
-    let idf = |field: &str| -> f64 {
-        let df = field_df.get(field).copied().unwrap_or(1) as f64;
-        (1.0 + n / df).ln()
-    };
+    let idf: Vec<f64> = field_df
+        .iter()
+        .map(|&df| (1.0 + n / df as f64).ln())
+        .collect();
 
     let mut duplicates: Vec<DuplicatePair> = Vec::new();
+    let mut common_ids: Vec<u32> = Vec::new();
     for i in 0..types.len() {
         for j in (i + 1)..types.len() {
             let t1 = &types[i];
@@ -1862,6 +1886,36 @@ pub fn build_duplicate_types_report(
             if t1.name == t2.name {
                 continue;
             }
+            let (f1, f2) = (&type_fields[i], &type_fields[j]);
+            common_ids.clear();
+            let mut weighted_common = 0.0;
+            let mut weighted_union = 0.0;
+            let (mut a, mut b) = (0, 0);
+            while a < f1.len() && b < f2.len() {
+                match f1[a].cmp(&f2[b]) {
+                    std::cmp::Ordering::Less => {
+                        weighted_union += idf[f1[a] as usize];
+                        a += 1;
+                    }
+                    std::cmp::Ordering::Greater => {
+                        weighted_union += idf[f2[b] as usize];
+                        b += 1;
+                    }
+                    std::cmp::Ordering::Equal => {
+                        let w = idf[f1[a] as usize];
+                        weighted_common += w;
+                        weighted_union += w;
+                        common_ids.push(f1[a]);
+                        a += 1;
+                        b += 1;
+                    }
+                }
+            }
+            if common_ids.len() < 3 {
+                continue;
+            }
+            weighted_union += f1[a..].iter().map(|&f| idf[f as usize]).sum::<f64>();
+            weighted_union += f2[b..].iter().map(|&f| idf[f as usize]).sum::<f64>();
             let pair_key = if t1.name < t2.name {
                 (t1.name.clone(), t2.name.clone())
             } else {
@@ -1870,14 +1924,6 @@ pub fn build_duplicate_types_report(
             if allowed_pairs.contains(&pair_key) {
                 continue;
             }
-            let set1: HashSet<_> = t1.fields.iter().collect();
-            let set2: HashSet<_> = t2.fields.iter().collect();
-            let common: Vec<String> = set1.intersection(&set2).map(|s| (*s).clone()).collect();
-            if common.len() < 3 {
-                continue;
-            }
-            let weighted_common: f64 = common.iter().map(|f| idf(f)).sum();
-            let weighted_union: f64 = set1.union(&set2).map(|f| idf(f.as_str())).sum();
             let overlap_percent = if weighted_union > 0.0 {
                 (weighted_common / weighted_union * 100.0) as usize
             } else {
@@ -1888,7 +1934,10 @@ pub fn build_duplicate_types_report(
                     type1: t1.clone(),
                     type2: t2.clone(),
                     overlap_percent,
-                    common_fields: common,
+                    common_fields: common_ids
+                        .iter()
+                        .map(|&f| field_names[f as usize].to_string())
+                        .collect(),
                 });
             }
         }
@@ -9,7 +9,7 @@
 
 use crate::{
     MINHASH_N, UnionFind, compute_minhash, find_function_node, flatten_symbols, jaccard_estimate,
-    lsh_candidate_pairs, serialize_subtree_tokens,
+    lsh_candidate_pairs, serialize_subtree_tokens, walk_preorder,
 };
 use normalize_facts::Extractor;
 use normalize_languages::{parsers, support_for_path};
@@ -211,27 +211,25 @@ pub fn analyze_fragments(
                             if tokens.len() < 3 {
                                 continue;
                             }
-                            let mut kind_counts = HashMap::new();
-                            collect_node_kinds(&node, &mut kind_counts);
-                            let mut kv: Vec<_> = kind_counts.into_iter().collect();
-                            kv.sort_by_key(|b| std::cmp::Reverse(b.1));
-
                             fragments.push(Fragment {
                                 file: rel_path.clone(),
                                 start_line: sym.start_line,
                                 end_line: sym.end_line,
                                 symbol: Some(sym.name.clone()),
                                 node_kind: node.kind().to_string(),
-                                kind_counts: kv,
+                                kind_counts: node_kind_counts(&node),
                                 tokens,
                             });
                         }
                     }
                 }
                 FragmentScope::Blocks => {
+                    let mut sizes = HashMap::new();
+                    subtree_sizes(&tree.root_node(), &mut sizes);
                     walk_blocks(
                         &tree.root_node(),
                         content.as_bytes(),
+                        &sizes,
                         min_nodes,
                         skeleton,
                         &rel_path,
@@ -240,9 +238,12 @@ pub fn analyze_fragments(
                     );
                 }
                 FragmentScope::All => {
+                    let mut sizes = HashMap::new();
+                    subtree_sizes(&tree.root_node(), &mut sizes);
                     walk_all_subtrees(
                         &tree.root_node(),
                         content.as_bytes(),
+                        &sizes,
                         min_nodes,
                         skeleton,
                         &rel_path,
@@ -328,36 +329,66 @@ pub fn analyze_fragments(
 
 /// Count total descendants of a node.
 fn count_descendants(node: &tree_sitter::Node) -> usize {
-    let mut count = 1;
-    let mut cursor = node.walk();
-    if cursor.goto_first_child() {
-        loop {
-            count += count_descendants(&cursor.node());
-            if !cursor.goto_next_sibling() {
-                break;
-            }
-        }
-    }
+    let mut count = 0;
+    walk_preorder(node, |_| {
+        count += 1;
+        true
+    });
     count
 }
 
-/// Collect node kind frequency counts from a subtree.
-fn collect_node_kinds(node: &tree_sitter::Node, counts: &mut HashMap<String, usize>) {
-    let kind = node.kind();
-    if node.child_count() > 0 {
-        *counts.entry(kind.to_string()).or_default() += 1;
-    }
+/// Record the descendant count (as returned by [`count_descendants`]) of every
+/// node under `node`, keyed by `Node::id`, in a single post-order pass.
+///
+/// The subtree walkers consult this instead of calling `count_descendants` at
+/// each node, which re-walked every subtree once per ancestor.
+fn subtree_sizes(node: &tree_sitter::Node, sizes: &mut HashMap<usize, usize>) {
     let mut cursor = node.walk();
-    if cursor.goto_first_child() {
+    // Running count for each node on the cursor's current path, root first.
+    let mut open: Vec<usize> = vec![1];
+    loop {
+        if cursor.goto_first_child() {
+            open.push(1);
+            continue;
+        }
+        // The current node is finished; close it (and any ancestors whose last
+        // child it was) until there is a sibling to move on to.
         loop {
-            collect_node_kinds(&cursor.node(), counts);
-            if !cursor.goto_next_sibling() {
+            let Some(count) = open.pop() else {
+                return;
+            };
+            sizes.insert(cursor.node().id(), count);
+            let Some(parent) = open.last_mut() else {
+                return;
+            };
+            *parent += count;
+            if cursor.goto_next_sibling() {
+                open.push(1);
                 break;
             }
+            cursor.goto_parent();
         }
     }
 }
 
+/// Node kind frequency counts (of nodes with children) in a subtree, most
+/// frequent first.
+fn node_kind_counts(node: &tree_sitter::Node) -> Vec<(String, usize)> {
+    let mut counts: HashMap<&'static str, usize> = HashMap::new();
+    walk_preorder(node, |n| {
+        if n.child_count() > 0 {
+            *counts.entry(n.kind()).or_default() += 1;
+        }
+        true
+    });
+    let mut kv: Vec<_> = counts
+        .into_iter()
+        .map(|(kind, count)| (kind.to_string(), count))
+        .collect();
+    kv.sort_by_key(|b| std::cmp::Reverse(b.1));
+    kv
+}
+
 /// Check if a block-level node kind is interesting (if/loop/match/etc.).
 fn is_block_kind(kind: &str) -> bool {
     kind.contains("if")
@@ -372,31 +403,29 @@ fn is_block_kind(kind: &str) -> bool {
 }
 
 /// Walk tree collecting block-level fragments.
+#[allow(clippy::too_many_arguments)]
 fn walk_blocks(
     node: &tree_sitter::Node,
     content: &[u8],
+    sizes: &HashMap<usize, usize>,
     min_nodes: usize,
     skeleton: bool,
     rel_path: &str,
     syms: &[&normalize_languages::Symbol],
     out: &mut Vec<Fragment>,
 ) {
-    if is_block_kind(node.kind()) && count_descendants(node) >= min_nodes {
+    if is_block_kind(node.kind()) && sizes.get(&node.id()).copied().unwrap_or(0) >= min_nodes {
         let mut tokens = Vec::new();
         serialize_subtree_tokens(node, content, true, true, skeleton, &mut tokens);
         if tokens.len() >= 3 {
             let enclosing = find_enclosing_symbol(node, syms);
-            let mut kind_counts = HashMap::new();
-            collect_node_kinds(node, &mut kind_counts);
-            let mut kv: Vec<_> = kind_counts.into_iter().collect();
-            kv.sort_by_key(|b| std::cmp::Reverse(b.1));
             out.push(Fragment {
                 file: rel_path.to_string(),
                 start_line: node.start_position().row + 1,
                 end_line: node.end_position().row + 1,
                 symbol: enclosing,
                 node_kind: node.kind().to_string(),
-                kind_counts: kv,
+                kind_counts: node_kind_counts(node),
                 tokens,
             });
         }
@@ -408,6 +437,7 @@ fn walk_blocks(
             walk_blocks(
                 &cursor.node(),
                 content,
+                sizes,
                 min_nodes,
                 skeleton,
                 rel_path,
@@ -422,31 +452,29 @@ fn walk_blocks(
 }
 
 /// Walk tree collecting all subtrees ≥ min_nodes.
+#[allow(clippy::too_many_arguments)]
 fn walk_all_subtrees(
     node: &tree_sitter::Node,
     content: &[u8],
+    sizes: &HashMap<usize, usize>,
     min_nodes: usize,
     skeleton: bool,
     rel_path: &str,
     syms: &[&normalize_languages::Symbol],
     out: &mut Vec<Fragment>,
 ) {
-    if node.child_count() > 0 && count_descendants(node) >= min_nodes {
+    if node.child_count() > 0 && sizes.get(&node.id()).copied().unwrap_or(0) >= min_nodes {
         let mut tokens = Vec::new();
         serialize_subtree_tokens(node, content, true, true, skeleton, &mut tokens);
         if tokens.len() >= 3 {
             let enclosing = find_enclosing_symbol(node, syms);
-            let mut kind_counts = HashMap::new();
-            collect_node_kinds(node, &mut kind_counts);
-            let mut kv: Vec<_> = kind_counts.into_iter().collect();
-            kv.sort_by_key(|b| std::cmp::Reverse(b.1));
             out.push(Fragment {
                 file: rel_path.to_string(),
                 start_line: node.start_position().row + 1,
                 end_line: node.end_position().row + 1,
                 symbol: enclosing,
                 node_kind: node.kind().to_string(),
-                kind_counts: kv,
+                kind_counts: node_kind_counts(node),
                 tokens,
             });
         }
@@ -457,6 +485,7 @@ fn walk_all_subtrees(
             walk_all_subtrees(
                 &cursor.node(),
                 content,
+                sizes,
                 min_nodes,
                 skeleton,
                 rel_path,
@@ -261,7 +261,79 @@ pub fn compute_function_hash(
     hasher.finish()
 }
 
-/// Recursively hash a node and its children.
+/// Visit `node` and its descendants in pre-order with a single tree cursor.
+/// Returning `false` from `visit` skips that node's children.
+///
+/// The hashing, serialization and fragment walks run over every node of every
+/// function in a repository; one cursor avoids a recursive call and a fresh
+/// cursor allocation per node, and deeply nested trees (long operator chains,
+/// generated code) can't overflow the rayon worker's stack.
+pub(crate) fn walk_preorder<'tree>(
+    node: &tree_sitter::Node<'tree>,
+    mut visit: impl FnMut(tree_sitter::Node<'tree>) -> bool,
+) {
+    let mut cursor = node.walk();
+    let mut depth = 0usize;
+    loop {
+        if visit(cursor.node()) && cursor.goto_first_child() {
+            depth += 1;
+            continue;
+        }
+        loop {
+            if depth == 0 {
+                return;
+            }
+            if cursor.goto_next_sibling() {
+                break;
+            }
+            cursor.goto_parent();
+            depth -= 1;
+        }
+    }
+}
+
+/// How a leaf node's text participates in a hash.
+#[derive(Clone, Copy, PartialEq, Eq, Debug)]
+enum LeafClass {
+    Identifier,
+    Literal,
+    /// Operators, keywords — their kind is sufficient.
+    Other,
+}
+
+fn classify_leaf_kind(kind: &str) -> LeafClass {
+    if is_identifier_kind(kind) {
+        LeafClass::Identifier
+    } else if is_literal_kind(kind) {
+        LeafClass::Literal
+    } else {
+        LeafClass::Other
+    }
+}
+
+/// Leaf classifications memoized by `kind_id`.
+///
+/// A grammar has only a few hundred node kinds, but a function body has
+/// thousands of leaves; each distinct kind pays for the substring checks in
+/// `is_identifier_kind`/`is_literal_kind` once per walk instead of per leaf.
+struct LeafKindMemo(Vec<Option<LeafClass>>);
+
+impl LeafKindMemo {
+    /// A memo sized to the grammar of `node`.
+    fn for_node(node: &tree_sitter::Node) -> Self {
+        Self(vec![None; node.language().node_kind_count()])
+    }
+
+    fn classify(&mut self, node: &tree_sitter::Node) -> LeafClass {
+        match self.0.get_mut(node.kind_id() as usize) {
+            Some(slot) => *slot.get_or_insert_with(|| classify_leaf_kind(node.kind())),
+            // ERROR/MISSING nodes use ids outside the symbol table; classify those by name.
+            None => classify_leaf_kind(node.kind()),
+        }
+    }
+}
+
+/// Hash a node and all of its descendants, in pre-order.
 pub fn hash_node_recursive(
     node: &tree_sitter::Node,
     content: &[u8],
@@ -269,36 +341,31 @@ pub fn hash_node_recursive(
     elide_identifiers: bool,
     elide_literals: bool,
 ) {
-    let kind = node.kind();
-
-    // Hash the node kind (structure)
-    kind.hash(hasher);
-
-    // For leaf nodes, decide whether to hash content
-    if node.child_count() == 0 {
-        let should_hash = if is_identifier_kind(kind) {
-            !elide_identifiers
-        } else if is_literal_kind(kind) {
-            !elide_literals
-        } else {
-            // Operators, keywords — their kind is sufficient
-            false
-        };
-
-        if should_hash {
-            let (start, end) = (node.start_byte(), node.end_byte());
-            if start <= end && end <= content.len() {
-                let text = &content[start..end];
-                text.hash(hasher);
+    let mut memo = LeafKindMemo::for_node(node);
+    walk_preorder(node, |node| {
+        let kind = node.kind();
+
+        // Hash the node kind (structure)
+        kind.hash(hasher);
+
+        // For leaf nodes, decide whether to hash content
+        if node.child_count() == 0 {
+            let should_hash = match memo.classify(&node) {
+                LeafClass::Identifier => !elide_identifiers,
+                LeafClass::Literal => !elide_literals,
+                LeafClass::Other => false,
+            };
+
+            if should_hash {
+                let (start, end) = (node.start_byte(), node.end_byte());
+                if start <= end && end <= content.len() {
+                    let text = &content[start..end];
+                    text.hash(hasher);
+                }
             }
         }
-    }
-
-    // Recurse into children
-    let mut cursor = node.walk();
-    for child in node.children(&mut cursor) {
-        hash_node_recursive(&child, content, hasher, elide_identifiers, elide_literals);
-    }
+        true
+    });
 }
 
 // ── Identifier / literal classification ──────────────────────────────────────
@@ -363,48 +430,67 @@ pub fn serialize_subtree_tokens(
     elide_literals: bool,
     skeleton: bool,
     out: &mut Vec<u64>,
+) {
+    // Dispatch on the flags once per subtree rather than once per node: each
+    // arm is a copy of the walk specialized for its flags, so the per-node
+    // checks fold away (and with both elisions on, so does leaf classification).
+    match (elide_identifiers, elide_literals, skeleton) {
+        (true, true, true) => serialize_tokens::<true, true, true>(node, content, out),
+        (true, true, false) => serialize_tokens::<true, true, false>(node, content, out),
+        (true, false, true) => serialize_tokens::<true, false, true>(node, content, out),
+        (true, false, false) => serialize_tokens::<true, false, false>(node, content, out),
+        (false, true, true) => serialize_tokens::<false, true, true>(node, content, out),
+        (false, true, false) => serialize_tokens::<false, true, false>(node, content, out),
+        (false, false, true) => serialize_tokens::<false, false, true>(node, content, out),
+        (false, false, false) => serialize_tokens::<false, false, false>(node, content, out),
+    }
+}
+
+fn serialize_tokens<
+    const ELIDE_IDENTIFIERS: bool,
+    const ELIDE_LITERALS: bool,
+    const SKELETON: bool,
+>(
+    node: &tree_sitter::Node,
+    content: &[u8],
+    out: &mut Vec<u64>,
 ) {
     use std::collections::hash_map::DefaultHasher;
-    let kind = node.kind();
+    let mut memo = LeafKindMemo::for_node(node);
+    walk_preorder(node, |node| {
+        let kind = node.kind();
+        let is_leaf = node.child_count() == 0;
+
+        // In skeleton mode, replace body/block subtrees with a fixed placeholder.
+        if SKELETON && !is_leaf && is_body_kind(kind) {
+            out.push(BODY_PLACEHOLDER);
+            return false;
+        }
 
-    // In skeleton mode, replace body/block subtrees with a fixed placeholder.
-    if skeleton && node.child_count() > 0 && is_body_kind(kind) {
-        out.push(BODY_PLACEHOLDER);
-        return;
-    }
+        let mut h = DefaultHasher::new();
+        kind.hash(&mut h);
 
-    let mut h = DefaultHasher::new();
-    kind.hash(&mut h);
-
-    if node.child_count() == 0 {
-        let should_include = if is_identifier_kind(kind) {
-            !elide_identifiers
-        } else if is_literal_kind(kind) {
-            !elide_literals
-        } else {
-            false
-        };
-        if should_include {
-            let (start, end) = (node.start_byte(), node.end_byte());
-            if start <= end && end <= content.len() {
-                let text = &content[start..end];
-                text.hash(&mut h);
+        if is_leaf {
+            let should_include = if ELIDE_IDENTIFIERS && ELIDE_LITERALS {
+                false
+            } else {
+                match memo.classify(&node) {
+                    LeafClass::Identifier => !ELIDE_IDENTIFIERS,
+                    LeafClass::Literal => !ELIDE_LITERALS,
+                    LeafClass::Other => false,
+                }
+            };
+            if should_include {
+                let (start, end) = (node.start_byte(), node.end_byte());
+                if start <= end && end <= content.len() {
+                    let text = &content[start..end];
+                    text.hash(&mut h);
+                }
             }
         }
-    }
-    out.push(h.finish());
-
-    let mut cursor = node.walk();
-    for child in node.children(&mut cursor) {
-        serialize_subtree_tokens(
-            &child,
-            content,
-            elide_identifiers,
-            elide_literals,
-            skeleton,
-            out,
-        );
-    }
+        out.push(h.finish());
+        true
+    });
 }
 
 // ── Structural token extraction (for pattern analysis) ────────────────────────
@@ -416,26 +502,19 @@ pub fn serialize_structural_tokens(
     structural_kinds: &HashSet<&str>,
     out: &mut Vec<u64>,
 ) {
-    let kind = node.kind();
-
-    let is_structural =
-        structural_kinds.contains(kind) || kind.contains("call") || kind.contains("assignment");
+    walk_preorder(node, |node| {
+        let kind = node.kind();
 
-    if is_structural {
-        let mut h = std::collections::hash_map::DefaultHasher::new();
-        kind.hash(&mut h);
-        out.push(h.finish());
-    }
+        let is_structural =
+            structural_kinds.contains(kind) || kind.contains("call") || kind.contains("assignment");
 
-    let mut cursor = node.walk();
-    if cursor.goto_first_child() {
-        loop {
-            serialize_structural_tokens(&cursor.node(), structural_kinds, out);
-            if !cursor.goto_next_sibling() {
-                break;
-            }
+        if is_structural {
+            let mut h = std::collections::hash_map::DefaultHasher::new();
+            kind.hash(&mut h);
+            out.push(h.finish());
         }
-    }
+        true
+    });
 }
 
 /// Collect structural node kind counts from an AST subtree.
@@ -444,19 +523,13 @@ pub fn collect_structural_kinds(
     structural_kinds: &HashSet<&str>,
     counts: &mut HashMap<String, usize>,
 ) {
-    let kind = node.kind();
-    if structural_kinds.contains(kind) || kind.contains("call") || kind.contains("assignment") {
-        *counts.entry(kind.to_string()).or_default() += 1;
-    }
-    let mut cursor = node.walk();
-    if cursor.goto_first_child() {
-        loop {
-            collect_structural_kinds(&cursor.node(), structural_kinds, counts);
-            if !cursor.goto_next_sibling() {
-                break;
-            }
+    walk_preorder(node, |node| {
+        let kind = node.kind();
+        if structural_kinds.contains(kind) || kind.contains("call") || kind.contains("assignment") {
+            *counts.entry(kind.to_string()).or_default() += 1;
         }
-    }
+        true
+    });
 }
 
 // ── Pattern classification ────────────────────────────────────────────────────
@@ -620,6 +693,18 @@ mod tests {
         [seed; MINHASH_N]
     }
 
+    #[test]
+    fn classify_leaf_kind_prefers_identifier_over_literal() {
+        assert_eq!(classify_leaf_kind("identifier"), LeafClass::Identifier);
+        assert_eq!(
+            classify_leaf_kind("string_identifier"),
+            LeafClass::Identifier
+        );
+        assert_eq!(classify_leaf_kind("string_content"), LeafClass::Literal);
+        assert_eq!(classify_leaf_kind("true"), LeafClass::Literal);
+        assert_eq!(classify_leaf_kind("+"), LeafClass::Other);
+    }
+
     #[test]
     fn lsh_candidate_pairs_finds_identical_signatures() {
         // Three identical signatures + one distinct one.
@@ -34,7 +34,10 @@
 
 use normalize_rules_config::WalkConfig;
 use serde::de::DeserializeOwned;
+use std::collections::HashMap;
 use std::path::{Path, PathBuf};
+use std::sync::{Arc, Mutex, OnceLock};
+use std::time::SystemTime;
 
 /// Ordered list of `config.toml` paths that **exist**, global (XDG) first then
 /// project (`<root>/.normalize/config.toml`).
@@ -55,6 +58,82 @@ pub fn config_paths(root: &Path) -> Vec<PathBuf> {
         .collect()
 }
 
+/// A config file's text, with its TOML parse deferred until a section the file
+/// actually mentions is requested.
+struct ConfigFile {
+    content: String,
+    table: OnceLock<Option<toml::Table>>,
+}
+
+impl ConfigFile {
+    /// The raw `[section]` value, if the file declares it.
+    ///
+    /// Any TOML spelling of the section (`[section]`, `[section.x]`,
+    /// `section.x = ...`) contains its name, so files that don't mention it
+    /// skip the parse entirely. Unparseable files declare nothing.
+    fn section(&self, section: &str) -> Option<&toml::Value> {
+        if !self.content.contains(section) {
+            return None;
+        }
+        self.table
+            .get_or_init(|| self.content.parse().ok())
+            .as_ref()?
+            .get(section)
+    }
+}
+
+/// Read `path`, reusing the previous read (and parse, once one has happened)
+/// while the file's `(mtime, size)` is unchanged.
+///
+/// Verb services each build their own [`ConfigSlices`] (and `[aliases]` is
+/// loaded hierarchically from several places) for the same files within one
+/// process, so repeated loads cost a `stat` per file instead of a read and a
+/// full TOML parse. Returns `None` when the file can't be read.
+fn cached_config(path: &Path) -> Option<Arc<ConfigFile>> {
+    type Stamp = (SystemTime, u64);
+    static CACHE: OnceLock<Mutex<HashMap<PathBuf, (Stamp, Option<Arc<ConfigFile>>)>>> =
+        OnceLock::new();
+    let cache = CACHE.get_or_init(Default::default);
+
+    let stamp = std::fs::metadata(path)
+        .ok()
+        .and_then(|m| Some((m.modified().ok()?, m.len())));
+    if let Some(stamp) = stamp
+        && let Some((cached_stamp, file)) =
+            cache.lock().unwrap_or_else(|e| e.into_inner()).get(path)
+        && *cached_stamp == stamp
+    {
+        return file.clone();
+    }
+
+    let file = std::fs::read_to_string(path).ok().map(|content| {
+        Arc::new(ConfigFile {
+            content,
+            table: OnceLock::new(),
+        })
+    });
+    if let Some(stamp) = stamp {
+        cache
+            .lock()
+            .unwrap_or_else(|e| e.into_inner())
+            .insert(path.to_path_buf(), (stamp, file.clone()));
+    }
+    file
+}
+
+/// Deserialize `section` from the last of `files` that declares it usably.
+///
+/// Sections replace each other whole, so only the innermost usable declaration
+/// matters: searching from the end clones just that one section out of the
+/// shared cached table rather than every file's copy.
+fn last_section<T: DeserializeOwned + Default>(files: &[Arc<ConfigFile>], section: &str) -> T {
+    files
+        .iter()
+        .rev()
+        .find_map(|file| file.section(section)?.clone().try_into::<T>().ok())
+        .unwrap_or_default()
+}
+
 /// Config sections read from the global then project `config.toml`, with
 /// per-section last-wins precedence (project overrides global), matching the
 /// main crate's `NormalizeConfig::load`.
@@ -63,10 +142,10 @@ pub fn config_paths(root: &Path) -> Vec<PathBuf> {
 /// and parsed a single time regardless of how many slices the caller extracts.
 #[derive(Default)]
 pub struct ConfigSlices {
-    /// Parsed tables in precedence order: global first, then project. Only
-    /// files that existed *and* parsed as TOML are retained (unparseable files
-    /// are skipped tolerantly, as the per-crate loaders this replaces did).
-    tables: Vec<toml::Table>,
+    /// Config files in precedence order: global first, then project. Only
+    /// files that exist are retained; unparseable files declare no sections
+    /// (skipped tolerantly, as the per-crate loaders this replaces did).
+    files: Vec<Arc<ConfigFile>>,
 }
 
 impl ConfigSlices {
@@ -74,15 +153,11 @@ impl ConfigSlices {
     /// and parses. Missing or malformed files are skipped (tolerant), never an
     /// error — a command with no config gets `T::default()` slices.
     pub fn load(root: &Path) -> Self {
-        let mut tables = Vec::new();
-        for path in config_paths(root) {
-            if let Ok(content) = std::fs::read_to_string(&path)
-                && let Ok(table) = content.parse::<toml::Table>()
-            {
-                tables.push(table);
-            }
-        }
-        Self { tables }
+        let files = config_paths(root)
+            .iter()
+            .filter_map(|path| cached_config(path))
+            .collect();
+        Self { files }
     }
 
     /// Deserialize one config `[section]` with per-section last-wins precedence.
@@ -94,15 +169,7 @@ impl ConfigSlices {
     /// the whole section is replaced (not merged field-by-field), this matches
     /// server-less's `#[param(nested, serde)]` semantics used by the main crate.
     pub fn slice<T: DeserializeOwned + Default>(&self, section: &str) -> T {
-        let mut value = T::default();
-        for table in &self.tables {
-            if let Some(sub) = table.get(section)
-                && let Ok(parsed) = sub.clone().try_into::<T>()
-            {
-                value = parsed;
-            }
-        }
-        value
+        last_section(&self.files, section)
     }
 
     /// The `[walk]` slice with the daemon baseline applied.
@@ -172,18 +239,11 @@ pub fn ancestor_config_paths(start: &Path) -> Vec<PathBuf> {
 ///
 /// Returns `T::default()` when no file declares the section.
 pub fn load_section_hierarchical<T: DeserializeOwned + Default>(start: &Path, section: &str) -> T {
-    let paths = ancestor_config_paths(start);
-    let mut value = T::default();
-    for path in paths {
-        if let Ok(content) = std::fs::read_to_string(&path)
-            && let Ok(table) = content.parse::<toml::Table>()
-            && let Some(sub) = table.get(section)
-            && let Ok(parsed) = sub.clone().try_into::<T>()
-        {
-            value = parsed;
-        }
-    }
-    value
+    let files: Vec<Arc<ConfigFile>> = ancestor_config_paths(start)
+        .iter()
+        .filter_map(|path| cached_config(path))
+        .collect();
+    last_section(&files, section)
 }
 
 #[cfg(test)]
@@ -271,6 +331,24 @@ mod tests {
         );
     }
 
+    #[test]
+    fn reparses_after_file_changes() {
+        let xdg = TempDir::new().unwrap();
+        let root = TempDir::new().unwrap();
+        let project = root.path().join(".normalize").join("config.toml");
+        write(&project, "[demo]\nname = \"a\"\n");
+        let first: DemoSlice =
+            with_global(xdg.path(), || ConfigSlices::load(root.path()).slice("demo"));
+        assert_eq!(first.name, "a");
+
+        // Different size, so the cached parse is invalidated even when the
+        // mtime hasn't ticked.
+        write(&project, "[demo]\nname = \"bb\"\n");
+        let second: DemoSlice =
+            with_global(xdg.path(), || ConfigSlices::load(root.path()).slice("demo"));
+        assert_eq!(second.name, "bb");
+    }
+
     #[test]
     fn default_when_absent_and_walk_baseline() {
         let xdg = TempDir::new().unwrap();
@@ -10,6 +10,27 @@ use std::process::Command;
 
 pub struct Cargo;
 
+/// The parts of `Cargo.lock` we read.
+///
+/// Deserializing into these instead of a generic `toml::Value` skips `source`,
+/// `checksum` and the rest while parsing, so large lockfiles never hold a full
+/// value tree in memory.
+#[derive(serde::Deserialize)]
+struct CargoLock {
+    #[serde(default)]
+    package: Vec<LockedPackage>,
+}
+
+#[derive(serde::Deserialize)]
+struct LockedPackage {
+    #[serde(default)]
+    name: String,
+    #[serde(default)]
+    version: String,
+    #[serde(default)]
+    dependencies: Vec<String>,
+}
+
 impl Ecosystem for Cargo {
     fn name(&self) -> &'static str {
         "cargo"
@@ -37,16 +58,13 @@ impl Ecosystem for Cargo {
     fn installed_version(&self, package: &str, project_root: &Path) -> Option<String> {
         let lockfile = project_root.join("Cargo.lock");
         let content = std::fs::read_to_string(lockfile).ok()?;
-        let parsed: toml::Value = toml::from_str(&content).ok()?;
+        let parsed: CargoLock = toml::from_str(&content).ok()?;
 
         parsed
-            .get("package")?
-            .as_array()?
-            .iter()
-            .find(|pkg| pkg.get("name").and_then(|n| n.as_str()) == Some(package))
-            .and_then(|pkg| pkg.get("version"))
-            .and_then(|v| v.as_str())
-            .map(String::from)
+            .package
+            .into_iter()
+            .find(|pkg| pkg.name == package)
+            .map(|pkg| pkg.version)
     }
 
     fn list_dependencies(&self, project_root: &Path) -> Result<Vec<Dependency>, PackageError> {
@@ -87,8 +105,9 @@ impl Ecosystem for Cargo {
         let (lockfile, workspace_root) = find_cargo_lock(project_root)?;
         let content = std::fs::read_to_string(&lockfile)
             .map_err(|e| PackageError::ParseError(format!("failed to read Cargo.lock: {}", e)))?;
-        let parsed: toml::Value = toml::from_str(&content)
+        let parsed: CargoLock = toml::from_str(&content)
             .map_err(|e| PackageError::ParseError(format!("invalid TOML: {}", e)))?;
+        drop(content);
 
         // Get root package name(s) from Cargo.toml
         let manifest = project_root.join("Cargo.toml");
@@ -134,22 +153,13 @@ impl Ecosystem for Cargo {
         // Build package map: name -> (version, dependencies)
         let mut packages: std::collections::HashMap<String, (String, Vec<String>)> =
             std::collections::HashMap::new();
-        if let Some(pkgs) = parsed.get("package").and_then(|p| p.as_array()) {
-            for pkg in pkgs {
-                let name = pkg.get("name").and_then(|n| n.as_str()).unwrap_or("");
-                let version = pkg.get("version").and_then(|v| v.as_str()).unwrap_or("");
-                let deps: Vec<String> = pkg
-                    .get("dependencies")
-                    .and_then(|d| d.as_array())
-                    .map(|arr| {
-                        arr.iter()
-                            .filter_map(|d| d.as_str())
-                            .map(|s| s.split_whitespace().next().unwrap_or(s).to_string())
-                            .collect()
-                    })
-                    .unwrap_or_default();
-                packages.insert(name.to_string(), (version.to_string(), deps));
-            }
+        for pkg in parsed.package {
+            let deps: Vec<String> = pkg
+                .dependencies
+                .iter()
+                .map(|s| s.split_whitespace().next().unwrap_or(s).to_string())
+                .collect();
+            packages.insert(pkg.name, (pkg.version, deps));
         }
 
         // Build tree structure
@@ -555,4 +565,35 @@ mod tests {
         assert_eq!(eco.name(), "cargo");
         assert_eq!(eco.manifest_files(), &["Cargo.toml"]);
     }
+
+    #[test]
+    fn test_installed_version_from_lockfile() {
+        let dir = tempfile::tempdir().unwrap();
+        std::fs::write(
+            dir.path().join("Cargo.lock"),
+            r#"version = 4
+
+[[package]]
+name = "serde"
+version = "1.0.226"
+source = "registry+https://github.com/rust-lang/crates.io-index"
+checksum = "0000"
+dependencies = [
+ "serde_core",
+]
+
+[[package]]
+name = "serde_core"
+version = "1.0.226"
+"#,
+        )
+        .unwrap();
+
+        let eco = Cargo;
+        assert_eq!(
+            eco.installed_version("serde", dir.path()).as_deref(),
+            Some("1.0.226")
+        );
+        assert_eq!(eco.installed_version("missing", dir.path()), None);
+    }
 }
@@ -9,6 +9,40 @@ use std::process::Command;
 
 pub struct Python;
 
+/// The parts of `uv.lock` / `poetry.lock` we read.
+///
+/// uv.lock in particular carries per-platform wheel lists with hashes for every
+/// package; deserializing into these structs lets serde skip them during parsing
+/// instead of building a `toml::Value` tree for the whole file.
+#[derive(serde::Deserialize)]
+struct PythonLock {
+    #[serde(default)]
+    package: Vec<PythonLockedPackage>,
+}
+
+#[derive(serde::Deserialize)]
+struct PythonLockedPackage {
+    #[serde(default)]
+    name: String,
+    #[serde(default)]
+    version: String,
+    /// uv: array of `{ name = ... }` tables; poetry: a `name -> spec` table.
+    #[serde(default)]
+    dependencies: Option<toml::Value>,
+}
+
+impl PythonLock {
+    fn find_version(&self, normalized: &str) -> Option<String> {
+        self.package
+            .iter()
+            .find(|pkg| {
+                !pkg.version.is_empty()
+                    && pkg.name.to_lowercase().replace(['-', '.'], "_") == normalized
+            })
+            .map(|pkg| pkg.version.clone())
+    }
+}
+
 impl Ecosystem for Python {
     fn name(&self) -> &'static str {
         "python"
@@ -54,35 +88,19 @@ impl Ecosystem for Python {
         // Try uv.lock (TOML format)
         let uv_lock = project_root.join("uv.lock");
         if let Ok(content) = std::fs::read_to_string(&uv_lock)
-            && let Ok(parsed) = toml::from_str::<toml::Value>(&content)
-            && let Some(packages) = parsed.get("package").and_then(|p| p.as_array())
+            && let Ok(parsed) = toml::from_str::<PythonLock>(&content)
+            && let Some(v) = parsed.find_version(&normalized)
         {
-            for pkg in packages {
-                let name = pkg.get("name").and_then(|n| n.as_str()).unwrap_or("");
-                let name_normalized = name.to_lowercase().replace(['-', '.'], "_");
-                if name_normalized == normalized
-                    && let Some(v) = pkg.get("version").and_then(|v| v.as_str())
-                {
-                    return Some(v.to_string());
-                }
-            }
+            return Some(v);
         }
 
         // Try poetry.lock (TOML format)
         let poetry_lock = project_root.join("poetry.lock");
         if let Ok(content) = std::fs::read_to_string(&poetry_lock)
-            && let Ok(parsed) = toml::from_str::<toml::Value>(&content)
-            && let Some(packages) = parsed.get("package").and_then(|p| p.as_array())
+            && let Ok(parsed) = toml::from_str::<PythonLock>(&content)
+            && let Some(v) = parsed.find_version(&normalized)
         {
-            for pkg in packages {
-                let name = pkg.get("name").and_then(|n| n.as_str()).unwrap_or("");
-                let name_normalized = name.to_lowercase().replace(['-', '.'], "_");
-                if name_normalized == normalized
-                    && let Some(v) = pkg.get("version").and_then(|v| v.as_str())
-                {
-                    return Some(v.to_string());
-                }
-            }
+            return Some(v);
         }
 
         // Try Pipfile.lock (JSON format)
@@ -195,7 +213,7 @@ impl Ecosystem for Python {
         // Try uv.lock first (TOML with package entries and dependencies)
         let uv_lock = project_root.join("uv.lock");
         if let Ok(content) = std::fs::read_to_string(&uv_lock)
-            && let Ok(parsed) = toml::from_str::<toml::Value>(&content)
+            && let Ok(parsed) = toml::from_str::<PythonLock>(&content)
         {
             return build_python_tree(&parsed, project_root);
         }
@@ -203,7 +221,7 @@ impl Ecosystem for Python {
         // Try poetry.lock
         let poetry_lock = project_root.join("poetry.lock");
         if let Ok(content) = std::fs::read_to_string(&poetry_lock)
-            && let Ok(parsed) = toml::from_str::<toml::Value>(&content)
+            && let Ok(parsed) = toml::from_str::<PythonLock>(&content)
         {
             return build_python_tree(&parsed, project_root);
         }
@@ -338,7 +356,7 @@ impl Ecosystem for Python {
 }
 
 fn build_python_tree(
-    parsed: &toml::Value,
+    parsed: &PythonLock,
     project_root: &Path,
 ) -> Result<DependencyTree, PackageError> {
     // Get project name from pyproject.toml
@@ -369,24 +387,21 @@ fn build_python_tree(
     let mut packages: std::collections::HashMap<String, (String, Vec<String>)> =
         std::collections::HashMap::new();
 
-    if let Some(pkgs) = parsed.get("package").and_then(|p| p.as_array()) {
-        for pkg in pkgs {
-            let name = pkg.get("name").and_then(|n| n.as_str()).unwrap_or("");
-            let version = pkg.get("version").and_then(|v| v.as_str()).unwrap_or("");
-            let deps: Vec<String> = pkg
-                .get("dependencies")
-                .and_then(|d| d.as_array())
-                .map(|arr| {
-                    arr.iter()
-                        .filter_map(|d| d.get("name").and_then(|n| n.as_str()).map(String::from))
-                        .collect()
-                })
-                .unwrap_or_default();
-            packages.insert(
-                name.to_lowercase().replace(['-', '.'], "_"),
-                (version.to_string(), deps),
-            );
-        }
+    for pkg in &parsed.package {
+        let deps: Vec<String> = pkg
+            .dependencies
+            .as_ref()
+            .and_then(|d| d.as_array())
+            .map(|arr| {
+                arr.iter()
+                    .filter_map(|d| d.get("name").and_then(|n| n.as_str()).map(String::from))
+                    .collect()
+            })
+            .unwrap_or_default();
+        packages.insert(
+            pkg.name.to_lowercase().replace(['-', '.'], "_"),
+            (pkg.version.clone(), deps),
+        );
     }
 
     fn build_node(
@@ -417,15 +432,12 @@ fn build_python_tree(
     let mut visited = std::collections::HashSet::new();
     let mut root_deps = Vec::new();
 
-    if let Some(pkgs) = parsed.get("package").and_then(|p| p.as_array()) {
-        for pkg in pkgs {
-            let name = pkg.get("name").and_then(|n| n.as_str()).unwrap_or("");
-            let normalized = name.to_lowercase().replace(['-', '.'], "_");
-            if !visited.contains(&normalized)
-                && let Some(node) = build_node(name, &packages, &mut visited)
-            {
-                root_deps.push(node);
-            }
+    for pkg in &parsed.package {
+        let normalized = pkg.name.to_lowercase().replace(['-', '.'], "_");
+        if !visited.contains(&normalized)
+            && let Some(node) = build_node(&pkg.name, &packages, &mut visited)
+        {
+            root_deps.push(node);
         }
     }
 
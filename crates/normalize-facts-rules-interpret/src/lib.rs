@@ -51,6 +51,7 @@ use ascent_interpreter::ir::Program;
 use ascent_interpreter::syntax::AscentProgram;
 use glob::Pattern;
 use normalize_facts_rules_api::{Diagnostic, DiagnosticLevel, Relations};
+use normalize_rules_config::{frontmatter_globs, frontmatter_strings};
 use rayon::prelude::*;
 use std::collections::HashMap;
 use std::hash::{DefaultHasher, Hash, Hasher};
@@ -382,8 +383,8 @@ pub fn parse_rule_content(content: &str, default_id: &str, is_builtin: bool) ->
         if text.is_empty() { None } else { Some(text) }
     };
 
-    let frontmatter: toml::Value = if frontmatter_str.is_empty() {
-        toml::Value::Table(toml::map::Map::new())
+    let frontmatter: toml::Table = if frontmatter_str.is_empty() {
+        toml::Table::new()
     } else {
         match toml::from_str(&frontmatter_str) {
             Ok(v) => v,
@@ -394,75 +395,46 @@ pub fn parse_rule_content(content: &str, default_id: &str, is_builtin: bool) ->
         }
     };
 
-    let id = frontmatter
-        .get("id")
-        .and_then(|v| v.as_str())
-        .map(|s| s.to_string())
-        .unwrap_or_else(|| default_id.to_string());
-
-    let message = frontmatter
-        .get("message")
-        .and_then(|v| v.as_str())
-        .unwrap_or("Datalog rule")
-        .to_string();
-
-    let allow: Vec<Pattern> = frontmatter
-        .get("allow")
-        .and_then(|v| v.as_array())
-        .map(|arr| {
-            arr.iter()
-                .filter_map(|v| v.as_str())
-                .filter_map(|s| Pattern::new(s).ok())
-                .collect()
-        })
-        .unwrap_or_default();
-
-    let severity = if let Some(sev_str) = frontmatter.get("severity").and_then(|v| v.as_str()) {
-        sev_str.parse::<Severity>().unwrap_or(Severity::Warning)
-    } else if frontmatter
-        .get("deny")
-        .and_then(|v| v.as_bool())
-        .unwrap_or(false)
-    {
-        Severity::Error
-    } else {
-        Severity::Warning
-    };
-
-    let enabled = frontmatter
-        .get("enabled")
-        .and_then(|v| v.as_bool())
-        .unwrap_or(true);
-
-    let tags: Vec<String> = frontmatter
-        .get("tags")
-        .and_then(|v| v.as_array())
-        .map(|arr| {
-            arr.iter()
-                .filter_map(|v| v.as_str())
-                .map(|s| s.to_string())
-                .collect()
-        })
-        .unwrap_or_default();
-
-    let recommended = frontmatter
-        .get("recommended")
-        .and_then(|v| v.as_bool())
-        .unwrap_or(false);
-
-    Some(FactsRule {
-        id,
+    let mut rule = FactsRule {
+        id: default_id.to_string(),
         source: source_str.trim().to_string(),
-        message,
-        allow,
-        severity,
-        enabled,
+        message: "Datalog rule".to_string(),
+        allow: Vec::new(),
+        severity: Severity::Warning,
+        enabled: true,
         builtin: is_builtin,
         source_path: PathBuf::new(),
-        tags,
+        tags: Vec::new(),
         doc,
-        recommended,
-    })
+        recommended: false,
+    };
+    let mut severity = None;
+    let mut deny = false;
+
+    // One pass over the keys that are present, moving values out of the table;
+    // keys with an unexpected type are ignored and keep their default.
+    for (key, value) in frontmatter {
+        match (key.as_str(), value) {
+            ("id", toml::Value::String(s)) => rule.id = s,
+            ("message", toml::Value::String(s)) => rule.message = s,
+            ("allow", toml::Value::Array(arr)) => rule.allow = frontmatter_globs(arr),
+            ("severity", toml::Value::String(s)) => severity = Some(s),
+            ("deny", toml::Value::Boolean(b)) => deny = b,
+            ("enabled", toml::Value::Boolean(b)) => rule.enabled = b,
+            ("tags", toml::Value::Array(arr)) => rule.tags = frontmatter_strings(arr),
+            ("recommended", toml::Value::Boolean(b)) => rule.recommended = b,
+            _ => {}
+        }
+    }
+
+    // An explicit severity wins over the legacy `deny = true` shorthand.
+    rule.severity = match severity {
+        Some(s) => s.parse::<Severity>().unwrap_or(Severity::Warning),
+        None if deny => Severity::Error,
+        None => Severity::Warning,
+    };
+
+    Some(rule)
 }
 
 // =============================================================================
@@ -3,7 +3,7 @@ use serde::{Serialize, de::DeserializeOwned};
 use std::collections::HashMap;
 use std::future::Future;
 use std::path::{Path, PathBuf};
-use std::sync::{Arc, OnceLock, RwLock};
+use std::sync::{Arc, Mutex, OnceLock, RwLock};
 use tokio::runtime::{Handle, Runtime};
 
 #[derive(Debug)]
@@ -49,8 +49,19 @@ struct Inner {
     /// Owned runtime — only present when we are not running inside an existing
     /// tokio runtime. If `None`, calls use `Handle::current()` + `block_in_place`.
     runtime: Option<Runtime>,
+    /// Cache hits whose `last_used` bump has not been written yet. Recency only
+    /// feeds LRU eviction, so hits are queued here and written in batches rather
+    /// than rewriting the entry's row (payload included) on every lookup. A
+    /// partial batch is written by `CaCache::flush_touched` or on drop.
+    touched: Mutex<Vec<EntryKey>>,
 }
 
+/// Primary key of a `ca_entries` row: `(hash, extr_ver, grammar)`.
+type EntryKey = (Vec<u8>, String, String);
+
+/// Number of queued hits that triggers a batched `last_used` write.
+const TOUCH_BATCH: usize = 128;
+
 impl Inner {
     fn block_on<F: Future + Send>(&self, fut: F) -> F::Output
     where
@@ -58,6 +69,26 @@ impl Inner {
     {
         block_on_helper(&self.runtime, fut)
     }
+
+    /// Write the queued `last_used` bumps (best-effort — errors are logged).
+    fn flush_touched(&self) {
+        let keys = std::mem::take(&mut *self.touched.lock().unwrap_or_else(|e| e.into_inner()));
+        if keys.is_empty() {
+            return;
+        }
+        let now = unix_now();
+        for chunk in keys.chunks(TOUCH_BATCH) {
+            if let Err(e) = self.block_on(touch_entries(&self.conn, chunk, now)) {
+                tracing::debug!("normalize-facts: CA cache touch error: {}", e);
+            }
+        }
+    }
+}
+
+impl Drop for Inner {
+    fn drop(&mut self) {
+        self.flush_touched();
+    }
 }
 
 /// Drive `fut` to completion, choosing a strategy based on the *current* thread's
@@ -153,7 +184,12 @@ impl CaCache {
         };
         let (db, conn) = block_on_helper(&runtime, init)?;
         Ok(Self {
-            inner: Arc::new(Inner { conn, db, runtime }),
+            inner: Arc::new(Inner {
+                conn,
+                db,
+                runtime,
+                touched: Mutex::new(Vec::new()),
+            }),
             max_size_bytes,
         })
     }
@@ -173,7 +209,6 @@ impl CaCache {
         extr_ver: &str,
         grammar: &str,
     ) -> Result<Option<T>, Error> {
-        let now = unix_now();
         let conn = &self.inner.conn;
         let bytes_opt: Option<Vec<u8>> = self.inner.block_on(async {
             let mut rows = conn
@@ -185,25 +220,36 @@ impl CaCache {
             let row = rows.next().await?;
             if let Some(row) = row {
                 let bytes: Vec<u8> = row.get(0)?;
-                // Touch last_used (best-effort — ignore errors)
-                let _ = conn
-                    .execute(
-                        "UPDATE ca_entries SET last_used = ?1 WHERE hash = ?2 AND extr_ver = ?3 AND grammar = ?4",
-                        params![now, hash, extr_ver, grammar],
-                    )
-                    .await;
                 Ok::<_, libsql::Error>(Some(bytes))
             } else {
                 Ok(None)
             }
         })?;
         if let Some(bytes) = bytes_opt {
+            self.touch(hash, extr_ver, grammar);
             let value: T = bincode::deserialize(&bytes)?;
             return Ok(Some(value));
         }
         Ok(None)
     }
 
+    /// Write any queued `last_used` bumps now rather than waiting for a full batch.
+    pub(crate) fn flush_touched(&self) {
+        self.inner.flush_touched();
+    }
+
+    /// Queue a `last_used` bump for a hit, writing the batch once it is full.
+    fn touch(&self, hash: &[u8], extr_ver: &str, grammar: &str) {
+        let full = {
+            let mut touched = self.inner.touched.lock().unwrap_or_else(|e| e.into_inner());
+            touched.push((hash.to_vec(), extr_ver.to_string(), grammar.to_string()));
+            touched.len() >= TOUCH_BATCH
+        };
+        if full {
+            self.inner.flush_touched();
+        }
+    }
+
     /// Store a payload. Silently overwrites existing entries with the same key.
     pub(crate) fn put<T: Serialize>(
         &self,
@@ -256,7 +302,7 @@ impl CaCache {
     ///
     /// Removes all `"symbols-*"` entries except those matching (exactly, or as a
     /// `"{version}-"` prefix — see `gc_stale_versions` doc comment) one of the
-    /// current symbol cache version strings (`"symbols-v2-all"`, `"symbols-v2-public"`).
+    /// current symbol cache version strings (`"symbols-v3-all"`, `"symbols-v3-public"`).
     pub(crate) fn gc_stale_symbol_versions(
         &self,
         current_versions: &[&str],
@@ -293,6 +339,8 @@ impl CaCache {
     /// Uses page_count * page_size as the size estimate; runs VACUUM after deletion.
     #[allow(dead_code)] // not yet wired into the refresh path; retained for future use
     pub(crate) fn evict_if_over_limit(&self) -> Result<(), Error> {
+        // Recency must be current before picking the oldest entries.
+        self.inner.flush_touched();
         let conn = &self.inner.conn;
         let max = self.max_size_bytes;
         self.inner.block_on(async {
@@ -325,6 +373,26 @@ impl CaCache {
     }
 }
 
+/// Set `last_used = now` on every entry in `keys` with a single statement.
+async fn touch_entries(
+    conn: &Connection,
+    keys: &[EntryKey],
+    now: i64,
+) -> Result<u64, libsql::Error> {
+    let rows = vec!["(?, ?, ?)"; keys.len()].join(", ");
+    let sql = format!(
+        "UPDATE ca_entries SET last_used = ? WHERE (hash, extr_ver, grammar) IN (VALUES {rows})"
+    );
+    let mut values = Vec::with_capacity(1 + keys.len() * 3);
+    values.push(libsql::Value::Integer(now));
+    for (hash, extr_ver, grammar) in keys {
+        values.push(libsql::Value::Blob(hash.clone()));
+        values.push(libsql::Value::Text(extr_ver.clone()));
+        values.push(libsql::Value::Text(grammar.clone()));
+    }
+    conn.execute(&sql, values).await
+}
+
 async fn current_db_size(conn: &Connection) -> Result<u64, libsql::Error> {
     let mut rows = conn
         .query(
@@ -452,7 +520,19 @@ static SYMBOL_CACHE: OnceLock<Option<CaCache>> = OnceLock::new();
 /// Current symbol cache version strings. Bump these when the `Symbol` struct or
 /// post-processing logic changes in ways that invalidate cached results.
 /// v2 (2026-07-15): `Symbol` gained a `complexity` field.
-pub(crate) const SYMBOL_CACHE_VERSIONS: &[&str] = &["symbols-v2-all", "symbols-v2-public"];
+/// v3 (2026-10-16): entries hold symbols before language post-processing.
+pub(crate) const SYMBOL_CACHE_VERSIONS: &[&str] = &["symbols-v3-all", "symbols-v3-public"];
+
+/// Write the symbol cache's queued `last_used` bumps, if the cache was opened.
+///
+/// `SYMBOL_CACHE` is a static and is never dropped, so hits that have not yet
+/// filled a batch are only written when this is called — at the end of an index
+/// run and before the CLI exits.
+pub fn flush_symbol_cache() {
+    if let Some(Some(cache)) = SYMBOL_CACHE.get() {
+        cache.flush_touched();
+    }
+}
 
 /// Get the global symbol cache singleton.
 ///
@@ -784,4 +864,77 @@ mod tests {
         // evict_if_over_limit with generous limit should do nothing
         cache.evict_if_over_limit().unwrap();
     }
+
+    #[test]
+    fn hits_bump_last_used_when_flushed() {
+        let cache = temp_cache();
+        let hash = blake3::hash(b"hits_bump_last_used_when_flushed");
+        let payload = Payload {
+            symbols: vec![],
+            count: 7,
+        };
+        cache.put(hash.as_bytes(), "v1", "rust", &payload).unwrap();
+        let conn = &cache.inner.conn;
+        let last_used = || {
+            cache.inner.block_on(async {
+                let mut rows = conn
+                    .query("SELECT last_used FROM ca_entries", ())
+                    .await
+                    .unwrap();
+                let row = rows.next().await.unwrap().unwrap();
+                row.get::<i64>(0).unwrap()
+            })
+        };
+        cache
+            .inner
+            .block_on(conn.execute("UPDATE ca_entries SET last_used = 0", ()))
+            .unwrap();
+
+        let got: Option<Payload> = cache.get(hash.as_bytes(), "v1", "rust").unwrap();
+        assert_eq!(got, Some(payload));
+        assert_eq!(last_used(), 0, "a hit is queued, not written immediately");
+
+        cache.inner.flush_touched();
+        assert!(last_used() > 0);
+    }
+
+    #[test]
+    fn partial_batch_of_hits_is_written_on_flush() {
+        let cache = temp_cache();
+        let payload = Payload {
+            symbols: vec![],
+            count: 0,
+        };
+        let hashes: Vec<_> = (0u32..5)
+            .map(|i| blake3::hash(i.to_le_bytes().as_slice()))
+            .collect();
+        for hash in &hashes {
+            cache.put(hash.as_bytes(), "v1", "rust", &payload).unwrap();
+        }
+        let conn = &cache.inner.conn;
+        let stale = || {
+            cache.inner.block_on(async {
+                let mut rows = conn
+                    .query("SELECT COUNT(*) FROM ca_entries WHERE last_used = 0", ())
+                    .await
+                    .unwrap();
+                let row = rows.next().await.unwrap().unwrap();
+                row.get::<i64>(0).unwrap()
+            })
+        };
+        cache
+            .inner
+            .block_on(conn.execute("UPDATE ca_entries SET last_used = 0", ()))
+            .unwrap();
+
+        for hash in &hashes {
+            let got: Option<Payload> = cache.get(hash.as_bytes(), "v1", "rust").unwrap();
+            assert!(got.is_some());
+        }
+        assert!(hashes.len() < TOUCH_BATCH);
+        assert_eq!(stale(), 5, "a partial batch is not written on its own");
+
+        cache.flush_touched();
+        assert_eq!(stale(), 0, "every queued hit must be written by a flush");
+    }
 }
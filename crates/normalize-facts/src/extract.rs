@@ -309,16 +309,16 @@ impl Extractor {
         // Cache version encodes the extraction schema, include_private flag, a
         // fingerprint of the `.scm` query content (tags/complexity/calls/imports/types),
         // and the grammar `.so`'s own embedded build version. Bump the base string
-        // whenever the Symbol struct or post-processing logic changes in a way that
+        // whenever the Symbol struct or tags extraction changes in a way that
         // invalidates existing cached results; the fingerprint/version suffix
         // invalidates automatically whenever the query files or the compiled grammar
         // itself change, so no manual bump is needed for either case.
-        // Cross-file resolver results are not cached (resolver.is_none() guard below).
         // v2 (2026-07-15): Symbol gained a `complexity` field.
+        // v3 (2026-10-16): entries hold symbols before post-processing.
         let base_cache_ver = if self.options.include_private {
-            "symbols-v2-all"
+            "symbols-v3-all"
         } else {
-            "symbols-v2-public"
+            "symbols-v3-public"
         };
         // `None` means the grammar's `.so` carries no embedded version symbol (see
         // `ca_cache::cache_version_suffix`) — we cannot prove two builds of it behave
@@ -327,16 +327,38 @@ impl Extractor {
         let cache_ver = ca_cache::cache_version_suffix(grammar_name)
             .map(|suffix| format!("{base_cache_ver}-{suffix}"));
 
-        // Check the persistent symbol cache before parsing (only when no cross-file
-        // resolver is involved, as resolver results depend on other files, and only
-        // when the grammar is cacheable — see `cache_ver` above).
-        if resolver.is_none()
-            && let Some(ref cache_ver) = cache_ver
-            && let Some(cache) = ca_cache::symbol_cache()
+        // The cache holds the tags-query output, which depends only on the file
+        // content. Post-processing runs on every call, so lookups with a cross-file
+        // resolver (whose results depend on other files) can use the cache too.
+        let mut symbols = match self.tags_symbols_cached(content, support, cache_ver, current_file)
         {
-            let hash = blake3::hash(content.as_bytes());
+            Some(symbols) => symbols,
+            None => return Vec::new(),
+        };
+
+        // Language-specific post-processing: fold impl blocks, dedup multi-equation
+        // definitions, mark interface implementations, etc.
+        support.post_process_symbols(&mut symbols, resolver, current_file);
+
+        symbols
+    }
+
+    /// Symbols from the tags query, served from the persistent symbol cache when
+    /// `cache_ver` is set. Returns `None` if the file could not be parsed.
+    fn tags_symbols_cached(
+        &self,
+        content: &str,
+        support: &dyn Language,
+        cache_ver: Option<String>,
+        current_file: &str,
+    ) -> Option<Vec<Symbol>> {
+        let grammar_name = support.grammar_name();
+        let cache = cache_ver.zip(ca_cache::symbol_cache());
+        let hash = blake3::hash(content.as_bytes());
+
+        if let Some((cache_ver, cache)) = &cache {
             match cache.get::<Vec<Symbol>>(hash.as_bytes(), cache_ver, grammar_name) {
-                Ok(Some(cached)) => return cached,
+                Ok(Some(cached)) => return Some(cached),
                 Ok(None) => {} // cache miss — fall through to parse
                 Err(e) => {
                     tracing::debug!(
@@ -348,14 +370,11 @@ impl Extractor {
             }
         }
 
-        let tree = match parsers::parse_with_grammar(grammar_name, content) {
-            Some(t) => t,
-            None => return Vec::new(),
-        };
+        let tree = parsers::parse_with_grammar(grammar_name, content)?;
 
         // Use the tags-based extraction path with cached compiled queries.
         let loader = parsers::grammar_loader();
-        let mut symbols = if let Some(tags_query_str) = loader.get_tags(grammar_name) {
+        let symbols = if let Some(tags_query_str) = loader.get_tags(grammar_name) {
             loader
                 .get_compiled_query(grammar_name, "tags", &tags_query_str)
                 .and_then(|query| {
@@ -372,28 +391,17 @@ impl Extractor {
             Vec::new()
         };
 
-        // Language-specific post-processing: fold impl blocks, dedup multi-equation
-        // definitions, mark interface implementations, etc.
-        support.post_process_symbols(&mut symbols, resolver, current_file);
-
-        // Store in the persistent symbol cache (only when no cross-file resolver
-        // was used, so the result is fully content-addressed, and only when the
-        // grammar is cacheable).
-        if resolver.is_none()
-            && let Some(ref cache_ver) = cache_ver
-            && let Some(cache) = ca_cache::symbol_cache()
+        if let Some((cache_ver, cache)) = &cache
+            && let Err(e) = cache.put(hash.as_bytes(), cache_ver, grammar_name, &symbols)
         {
-            let hash = blake3::hash(content.as_bytes());
-            if let Err(e) = cache.put(hash.as_bytes(), cache_ver, grammar_name, &symbols) {
-                tracing::debug!(
-                    "normalize-facts: symbol cache put error for {}: {}",
-                    current_file,
-                    e
-                );
-            }
+            tracing::debug!(
+                "normalize-facts: symbol cache put error for {}: {}",
+                current_file,
+                e
+            );
         }
 
-        symbols
+        Some(symbols)
     }
 }
 
@@ -444,6 +452,8 @@ struct TagDef<'tree> {
     is_method_capture: bool,
     /// True when the capture name identifies a container kind (class/interface/module).
     is_container: bool,
+    /// True when the def becomes a function or method, the kinds that carry complexity.
+    has_complexity: bool,
     /// Line numbers (1-indexed) of the definition node.
     start_line: usize,
     end_line: usize,
@@ -455,6 +465,7 @@ fn build_symbol_from_def<'tree>(
     content: &str,
     support: &dyn Language,
     in_container: bool,
+    complexity: usize,
 ) -> Option<Symbol> {
     let name = support.node_name(&def.node, content)?;
     let tag_kind = support.refine_kind(&def.node, content, def.kind);
@@ -471,8 +482,8 @@ fn build_symbol_from_def<'tree>(
     };
     // Cyclomatic complexity only applies to functions/methods — other symbol kinds
     // (classes, modules, types, ...) genuinely have no complexity concept.
-    let complexity = matches!(kind, SymbolKind::Function | SymbolKind::Method)
-        .then(|| compute_complexity(&def.node, support, content.as_bytes()));
+    let complexity =
+        matches!(kind, SymbolKind::Function | SymbolKind::Method).then_some(complexity);
     Some(Symbol {
         name: name.to_string(),
         kind,
@@ -516,33 +527,25 @@ fn collect_symbols_from_tags<'tree>(
     // Run the query and collect TagDef records.
     let root = tree.root_node();
 
-    // Generic suppression pass: a node captured `@_suppress` by *any* pattern in
-    // the query is structural noise (e.g. a C/C++ header guard's `#define`) that
-    // a *different* pattern in the same query may otherwise tag `@definition.*`
+    // Generic suppression: a node captured `@_suppress` by *any* pattern in the
+    // query is structural noise (e.g. a C/C++ header guard's `#define`) that a
+    // *different* pattern in the same query may otherwise tag `@definition.*`
     // (patterns are independent — a node matching two patterns yields two
     // separate matches, so suppression can't be expressed by a single pattern
     // alone). This is a language-agnostic capture convention, not per-language
     // Rust logic: any `.scm` tags query can opt a node out of symbol extraction
-    // by tagging it `@_suppress`, and this scan applies uniformly.
+    // by tagging it `@_suppress`, and it applies uniformly.
+    //
+    // Suppressed ranges and definition captures are gathered in the same pass
+    // over the matches, and definitions are filtered once the pass is done, so
+    // the tree is only walked by the query once.
     let mut suppressed: std::collections::HashSet<(usize, usize)> =
         std::collections::HashSet::new();
-    {
-        let mut suppress_cursor = tree_sitter::QueryCursor::new();
-        let mut suppress_matches = suppress_cursor.matches(query, root, content.as_bytes());
-        while let Some(m) = suppress_matches.next() {
-            for capture in m.captures {
-                if capture_names[capture.index as usize] == "_suppress" {
-                    suppressed.insert((capture.node.start_byte(), capture.node.end_byte()));
-                }
-            }
-        }
-    }
+    let mut candidates: Vec<(tree_sitter::Node<'tree>, &str)> = Vec::new();
 
     let mut qcursor = tree_sitter::QueryCursor::new();
     let mut matches = qcursor.matches(query, root, content.as_bytes());
 
-    let mut defs: Vec<TagDef<'tree>> = Vec::new();
-
     while let Some(m) = matches.next() {
         // Each match should contain a @definition.* capture.
         // We skip matches that have no definition capture (e.g. pure reference matches).
@@ -554,12 +557,18 @@ fn collect_symbols_from_tags<'tree>(
                 // SAFETY: The tree lives as long as 'tree; captures borrow from it.
                 let node = capture.node;
                 def_capture = Some((node, cn));
+            } else if *cn == "_suppress" {
+                suppressed.insert((capture.node.start_byte(), capture.node.end_byte()));
             }
         }
 
-        let Some((def_node, capture_name)) = def_capture else {
-            continue;
-        };
+        if let Some(def) = def_capture {
+            candidates.push(def);
+        }
+    }
+
+    let mut defs: Vec<TagDef<'tree>> = Vec::with_capacity(candidates.len());
+    for (def_node, capture_name) in candidates {
         if suppressed.contains(&(def_node.start_byte(), def_node.end_byte())) {
             continue;
         }
@@ -576,6 +585,8 @@ fn collect_symbols_from_tags<'tree>(
             kind,
             is_method_capture: capture_name == "definition.method",
             is_container: is_container_kind(refined_kind),
+            has_complexity: capture_name == "definition.method"
+                || matches!(refined_kind, SymbolKind::Function | SymbolKind::Method),
             start_line: def_node.start_position().row + 1,
             end_line: def_node.end_position().row + 1,
         });
@@ -599,8 +610,23 @@ fn collect_symbols_from_tags<'tree>(
         a.node.start_byte() == b.node.start_byte() && a.node.end_byte() == b.node.end_byte()
     });
 
-    // Container indices (for nesting reconstruction).
-    let container_idxs: Vec<usize> = (0..defs.len()).filter(|&i| defs[i].is_container).collect();
+    // Complexity for every function/method def, from one pass of the complexity query.
+    let complexity_idxs: Vec<usize> = (0..defs.len())
+        .filter(|&i| defs[i].has_complexity)
+        .collect();
+    let complexity_nodes: Vec<tree_sitter::Node<'tree>> =
+        complexity_idxs.iter().map(|&i| defs[i].node).collect();
+    let counts = compute_complexities(&root, &complexity_nodes, support, content.as_bytes());
+    let mut complexities = vec![1; defs.len()];
+    for (&i, c) in complexity_idxs.iter().zip(counts) {
+        complexities[i] = c;
+    }
+
+    let spans: Vec<(usize, usize, bool)> = defs
+        .iter()
+        .map(|d| (d.start_line, d.end_line, d.is_container))
+        .collect();
+    let enclosing = enclosing_containers(&spans);
 
     // Two-phase assembly: first build all symbols with parent info, then assemble tree.
     // This supports arbitrary nesting depth (namespaces > classes > methods, or
@@ -614,18 +640,13 @@ fn collect_symbols_from_tags<'tree>(
     for i in 0..defs.len() {
         let def = &defs[i];
 
-        let enclosing_ci = container_idxs
-            .iter()
-            .filter(|&&ci| ci != i)
-            .rev()
-            .find(|&&ci| {
-                let c = &defs[ci];
-                c.start_line <= def.start_line && c.end_line >= def.end_line
-            });
+        let enclosing_ci = enclosing[i];
 
         let in_container = enclosing_ci.is_some();
 
-        let Some(mut sym) = build_symbol_from_def(def, content, support, in_container) else {
+        let Some(mut sym) =
+            build_symbol_from_def(def, content, support, in_container, complexities[i])
+        else {
             symbols.push(None);
             parent_of.push(None);
             continue;
@@ -647,7 +668,7 @@ fn collect_symbols_from_tags<'tree>(
         }
 
         symbols.push(Some(sym));
-        parent_of.push(enclosing_ci.copied());
+        parent_of.push(enclosing_ci);
     }
 
     // Phase 2: Assemble tree bottom-up. Process in reverse order so children are
@@ -681,6 +702,55 @@ fn collect_symbols_from_tags<'tree>(
     }
 }
 
+/// For each def's `(start_line, end_line, is_container)` span (sorted by start
+/// line, outer first), the index of its enclosing container: the
+/// highest-indexed other container whose line range covers it.
+///
+/// One sweep instead of scanning every container per def, which was quadratic
+/// for deeply nested data files where most defs are containers. Defs with an
+/// identical line range form a group and can only be enclosed by a container
+/// in the same group or by an earlier one. Earlier containers sit on a stack
+/// with strictly decreasing end lines (a container supersedes any earlier one
+/// that ends no later), so the answer is found by binary search on end line.
+fn enclosing_containers(spans: &[(usize, usize, bool)]) -> Vec<Option<usize>> {
+    let mut enclosing = vec![None; spans.len()];
+    let mut stack: Vec<usize> = Vec::new();
+    let mut group_start = 0;
+    while group_start < spans.len() {
+        let (start_line, end_line, _) = spans[group_start];
+        let group_end = group_start
+            + spans[group_start..]
+                .iter()
+                .take_while(|&&(s, e, _)| s == start_line && e == end_line)
+                .count();
+        let group_containers: Vec<usize> =
+            (group_start..group_end).filter(|&i| spans[i].2).collect();
+        let covering = stack.partition_point(|&ci| spans[ci].1 >= end_line);
+        let outer = covering.checked_sub(1).map(|k| stack[k]);
+        for (i, slot) in enclosing
+            .iter_mut()
+            .enumerate()
+            .take(group_end)
+            .skip(group_start)
+        {
+            *slot = group_containers
+                .iter()
+                .rev()
+                .find(|&&ci| ci != i)
+                .copied()
+                .or(outer);
+        }
+        for &ci in &group_containers {
+            while stack.last().is_some_and(|&top| spans[top].1 <= spans[ci].1) {
+                stack.pop();
+            }
+            stack.push(ci);
+        }
+        group_start = group_end;
+    }
+    enclosing
+}
+
 /// Recursively reverse children vectors (needed because bottom-up assembly reverses order).
 fn reverse_children_recursive(children: &mut [Symbol]) {
     for child in children.iter_mut() {
@@ -706,6 +776,87 @@ pub fn compute_complexity(
     1
 }
 
+/// Compute cyclomatic complexity for many function nodes of the same tree at once.
+///
+/// Equivalent to calling [`compute_complexity`] on each node, but the
+/// `.complexity.scm` query runs over `root` a single time and each `@complexity`
+/// capture is credited to every node whose byte range contains it. Returns one
+/// value per entry of `nodes`, in the same order.
+pub fn compute_complexities(
+    root: &tree_sitter::Node,
+    nodes: &[tree_sitter::Node],
+    support: &dyn Language,
+    source: &[u8],
+) -> Vec<usize> {
+    let mut complexities = vec![1; nodes.len()];
+    if nodes.is_empty() {
+        return complexities;
+    }
+    let grammar_name = support.grammar_name();
+    let loader = parsers::grammar_loader();
+    let Some(query) = loader
+        .get_complexity(grammar_name)
+        .and_then(|scm| loader.get_compiled_query(grammar_name, "complexity", &scm))
+    else {
+        return complexities;
+    };
+    let Some(complexity_idx) = query
+        .capture_names()
+        .iter()
+        .position(|n| *n == "complexity")
+    else {
+        return complexities;
+    };
+
+    let mut hits: Vec<(usize, usize)> = Vec::new();
+    let mut qcursor = tree_sitter::QueryCursor::new();
+    let mut matches = qcursor.matches(&query, *root, source);
+    while let Some(m) = matches.next() {
+        for capture in m.captures {
+            if capture.index as usize == complexity_idx {
+                hits.push((capture.node.start_byte(), capture.node.end_byte()));
+            }
+        }
+    }
+    hits.sort_unstable();
+
+    // Sweep hits and nodes in start order. Syntax nodes are either nested or
+    // disjoint, so the nodes still open at a hit form a chain of ancestors.
+    let mut order: Vec<usize> = (0..nodes.len()).collect();
+    order.sort_by_key(|&i| {
+        (
+            nodes[i].start_byte(),
+            std::cmp::Reverse(nodes[i].end_byte()),
+        )
+    });
+    let mut open: Vec<usize> = Vec::new();
+    let mut next = 0;
+    for (start, end) in hits {
+        while let Some(&i) = order.get(next)
+            && nodes[i].start_byte() <= start
+        {
+            let node_start = nodes[i].start_byte();
+            while open
+                .last()
+                .is_some_and(|&j| nodes[j].end_byte() <= node_start)
+            {
+                open.pop();
+            }
+            open.push(i);
+            next += 1;
+        }
+        while open.last().is_some_and(|&j| nodes[j].end_byte() <= start) {
+            open.pop();
+        }
+        for &i in &open {
+            if end <= nodes[i].end_byte() {
+                complexities[i] += 1;
+            }
+        }
+    }
+    complexities
+}
+
 /// Count complexity using a `@complexity` query.
 fn count_complexity_with_query(
     node: &tree_sitter::Node,
@@ -739,6 +890,76 @@ mod tests {
     use super::*;
     use std::path::PathBuf;
 
+    /// The straightforward scan `enclosing_containers` replaced: the
+    /// highest-indexed other container whose line range covers the def.
+    fn enclosing_containers_by_scan(spans: &[(usize, usize, bool)]) -> Vec<Option<usize>> {
+        (0..spans.len())
+            .map(|i| {
+                let (start, end, _) = spans[i];
+                (0..spans.len()).rev().find(|&ci| {
+                    ci != i && spans[ci].2 && spans[ci].0 <= start && spans[ci].1 >= end
+                })
+            })
+            .collect()
+    }
+
+    #[test]
+    fn test_enclosing_containers_fixed_cases() {
+        // Nested: each container encloses the next.
+        let nested = [(1, 10, true), (2, 8, true), (3, 4, false)];
+        assert_eq!(enclosing_containers(&nested), vec![None, Some(0), Some(1)]);
+
+        // Siblings: all enclosed by the first container, not by each other.
+        let siblings = [(1, 10, true), (2, 4, true), (5, 6, false), (7, 9, true)];
+        assert_eq!(
+            enclosing_containers(&siblings),
+            vec![None, Some(0), Some(0), Some(0)]
+        );
+
+        // Equal ranges: a def is enclosed by the last other container of its group.
+        let equal = [(1, 5, true), (1, 5, true), (1, 5, false)];
+        assert_eq!(
+            enclosing_containers(&equal),
+            vec![Some(1), Some(0), Some(1)]
+        );
+
+        // Overlapping without nesting: the later container does not sit inside
+        // the earlier one, but wins for defs both of them cover.
+        let overlapping = [(1, 5, true), (3, 8, true), (4, 5, false), (6, 7, false)];
+        assert_eq!(
+            enclosing_containers(&overlapping),
+            vec![None, None, Some(1), Some(1)]
+        );
+    }
+
+    #[test]
+    fn test_enclosing_containers_matches_scan() {
+        // Deterministic pseudo-random spans, sorted like `collect_symbols_from_tags`
+        // sorts its defs: start line ascending, end line descending.
+        let mut seed: u64 = 0x9e37_79b9_7f4a_7c15;
+        let mut next = |bound: u64| {
+            seed = seed
+                .wrapping_mul(6_364_136_223_846_793_005)
+                .wrapping_add(1_442_695_040_888_963_407);
+            ((seed >> 33) % bound) as usize
+        };
+        for _ in 0..500 {
+            let len = next(24);
+            let mut spans: Vec<(usize, usize, bool)> = (0..len)
+                .map(|_| {
+                    let start = 1 + next(12);
+                    (start, start + next(8), next(3) != 0)
+                })
+                .collect();
+            spans.sort_by(|a, b| a.0.cmp(&b.0).then(b.1.cmp(&a.1)));
+            assert_eq!(
+                enclosing_containers(&spans),
+                enclosing_containers_by_scan(&spans),
+                "spans: {spans:?}"
+            );
+        }
+    }
+
     /// Regression test for the C header-guard misclassification: `#define FOO_H`
     /// with no value, matching the enclosing `#ifndef FOO_H`, is structural noise
     /// and must not appear as a symbol — even though a real, valued macro that
@@ -796,6 +1017,45 @@ void foo();
         );
     }
 
+    #[test]
+    fn test_batched_complexity_matches_per_node() {
+        let content = r#"
+def outer(x):
+    if x:
+        def inner(y):
+            for i in y:
+                if i:
+                    return i
+        return inner
+    while x:
+        x -= 1
+    return x
+
+def flat():
+    return 1
+"#;
+        let support = support_for_path(Path::new("test.py")).unwrap();
+        let tree = parsers::parse_with_grammar(support.grammar_name(), content).unwrap();
+        let root = tree.root_node();
+        let mut nodes = Vec::new();
+        let mut cursor = root.walk();
+        let mut stack = vec![root];
+        while let Some(node) = stack.pop() {
+            if node.kind() == "function_definition" {
+                nodes.push(node);
+            }
+            stack.extend(node.children(&mut cursor));
+        }
+        assert_eq!(nodes.len(), 3);
+
+        let batched = compute_complexities(&root, &nodes, support, content.as_bytes());
+        let per_node: Vec<usize> = nodes
+            .iter()
+            .map(|n| compute_complexity(n, support, content.as_bytes()))
+            .collect();
+        assert_eq!(batched, per_node);
+    }
+
     #[test]
     fn test_extract_python() {
         let extractor = Extractor::new();
@@ -172,7 +172,7 @@ pub fn run_case(case: &FixtureCase, update: bool) -> FixtureCaseResult {
         }
     };
 
-    let mut parser = SymbolParser::new();
+    let parser = SymbolParser::new();
 
     // Extract symbols.
     let actual_symbols = parser.parse_file(&case.input, &content).unwrap_or_default();
@@ -182,10 +182,12 @@ pub fn run_case(case: &FixtureCase, update: bool) -> FixtureCaseResult {
 
     // Extract calls: iterate over all top-level symbols and collect their callees.
     let mut actual_calls: Vec<(String, usize)> = Vec::new();
-    for sym in &actual_symbols {
-        let callees = parser.find_callees_for_symbol(&case.input, &content, sym);
-        for (callee, line, _, _) in callees {
-            actual_calls.push((callee, line));
+    if let Some(tree) = parser.parse_for_calls(&case.input, &content) {
+        for sym in &actual_symbols {
+            let callees = parser.find_callees_in_tree(&case.input, &tree, &content, sym);
+            for (callee, line, _, _) in callees {
+                actual_calls.push((callee, line));
+            }
         }
     }
     actual_calls.sort();
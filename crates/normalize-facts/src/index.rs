@@ -118,6 +118,18 @@ struct CachedFileData {
     type_refs: Vec<TypeRef>,
 }
 
+/// Borrowed view of [`CachedFileData`] used when writing to the CA cache.
+/// Slices serialize exactly like the owned `Vec`s, so storing a freshly parsed
+/// file does not need a deep copy of everything that was extracted from it.
+#[derive(serde::Serialize)]
+struct CachedFileDataRef<'a> {
+    symbols: &'a [ParsedSymbol],
+    calls: &'a [CallEntry],
+    imports: &'a [FlatImport],
+    type_methods: &'a [(String, String)],
+    type_refs: &'a [TypeRef],
+}
+
 // Not yet public - just delete .normalize/index.sqlite on schema changes
 const SCHEMA_VERSION: i64 = 17;
 
@@ -370,6 +382,13 @@ impl FileIndex {
             (),
         )
         .await?;
+        // Case-insensitive name lookups (`find_symbols` exact mode) probe this
+        // index instead of scanning every symbol through LOWER().
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_symbols_name_nocase ON symbols(name COLLATE NOCASE)",
+            (),
+        )
+        .await?;
 
         // Symbol attributes (one row per attribute per symbol)
         conn.execute(
@@ -1766,12 +1785,13 @@ impl FileIndex {
                 });
             }
         } else {
-            // Exact match
+            // Exact match. NOCASE folds ASCII only, exactly like SQLite's LOWER(),
+            // so this matches the same rows while using idx_symbols_name_nocase.
             let mut rows = if let Some(k) = kind {
                 self.conn
                     .query(
                         "SELECT name, kind, file, start_line, end_line, parent FROM symbols
-                     WHERE LOWER(name) = LOWER(?1) AND kind = ?2
+                     WHERE name = ?1 COLLATE NOCASE AND kind = ?2
                      LIMIT ?3",
                         params![query, k, limit_i64],
                     )
@@ -1780,7 +1800,7 @@ impl FileIndex {
                 self.conn
                     .query(
                         "SELECT name, kind, file, start_line, end_line, parent FROM symbols
-                     WHERE LOWER(name) = LOWER(?1)
+                     WHERE name = ?1 COLLATE NOCASE
                      LIMIT ?2",
                         params![query, limit_i64],
                     )
@@ -2959,7 +2979,9 @@ impl FileIndex {
             .filter_map(|file_path| {
                 let full_path = root.join(file_path);
                 let bytes = std::fs::read(&full_path).ok()?;
-                let content = String::from_utf8_lossy(&bytes).into_owned();
+                // Borrows `bytes` when it is valid UTF-8 (the common case) instead of
+                // holding a second full copy of the file alongside it.
+                let content = String::from_utf8_lossy(&bytes);
 
                 let grammar = support_for_path(&full_path)
                     .map(|s| s.grammar_name().to_string())
@@ -2977,6 +2999,7 @@ impl FileIndex {
 
                 let mut sym_data = Vec::with_capacity(symbols.len());
                 let mut call_data = Vec::new();
+                let calls_tree = parser.parse_for_calls(&full_path, &content);
 
                 for sym in &symbols {
                     sym_data.push(ParsedSymbol {
@@ -2995,8 +3018,10 @@ impl FileIndex {
 
                     // Only index calls for functions/methods
                     let kind = sym.kind.as_str();
-                    if kind == "function" || kind == "method" {
-                        let calls = parser.find_callees_for_symbol(&full_path, &content, sym);
+                    if (kind == "function" || kind == "method")
+                        && let Some(tree) = &calls_tree
+                    {
+                        let calls = parser.find_callees_in_tree(&full_path, tree, &content, sym);
                         for (callee_name, line, qualifier, access) in calls {
                             call_data.push((
                                 sym.name.clone(),
@@ -3050,27 +3075,12 @@ impl FileIndex {
                     && let Some(ca) = &ca_cache_for_rayon
                     && let Some(extr_ver) = extr_ver_for_grammar(&grammar)
                 {
-                    let cached = CachedFileData {
-                        symbols: sym_data
-                            .iter()
-                            .map(|s| ParsedSymbol {
-                                name: s.name.clone(),
-                                kind: s.kind.clone(),
-                                start_line: s.start_line,
-                                end_line: s.end_line,
-                                parent: s.parent.clone(),
-                                visibility: s.visibility.clone(),
-                                attributes: s.attributes.clone(),
-                                is_interface_impl: s.is_interface_impl,
-                                implements: s.implements.clone(),
-                                docstring: s.docstring.clone(),
-                                complexity: s.complexity,
-                            })
-                            .collect(),
-                        calls: call_data.clone(),
-                        imports: imports.clone(),
-                        type_methods: type_methods.clone(),
-                        type_refs: type_refs.clone(),
+                    let cached = CachedFileDataRef {
+                        symbols: &sym_data,
+                        calls: &call_data,
+                        imports: &imports,
+                        type_methods: &type_methods,
+                        type_refs: &type_refs,
                     };
                     if let Err(e) = ca.put(hash.as_bytes(), &extr_ver, &grammar, &cached) {
                         tracing::warn!("normalize-facts: CA cache put error: {}", e);
@@ -3104,7 +3114,7 @@ impl FileIndex {
                     let grammar_name = lang_support.grammar_name();
                     let symbols: Vec<FlatSymbol> = {
                         let p = SymbolParser::new();
-                        let content = String::from_utf8_lossy(&bytes).into_owned();
+                        let content = String::from_utf8_lossy(&bytes);
                         p.parse_file(&full_path, &content)?
                     };
                     let cfg = build_cfg_data_for_file(&full_path, &bytes, grammar_name, &symbols);
@@ -3336,6 +3346,8 @@ impl FileIndex {
             0
         });
 
+        self.flush_cache_recency();
+
         Ok(CallGraphStats {
             symbols: symbol_count,
             calls: call_count,
@@ -3343,6 +3355,16 @@ impl FileIndex {
         })
     }
 
+    /// Write the CA caches' queued `last_used` bumps at the end of a run. Neither
+    /// cache is dropped while the index (or the process) is alive, so a partial
+    /// batch would otherwise never reach disk.
+    fn flush_cache_recency(&self) {
+        if let Some(ca) = &self.ca_cache {
+            ca.flush_touched();
+        }
+        crate::ca_cache::flush_symbol_cache();
+    }
+
     /// Reindex specific files: delete old data and re-extract symbols/calls/imports.
     /// Expects to be called inside a transaction.
     async fn reindex_files(
@@ -3460,7 +3482,7 @@ impl FileIndex {
             let (sym_data, call_data, imports, type_refs) = if let Some(c) = cached {
                 (c.symbols, c.calls, c.imports, c.type_refs)
             } else {
-                let content = String::from_utf8_lossy(&bytes).into_owned();
+                let content = String::from_utf8_lossy(&bytes);
 
                 // parse_file returns None when the grammar .so is unavailable.
                 // Skip the file entirely — don't index it as empty.
@@ -3473,6 +3495,7 @@ impl FileIndex {
 
                 let mut sym_data = Vec::with_capacity(symbols.len());
                 let mut call_data_local: Vec<CallEntry> = Vec::new();
+                let calls_tree = parser.parse_for_calls(&full_path, &content);
 
                 for sym in &symbols {
                     sym_data.push(ParsedSymbol {
@@ -3489,8 +3512,10 @@ impl FileIndex {
                         complexity: sym.complexity,
                     });
                     let kind = sym.kind.as_str();
-                    if kind == "function" || kind == "method" {
-                        let calls = parser.find_callees_for_symbol(&full_path, &content, sym);
+                    if (kind == "function" || kind == "method")
+                        && let Some(tree) = &calls_tree
+                    {
+                        let calls = parser.find_callees_in_tree(&full_path, tree, &content, sym);
                         for (callee_name, line, qualifier, access) in calls {
                             call_data_local.push((
                                 sym.name.clone(),
@@ -3513,27 +3538,12 @@ impl FileIndex {
                     && let Some(ca) = &self.ca_cache
                     && let Some(ref extr_ver) = extr_ver
                 {
-                    let cached_store = CachedFileData {
-                        symbols: sym_data
-                            .iter()
-                            .map(|s| ParsedSymbol {
-                                name: s.name.clone(),
-                                kind: s.kind.clone(),
-                                start_line: s.start_line,
-                                end_line: s.end_line,
-                                parent: s.parent.clone(),
-                                visibility: s.visibility.clone(),
-                                attributes: s.attributes.clone(),
-                                is_interface_impl: s.is_interface_impl,
-                                implements: s.implements.clone(),
-                                docstring: s.docstring.clone(),
-                                complexity: s.complexity,
-                            })
-                            .collect(),
-                        calls: call_data_local.clone(),
-                        imports: imports.clone(),
-                        type_methods: Vec::new(), // type_methods not extracted in incremental path
-                        type_refs: type_refs.clone(),
+                    let cached_store = CachedFileDataRef {
+                        symbols: &sym_data,
+                        calls: &call_data_local,
+                        imports: &imports,
+                        type_methods: &[], // type_methods not extracted in incremental path
+                        type_refs: &type_refs,
                     };
                     if let Err(e) = ca.put(hash.as_bytes(), extr_ver, &grammar, &cached_store) {
                         tracing::warn!("normalize-facts: CA cache put error: {}", e);
@@ -3611,7 +3621,7 @@ impl FileIndex {
                 // Parse FlatSymbol list to get function symbols (needed for CFG building).
                 let flat_symbols: Vec<FlatSymbol> = {
                     let p = SymbolParser::new();
-                    let content = String::from_utf8_lossy(&bytes).into_owned();
+                    let content = String::from_utf8_lossy(&bytes);
                     p.parse_file(&full_path_for_cfg, &content)
                         .unwrap_or_default()
                 };
@@ -3697,6 +3707,8 @@ impl FileIndex {
             }
         }
 
+        self.flush_cache_recency();
+
         Ok(CallGraphStats {
             symbols: symbol_count,
             calls: call_count,
@@ -4728,6 +4740,41 @@ mod tests {
     use std::fs;
     use tempfile::tempdir;
 
+    #[test]
+    fn test_cached_file_data_ref_reads_back_as_owned() {
+        let symbols = vec![ParsedSymbol {
+            name: "run".to_string(),
+            kind: "function".to_string(),
+            start_line: 1,
+            end_line: 3,
+            parent: None,
+            visibility: "public".to_string(),
+            attributes: vec!["#[inline]".to_string()],
+            is_interface_impl: false,
+            implements: Vec::new(),
+            docstring: Some("Runs.".to_string()),
+            complexity: Some(2),
+        }];
+        let calls: Vec<CallEntry> = vec![("run".to_string(), "go".to_string(), None, None, 2)];
+        let type_methods = vec![("Runner".to_string(), "run".to_string())];
+        let bytes = bincode::serialize(&CachedFileDataRef {
+            symbols: &symbols,
+            calls: &calls,
+            imports: &[],
+            type_methods: &type_methods,
+            type_refs: &[],
+        })
+        .unwrap();
+
+        let cached: CachedFileData = bincode::deserialize(&bytes).unwrap();
+        assert_eq!(cached.symbols.len(), 1);
+        assert_eq!(cached.symbols[0].name, "run");
+        assert_eq!(cached.symbols[0].complexity, Some(2));
+        assert_eq!(cached.calls, calls);
+        assert_eq!(cached.type_methods, type_methods);
+        assert!(cached.imports.is_empty() && cached.type_refs.is_empty());
+    }
+
     #[tokio::test]
     async fn test_index_creation() {
         let dir = tempdir().unwrap();
@@ -19,6 +19,7 @@ mod symbols;
 #[cfg(feature = "cli")]
 pub mod service;
 
+pub use ca_cache::flush_symbol_cache;
 pub use extract::{ExtractOptions, ExtractResult, Extractor, OnDemandResolver};
 // InterfaceResolver moved to normalize-facts-core; re-export here for callers
 pub use index::{CallGraphStats, ChangedFiles, FileIndex, IndexedFile, SymbolMatch};
@@ -52,33 +52,36 @@ impl SymbolParser {
         // Use shared extractor for symbol extraction
         let result = self.extractor.extract(path, content);
 
-        // Flatten nested symbols
+        // Flatten nested symbols. The extraction result is ours, so its strings
+        // are moved into the flat records rather than cloned.
         let mut symbols = Vec::new();
-        for sym in &result.symbols {
+        for sym in result.symbols {
             Self::flatten_symbol(sym, None, &mut symbols);
         }
         Some(symbols)
     }
 
     /// Flatten a nested symbol into the flat list with parent references
-    fn flatten_symbol(sym: &LangSymbol, parent: Option<&str>, symbols: &mut Vec<FlatSymbol>) {
+    fn flatten_symbol(sym: LangSymbol, parent: Option<&str>, symbols: &mut Vec<FlatSymbol>) {
+        // Children need the name as their parent; only copy it when there are any.
+        let parent_name = (!sym.children.is_empty()).then(|| sym.name.clone());
         symbols.push(FlatSymbol {
-            name: sym.name.clone(),
+            name: sym.name,
             kind: sym.kind,
             start_line: sym.start_line,
             end_line: sym.end_line,
             parent: parent.map(String::from),
             visibility: sym.visibility,
-            attributes: sym.attributes.clone(),
+            attributes: sym.attributes,
             is_interface_impl: sym.is_interface_impl,
-            implements: sym.implements.clone(),
-            docstring: sym.docstring.clone(),
+            implements: sym.implements,
+            docstring: sym.docstring,
             complexity: sym.complexity,
         });
 
         // Recurse into children with current symbol as parent
-        for child in &sym.children {
-            Self::flatten_symbol(child, Some(&sym.name), symbols);
+        for child in sym.children {
+            Self::flatten_symbol(child, parent_name.as_deref(), symbols);
         }
     }
 
@@ -324,11 +327,41 @@ impl SymbolParser {
     /// Use this when you already have the FlatSymbol from parse_file()
     /// Returns `(callee_name, line, qualifier, access)` where `access` is
     /// `Some("write")` when the call result is assigned, `None` otherwise.
+    ///
+    /// Parses `content` on every call; when querying several symbols of one
+    /// file, parse once with [`Self::parse_for_calls`] and use
+    /// [`Self::find_callees_in_tree`].
     pub fn find_callees_for_symbol(
         &mut self,
         path: &Path,
         content: &str,
         symbol: &FlatSymbol,
+    ) -> Vec<(String, usize, Option<String>, Option<String>)> {
+        match self.parse_for_calls(path, content) {
+            Some(tree) => self.find_callees_in_tree(path, &tree, content, symbol),
+            None => Vec::new(),
+        }
+    }
+
+    /// Parse a whole file for call extraction.
+    ///
+    /// Returns `None` when the language is unsupported, has no calls query, or
+    /// its grammar is unavailable.
+    pub fn parse_for_calls(&self, path: &Path, content: &str) -> Option<tree_sitter::Tree> {
+        let grammar_name = support_for_path(path)?.grammar_name();
+        normalize_languages::parsers::grammar_loader().get_calls(grammar_name)?;
+        parsers::parse_with_grammar(grammar_name, content)
+    }
+
+    /// Find callees for a symbol in `tree`, the file's tree from
+    /// [`Self::parse_for_calls`]. Returns the same tuples as
+    /// [`Self::find_callees_for_symbol`].
+    pub fn find_callees_in_tree(
+        &self,
+        path: &Path,
+        tree: &tree_sitter::Tree,
+        content: &str,
+        symbol: &FlatSymbol,
     ) -> Vec<(String, usize, Option<String>, Option<String>)> {
         let support = match support_for_path(path) {
             Some(s) => s,
@@ -348,17 +381,13 @@ impl SymbolParser {
             None => return Vec::new(),
         };
 
-        let lines: Vec<&str> = content.lines().collect();
-        let start = symbol.start_line.saturating_sub(1);
-        let end = symbol.end_line.min(lines.len());
-        let source = lines[start..end].join("\n");
-
-        let tree = match parsers::parse_with_grammar(grammar_name, &source) {
-            Some(t) => t,
-            None => return Vec::new(),
-        };
-
-        Self::collect_calls_with_query(&tree.root_node(), &source, &query, symbol.start_line)
+        Self::collect_calls_with_query(
+            &tree.root_node(),
+            content,
+            &query,
+            symbol.start_line,
+            symbol.end_line,
+        )
     }
 
     /// Generic query-based call extraction using `@call`, `@call.write`, and
@@ -373,11 +402,15 @@ impl SymbolParser {
     /// `@call.write` while the generic patterns still use `@call`; deduplication via
     /// a HashMap ensures a single entry per (name, line) pair with the most specific
     /// access tag.
+    ///
+    /// Only calls on lines `start_line..=end_line` (1-based) of `source` are
+    /// reported.
     fn collect_calls_with_query(
         root: &tree_sitter::Node,
         source: &str,
         query: &tree_sitter::Query,
-        base_line: usize,
+        start_line: usize,
+        end_line: usize,
     ) -> Vec<(String, usize, Option<String>, Option<String>)> {
         let call_idx = query.capture_names().iter().position(|n| *n == "call");
         let call_write_idx = query
@@ -394,6 +427,11 @@ impl SymbolParser {
         }
 
         let mut qcursor = tree_sitter::QueryCursor::new();
+        qcursor.set_point_range(
+            tree_sitter::Point::new(start_line.saturating_sub(1), 0)
+                ..tree_sitter::Point::new(end_line, 0),
+        );
+        let lines = start_line.max(1)..=end_line;
         // Map (name, line) -> (qualifier, access) — "write" beats None
         let mut call_map: std::collections::HashMap<
             (String, usize),
@@ -408,15 +446,13 @@ impl SymbolParser {
 
             for capture in m.captures {
                 let idx = capture.index as usize;
-                if Some(idx) == call_idx {
-                    let text = &source[capture.node.byte_range()];
-                    let line = capture.node.start_position().row + base_line;
-                    name = Some((text, line));
-                } else if Some(idx) == call_write_idx {
-                    let text = &source[capture.node.byte_range()];
-                    let line = capture.node.start_position().row + base_line;
-                    name = Some((text, line));
-                    is_write = true;
+                if Some(idx) == call_idx || Some(idx) == call_write_idx {
+                    let line = capture.node.start_position().row + 1;
+                    if !lines.contains(&line) {
+                        continue;
+                    }
+                    name = Some((&source[capture.node.byte_range()], line));
+                    is_write |= Some(idx) == call_write_idx;
                 } else if Some(idx) == qualifier_idx {
                     qualifier = Some(&source[capture.node.byte_range()]);
                 }
@@ -3135,8 +3171,11 @@ impl SymbolParser {
                 Some(s) => s,
                 None => continue, // grammar unavailable — caller logged elsewhere
             };
+            let Some(tree) = self.parse_for_calls(&full_path, &content) else {
+                continue;
+            };
             for symbol in symbols {
-                let callees = self.find_callees_for_symbol(&full_path, &content, &symbol);
+                let callees = self.find_callees_in_tree(&full_path, &tree, &content, &symbol);
                 // Check if any callee matches, considering qualifiers
                 let is_caller = callees.iter().any(|(name, _, qualifier, _)| {
                     if name != symbol_name {
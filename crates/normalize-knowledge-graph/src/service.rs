@@ -119,10 +119,11 @@ impl KgCliService {
         }
 
         if let Some(predicate) = query {
+            let matches = store::jq_predicate(&predicate)?;
             let all = store::read_all_units(&kg)?;
             let mut units = Vec::new();
             for unit in &all {
-                if store::eval_jq_predicate(unit, &predicate)? {
+                if matches(unit)? {
                     units.push(UnitReport::from_unit(unit));
                 }
             }
@@ -153,49 +153,55 @@ fn jq_val_to_json(val: &jaq_json::Val) -> Result<serde_json::Value, String> {
 #[cfg(feature = "cli")]
 fn jq_run_one(
     filter: &CompiledFilter,
-    input: &serde_json::Value,
+    input: serde_json::Value,
 ) -> Result<serde_json::Value, String> {
     use jaq_core::{Ctx, Vars};
     use jaq_json::Val;
 
-    let val: Val = serde_json::from_value(input.clone())
+    let val: Val = serde_json::from_value(input)
         .map_err(|e| format!("Failed to convert input to Val: {}", e))?;
 
     let ctx = Ctx::<D>::new(&filter.lut, Vars::new([]));
-    let outputs: Vec<_> = filter.id.run((ctx, val)).collect();
-
-    if outputs.len() != 1 {
-        return Err(format!(
-            "jq expression must produce exactly one output (got {})",
-            outputs.len()
-        ));
-    }
-
-    let result = outputs
-        .into_iter()
-        .next()
-        .unwrap()
-        .map_err(|e| format!("jq runtime error: {e:?}"))?;
-
-    jq_val_to_json(&result)
+    let mut outputs = filter.id.run((ctx, val));
+
+    // Pull at most two outputs: the happy path never buffers the output stream,
+    // and the remainder is only counted to report how many outputs there were.
+    let got = match (outputs.next(), outputs.next()) {
+        (Some(result), None) => {
+            let result = result.map_err(|e| format!("jq runtime error: {e:?}"))?;
+            return jq_val_to_json(&result);
+        }
+        (None, _) => 0,
+        (Some(_), Some(_)) => 2 + outputs.count(),
+    };
+    Err(format!(
+        "jq expression must produce exactly one output (got {got})"
+    ))
 }
 
+/// Run `filter` and collect its string outputs, skipping any other output type.
+///
+/// Strings are read straight off the jq values rather than round-tripping every
+/// output through JSON text first.
 #[cfg(feature = "cli")]
-fn jq_run_all(
+fn jq_run_strings(
     filter: &CompiledFilter,
-    input: &serde_json::Value,
-) -> Result<Vec<serde_json::Value>, String> {
+    input: serde_json::Value,
+) -> Result<Vec<String>, String> {
     use jaq_core::{Ctx, Vars};
     use jaq_json::Val;
 
-    let val: Val = serde_json::from_value(input.clone())
+    let val: Val = serde_json::from_value(input)
         .map_err(|e| format!("Failed to convert input to Val: {}", e))?;
 
     let ctx = Ctx::<D>::new(&filter.lut, Vars::new([]));
     let mut results = Vec::new();
     for output in filter.id.run((ctx, val)) {
         match output {
-            Ok(v) => results.push(jq_val_to_json(&v)?),
+            Ok(Val::BStr(s) | Val::TStr(s)) => {
+                results.push(String::from_utf8_lossy(s.as_ref()).into_owned())
+            }
+            Ok(_) => {}
             Err(e) => return Err(format!("jq runtime error: {e:?}")),
         }
     }
@@ -290,7 +296,7 @@ fn jq_json_to_unit(value: serde_json::Value) -> Result<Unit, String> {
 pub fn apply_jq_transform(unit: &Unit, expr: &str) -> Result<Option<Unit>, String> {
     let filter = jq_compile(expr)?;
     let unit_json = unit_to_jq_json(unit)?;
-    let result = jq_run_one(&filter, &unit_json)?;
+    let result = jq_run_one(&filter, unit_json)?;
 
     match result {
         serde_json::Value::Null => Ok(None),
@@ -298,24 +304,31 @@ pub fn apply_jq_transform(unit: &Unit, expr: &str) -> Result<Option<Unit>, Strin
     }
 }
 
-/// Evaluate a jq predicate against a unit, returning true if the predicate is truthy.
+/// Compile a jq predicate once, returning a matcher that is true for units where
+/// the predicate yields a truthy value.
+///
+/// Scanning many units should compile once and reuse the matcher: parsing and
+/// compiling the expression (with the std library defs) costs far more than
+/// running it against a single unit.
 #[cfg(feature = "cli")]
-pub fn eval_jq_predicate(unit: &Unit, predicate: &str) -> Result<bool, String> {
+pub fn jq_predicate(predicate: &str) -> Result<impl Fn(&Unit) -> Result<bool, String>, String> {
     use jaq_core::{Ctx, ValT, Vars};
     use jaq_json::Val;
 
     let filter = jq_compile(predicate)?;
-    let unit_json = unit_to_jq_json(unit)?;
-    let val: Val = serde_json::from_value(unit_json)
-        .map_err(|e| format!("Failed to convert unit to Val: {}", e))?;
+    Ok(move |unit: &Unit| {
+        let unit_json = unit_to_jq_json(unit)?;
+        let val: Val = serde_json::from_value(unit_json)
+            .map_err(|e| format!("Failed to convert unit to Val: {}", e))?;
 
-    let ctx = Ctx::<D>::new(&filter.lut, Vars::new([]));
-    for v in filter.id.run((ctx, val)).flatten() {
-        if v.as_bool() {
-            return Ok(true);
+        let ctx = Ctx::<D>::new(&filter.lut, Vars::new([]));
+        for v in filter.id.run((ctx, val)).flatten() {
+            if v.as_bool() {
+                return Ok(true);
+            }
         }
-    }
-    Ok(false)
+        Ok(false)
+    })
 }
 
 /// Walk the graph from `start_id`, extracting next-hop IDs from each unit using `link_expr`.
@@ -337,15 +350,7 @@ pub fn walk_from(
     let filter = jq_compile(link_expr)?;
 
     let extract_ids = |unit: &Unit| -> Result<Vec<String>, String> {
-        let unit_json = unit_to_jq_json(unit)?;
-        let outputs = jq_run_all(&filter, &unit_json)?;
-        let mut ids = Vec::new();
-        for v in outputs {
-            if let serde_json::Value::String(s) = v {
-                ids.push(s);
-            }
-        }
-        Ok(ids)
+        jq_run_strings(&filter, unit_to_jq_json(unit)?)
     };
 
     let start_unit =
@@ -439,17 +444,21 @@ fn parse_unit_file(contents: &str) -> Result<(serde_json::Value, Vec<Link>, Stri
 fn render_unit_file(metadata: &serde_json::Value, links: &[Link], body: &str) -> String {
     let mut yaml_map = serde_yaml::Mapping::new();
 
+    // Serialize straight into YAML values via the derived impls rather than
+    // going through an intermediate JSON tree and converting it node by node.
     if let serde_json::Value::Object(meta_map) = metadata {
         for (k, v) in meta_map {
-            yaml_map.insert(serde_yaml::Value::String(k.clone()), json_to_yaml_value(v));
+            yaml_map.insert(
+                serde_yaml::Value::String(k.clone()),
+                serde_yaml::to_value(v).unwrap_or(serde_yaml::Value::Null),
+            );
         }
     }
 
     if !links.is_empty() {
-        let links_json = serde_json::to_value(links).unwrap_or(serde_json::Value::Array(vec![]));
         yaml_map.insert(
             serde_yaml::Value::String("links".to_string()),
-            json_to_yaml_value(&links_json),
+            serde_yaml::to_value(links).unwrap_or(serde_yaml::Value::Sequence(vec![])),
         );
     }
 
@@ -490,33 +499,6 @@ fn yaml_to_json(v: serde_yaml::Value) -> serde_json::Value {
     }
 }
 
-fn json_to_yaml_value(v: &serde_json::Value) -> serde_yaml::Value {
-    match v {
-        serde_json::Value::Null => serde_yaml::Value::Null,
-        serde_json::Value::Bool(b) => serde_yaml::Value::Bool(*b),
-        serde_json::Value::Number(n) => {
-            if let Some(i) = n.as_i64() {
-                serde_yaml::Value::Number(i.into())
-            } else if let Some(f) = n.as_f64() {
-                serde_yaml::Value::Number(serde_yaml::Number::from(f))
-            } else {
-                serde_yaml::Value::Null
-            }
-        }
-        serde_json::Value::String(s) => serde_yaml::Value::String(s.clone()),
-        serde_json::Value::Array(arr) => {
-            serde_yaml::Value::Sequence(arr.iter().map(json_to_yaml_value).collect())
-        }
-        serde_json::Value::Object(map) => {
-            let mut mapping = serde_yaml::Mapping::new();
-            for (k, v) in map {
-                mapping.insert(serde_yaml::Value::String(k.clone()), json_to_yaml_value(v));
-            }
-            serde_yaml::Value::Mapping(mapping)
-        }
-    }
-}
-
 // ---------------------------------------------------------------------------
 // Migration from edges.jsonl
 // ---------------------------------------------------------------------------
@@ -672,6 +654,25 @@ mod tests {
         assert_eq!(parsed_body, "body\n");
     }
 
+    #[test]
+    fn test_render_roundtrips_nested_values() {
+        let metadata = serde_json::json!({
+            "count": 3,
+            "score": 0.5,
+            "flags": [true, null],
+            "nested": {"a": {"b": "c"}},
+        });
+        let links = vec![Link {
+            kind: "uses".to_string(),
+            to: "x".to_string(),
+            metadata: serde_json::json!({"weight": 2, "note": "n"}),
+        }];
+        let rendered = render_unit_file(&metadata, &links, "");
+        let (parsed_meta, parsed_links, _) = parse_unit_file(&rendered).unwrap();
+        assert_eq!(parsed_meta, metadata);
+        assert_eq!(parsed_links, links);
+    }
+
     #[test]
     fn test_migration_from_jsonl() {
         let dir = tempfile::tempdir().unwrap();
@@ -6,6 +6,14 @@
 use crate::ContainerBody;
 use tree_sitter::Node;
 
+/// Move `end` back over any trailing `chars`, never past `start`.
+fn trim_end_offset(content: &str, start: usize, end: usize, chars: &[char]) -> usize {
+    if end <= start {
+        return end;
+    }
+    start + content[start..end].trim_end_matches(chars).len()
+}
+
 fn analyze_delimited_body(
     body_node: &Node,
     content: &str,
@@ -16,34 +24,27 @@ fn analyze_delimited_body(
     let body_start = body_node.start_byte();
     let body_end = body_node.end_byte();
 
+    let body = &content.as_bytes()[body_start..body_end];
+
+    // After the opening delimiter, skip whitespace up to and including the
+    // first newline so content starts on the line after the delimiter.
     let mut content_start = body_start;
-    for (i, byte) in content[body_start..body_end].bytes().enumerate() {
-        if byte == open {
-            content_start = body_start + i + 1;
-            while content_start < body_end {
-                let b = content.as_bytes()[content_start];
-                if b == b'\n' {
-                    content_start += 1;
-                    break;
-                } else if b.is_ascii_whitespace() {
-                    content_start += 1;
-                } else {
-                    break;
-                }
-            }
-            break;
-        }
+    if let Some(pos) = body.iter().position(|&b| b == open) {
+        content_start = body_start + pos + 1;
+        let rest = &content.as_bytes()[content_start..body_end];
+        content_start += match rest
+            .iter()
+            .position(|&b| b == b'\n' || !b.is_ascii_whitespace())
+        {
+            Some(skip) if rest[skip] == b'\n' => skip + 1,
+            Some(skip) => skip,
+            None => rest.len(),
+        };
     }
 
     let mut content_end = body_end;
-    for (i, byte) in content[body_start..body_end].bytes().rev().enumerate() {
-        if byte == close {
-            content_end = body_end - i - 1;
-            while content_end > content_start && content.as_bytes()[content_end - 1] == b' ' {
-                content_end -= 1;
-            }
-            break;
-        }
+    if let Some(pos) = body.iter().rposition(|&b| b == close) {
+        content_end = trim_end_offset(content, content_start, body_start + pos, &[' ']);
     }
 
     let is_empty = content[content_start..content_end].trim().is_empty();
@@ -140,10 +141,7 @@ pub(crate) fn analyze_is_begin_end_body(
     let mut c2 = body_node.walk();
     for child in body_node.children(&mut c2) {
         if child.kind() == "end" {
-            content_end = child.start_byte();
-            while content_end > content_start && matches!(bytes[content_end - 1], b' ' | b'\t') {
-                content_end -= 1;
-            }
+            content_end = trim_end_offset(content, content_start, child.start_byte(), &[' ', '\t']);
             break;
         }
     }
@@ -187,23 +185,17 @@ pub(crate) fn analyze_keyword_end_body(
     let bytes = content.as_bytes();
 
     // Skip past the first line (opening keyword: "do", "struct", "sig", etc.)
-    let mut content_start = body_start;
-    while content_start < body_end && bytes[content_start] != b'\n' {
-        content_start += 1;
-    }
-    if content_start < body_end && bytes[content_start] == b'\n' {
-        content_start += 1;
-    }
+    let content_start = match bytes[body_start..body_end].iter().position(|&b| b == b'\n') {
+        Some(pos) => body_start + pos + 1,
+        None => body_end,
+    };
 
     // Strip "end" from the tail: body_end - 3 should be the start of "end"
     let mut content_end = body_end;
     if body_end >= 3 && bytes.get(body_end - 3..body_end) == Some(b"end") {
-        content_end = body_end - 3;
         // Strip indentation (spaces/tabs) before "end", but not newlines —
         // we want content[content_end..] to start with "\nend" or "end"
-        while content_end > content_start && matches!(bytes[content_end - 1], b' ' | b'\t') {
-            content_end -= 1;
-        }
+        content_end = trim_end_offset(content, content_start, body_end - 3, &[' ', '\t']);
     }
 
     let is_empty = content[content_start..content_end].trim().is_empty();
@@ -212,25 +212,22 @@ pub fn build_signature(node: &Node, content: &str, name: &str) -> String {
 /// Extract implements/extends list for a JS/TS class or interface node.
 pub fn extract_implements(node: &Node, content: &str) -> ImplementsInfo {
     let mut implements = Vec::new();
-    for i in 0..node.child_count() as u32 {
-        if let Some(heritage) = node.child(i)
-            && heritage.kind() == "class_heritage"
-        {
-            for j in 0..heritage.child_count() as u32 {
-                if let Some(clause) = heritage.child(j) {
-                    if clause.kind() == "extends_clause" || clause.kind() == "implements_clause" {
-                        for k in 0..clause.child_count() as u32 {
-                            if let Some(type_node) = clause.child(k)
-                                && (type_node.kind() == "type_identifier"
-                                    || type_node.kind() == "identifier")
-                            {
-                                implements.push(content[type_node.byte_range()].to_string());
-                            }
-                        }
-                    } else if clause.kind() == "type_identifier" || clause.kind() == "identifier" {
-                        implements.push(content[clause.byte_range()].to_string());
+    let mut cursor = node.walk();
+    for heritage in node.children(&mut cursor) {
+        if heritage.kind() != "class_heritage" {
+            continue;
+        }
+        let mut heritage_cursor = heritage.walk();
+        for clause in heritage.children(&mut heritage_cursor) {
+            if clause.kind() == "extends_clause" || clause.kind() == "implements_clause" {
+                let mut clause_cursor = clause.walk();
+                for type_node in clause.children(&mut clause_cursor) {
+                    if type_node.kind() == "type_identifier" || type_node.kind() == "identifier" {
+                        implements.push(content[type_node.byte_range()].to_string());
                     }
                 }
+            } else if clause.kind() == "type_identifier" || clause.kind() == "identifier" {
+                implements.push(content[clause.byte_range()].to_string());
             }
         }
     }
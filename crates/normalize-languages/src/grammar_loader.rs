@@ -44,7 +44,7 @@ use std::collections::HashMap;
 use std::ffi::CStr;
 use std::os::raw::c_char;
 use std::path::{Path, PathBuf};
-use std::sync::{Arc, RwLock};
+use std::sync::{Arc, OnceLock, RwLock};
 use tree_sitter::Language;
 use tree_sitter_language::LanguageFn;
 
@@ -131,6 +131,9 @@ fn read_grammar_version_symbol(library: &Library) -> Option<Arc<str>> {
     cstr.to_str().ok().map(Arc::from)
 }
 
+/// A compiled query, filled once by whichever caller gets there first.
+type QuerySlot = OnceLock<Option<Arc<tree_sitter::Query>>>;
+
 /// Dynamic grammar loader with caching.
 pub struct GrammarLoader {
     /// Search paths for grammar libraries.
@@ -162,7 +165,12 @@ pub struct GrammarLoader {
     /// Cached CFG queries.
     cfg_cache: RwLock<HashMap<String, Arc<String>>>,
     /// Cached compiled tree-sitter queries (keyed by "grammar:query_type").
-    compiled_query_cache: RwLock<HashMap<String, Arc<tree_sitter::Query>>>,
+    ///
+    /// Each key owns a `OnceLock` slot so concurrent first requests for the same
+    /// query (e.g. rayon workers starting on a batch of files) wait for a single
+    /// compile instead of all compiling it. `None` in a filled slot records a
+    /// query that failed to compile.
+    compiled_query_cache: RwLock<HashMap<String, Arc<QuerySlot>>>,
     /// Compile errors for queries that exist but failed `tree_sitter::Query::new`
     /// (keyed by "grammar:query_type"). This is distinct from "no query for this
     /// purpose" — callers only reach `get_compiled_query` after confirming a query
@@ -170,6 +178,8 @@ pub struct GrammarLoader {
     /// is unambiguously a bug in the `.scm` file, not a legitimate absence. Cached
     /// so a broken query logs once per process instead of on every call.
     failed_query_cache: RwLock<HashMap<String, Arc<String>>>,
+    /// Trees of recently parsed files, for [`Self::reparse`].
+    recent_trees: crate::parsers::RecentTrees,
 }
 
 impl GrammarLoader {
@@ -212,6 +222,7 @@ impl GrammarLoader {
             cfg_cache: RwLock::new(HashMap::new()),
             compiled_query_cache: RwLock::new(HashMap::new()),
             failed_query_cache: RwLock::new(HashMap::new()),
+            recent_trees: Default::default(),
         }
     }
 
@@ -234,9 +245,34 @@ impl GrammarLoader {
             cfg_cache: RwLock::new(HashMap::new()),
             compiled_query_cache: RwLock::new(HashMap::new()),
             failed_query_cache: RwLock::new(HashMap::new()),
+            recent_trees: Default::default(),
         }
     }
 
+    /// Keep the trees of recently parsed files so [`Self::reparse`] can re-parse
+    /// them incrementally. Meant for long-lived processes (the daemon, the LSP
+    /// server) that parse the same files again after each edit.
+    pub fn retain_recent_trees(&self) {
+        self.recent_trees.enable();
+    }
+
+    /// Parse `source` for the file at `path`, incrementally when possible.
+    ///
+    /// Once [`Self::retain_recent_trees`] is on, a file recently parsed with the
+    /// same language has its previous tree edited to match the changed region
+    /// and handed to tree-sitter as the old tree, so only that region is
+    /// re-parsed; an unchanged source reuses the previous tree outright.
+    /// Otherwise this is a plain parse. `parser` must already be set to the
+    /// file's language.
+    pub fn reparse(
+        &self,
+        parser: &mut tree_sitter::Parser,
+        path: &Path,
+        source: &str,
+    ) -> Option<tree_sitter::Tree> {
+        self.recent_trees.reparse(parser, path, source)
+    }
+
     /// Add a search path.
     pub fn add_path(&mut self, path: PathBuf) {
         self.search_paths.push(path);
@@ -609,10 +645,8 @@ impl GrammarLoader {
         let scm_name = format!("{name}.{query_type}.scm");
 
         for search_path in &self.search_paths {
-            let scm_path = search_path.join(&scm_name);
-            if scm_path.exists()
-                && let Ok(content) = std::fs::read_to_string(&scm_path)
-            {
+            // A missing file just fails the read; no separate exists() probe.
+            if let Ok(content) = std::fs::read_to_string(search_path.join(&scm_name)) {
                 let query = Arc::new(content);
 
                 // Cache it
@@ -657,40 +691,33 @@ impl GrammarLoader {
     ) -> Option<Arc<tree_sitter::Query>> {
         let key = format!("{grammar_name}:{query_type}");
 
-        // Check success cache
+        // Fast path: already compiled, or known broken — the latter avoids
+        // recompiling (and re-logging) a bad query on every call.
         {
             let cache = self
                 .compiled_query_cache
                 .read()
                 .unwrap_or_else(|e| e.into_inner());
-            if let Some(q) = cache.get(&key) {
-                return Some(Arc::clone(q));
-            }
-        }
-
-        // Check failure cache — avoids recompiling (and re-logging) a known-broken
-        // query on every call.
-        {
-            let failed = self
-                .failed_query_cache
-                .read()
-                .unwrap_or_else(|e| e.into_inner());
-            if failed.contains_key(&key) {
-                return None;
+            if let Some(compiled) = cache.get(&key).and_then(|slot| slot.get()) {
+                return compiled.clone();
             }
         }
 
-        // Compile and cache
+        // Not loading the grammar is not cached: it may be installed later.
         let grammar = self.get(grammar_name).ok()?;
-        match tree_sitter::Query::new(&grammar, query_str) {
-            Ok(compiled) => {
-                let arc = Arc::new(compiled);
-                self.compiled_query_cache
-                    .write()
-                    .unwrap_or_else(|e| e.into_inner())
-                    .insert(key, Arc::clone(&arc));
-                Some(arc)
-            }
+
+        let slot = Arc::clone(
+            self.compiled_query_cache
+                .write()
+                .unwrap_or_else(|e| e.into_inner())
+                .entry(key.clone())
+                .or_default(),
+        );
+
+        // Compile outside the map lock; callers racing on the same key block on
+        // the slot until this compile finishes, then share its result.
+        slot.get_or_init(|| match tree_sitter::Query::new(&grammar, query_str) {
+            Ok(compiled) => Some(Arc::new(compiled)),
             Err(e) => {
                 log::error!(
                     "normalize-languages: {query_type} query for grammar '{grammar_name}' \
@@ -703,7 +730,8 @@ impl GrammarLoader {
                     .insert(key, Arc::new(e.to_string()));
                 None
             }
-        }
+        })
+        .clone()
     }
 
     /// Return the compile error for `grammar_name:query_type`, if
@@ -2375,6 +2403,31 @@ mod tests {
         );
     }
 
+    /// Concurrent first requests for the same query share one compiled result.
+    #[test]
+    fn test_get_compiled_query_concurrent_callers_share_one_compile() {
+        let loader = GrammarLoader::new();
+        if loader.get("rust").is_err() {
+            eprintln!(
+                "Skipping test_get_compiled_query_concurrent_callers_share_one_compile: rust \
+                 grammar .so not found, run `cargo xtask build-grammars` first"
+            );
+            return;
+        }
+
+        let query = "(function_item name: (identifier) @name)";
+        let results: Vec<_> = std::thread::scope(|scope| {
+            let handles: Vec<_> = (0..8)
+                .map(|_| scope.spawn(|| loader.get_compiled_query("rust", "shared", query)))
+                .collect();
+            handles
+                .into_iter()
+                .map(|h| h.join().unwrap().unwrap())
+                .collect()
+        });
+        assert!(results.iter().all(|q| Arc::ptr_eq(q, &results[0])));
+    }
+
     /// A genuinely valid query, by contrast, must compile and must NOT leave a
     /// recorded compile error behind — proving the two cases (absence vs. bug)
     /// stay distinguishable in both directions.
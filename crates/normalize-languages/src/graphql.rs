@@ -12,20 +12,14 @@ impl GraphQL {
     fn collect_named_types(node: &Node, out: &mut Vec<String>, content: &str) {
         if node.kind() == "named_type" {
             // Get the name child (first named child)
-            for i in 0..node.child_count() {
-                if let Some(child) = node.child(i as u32)
-                    && child.is_named()
-                {
-                    out.push(content[child.byte_range()].to_string());
-                    return;
-                }
+            if let Some(child) = node.named_child(0) {
+                out.push(content[child.byte_range()].to_string());
             }
             return;
         }
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i as u32) {
-                Self::collect_named_types(&child, out, content);
-            }
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
+            Self::collect_named_types(&child, out, content);
         }
     }
 }
@@ -60,10 +54,9 @@ impl Language for GraphQL {
 
     fn extract_implements(&self, node: &Node, content: &str) -> crate::ImplementsInfo {
         let mut implements = Vec::new();
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i as u32)
-                && child.kind() == "implements_interfaces"
-            {
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
+            if child.kind() == "implements_interfaces" {
                 GraphQL::collect_named_types(&child, &mut implements, content);
             }
         }
@@ -92,14 +85,10 @@ impl Language for GraphQL {
             return Some(&content[n.byte_range()]);
         }
         // Fallback: find first child of kind "name"
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i as u32)
-                && child.kind() == "name"
-            {
-                return Some(&content[child.byte_range()]);
-            }
-        }
-        None
+        let mut cursor = node.walk();
+        node.children(&mut cursor)
+            .find(|child| child.kind() == "name")
+            .map(|child| &content[child.byte_range()])
     }
 }
 
@@ -78,10 +78,9 @@ impl Language for Kotlin {
 
     fn extract_implements(&self, node: &Node, content: &str) -> crate::ImplementsInfo {
         let mut implements = Vec::new();
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i as u32)
-                && child.kind() == "delegation_specifier"
-            {
+        let mut cursor = node.walk();
+        for child in node.children(&mut cursor) {
+            if child.kind() == "delegation_specifier" {
                 Self::find_type_identifier(&child, content, &mut implements);
             }
         }
@@ -210,14 +209,10 @@ impl Language for Kotlin {
             return Some(&content[name_node.byte_range()]);
         }
         // Try first type_identifier (class/object declarations) or simple_identifier
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i as u32)
-                && (child.kind() == "type_identifier" || child.kind() == "simple_identifier")
-            {
-                return Some(&content[child.byte_range()]);
-            }
-        }
-        None
+        let mut cursor = node.walk();
+        node.children(&mut cursor)
+            .find(|child| matches!(child.kind(), "type_identifier" | "simple_identifier"))
+            .map(|child| &content[child.byte_range()])
     }
 
     fn extract_attributes(&self, node: &Node, content: &str) -> Vec<String> {
@@ -169,14 +169,10 @@ impl Language for ObjC {
             return Some(&content[n.byte_range()]);
         }
         // ObjC class_interface/class_implementation: first identifier child is the name
-        for i in 0..node.child_count() {
-            if let Some(child) = node.child(i as u32)
-                && child.kind() == "identifier"
-            {
-                return Some(&content[child.byte_range()]);
-            }
-        }
-        None
+        let mut cursor = node.walk();
+        node.children(&mut cursor)
+            .find(|child| child.kind() == "identifier")
+            .map(|child| &content[child.byte_range()])
     }
 }
 
@@ -21,9 +21,11 @@
 //! call [`GrammarLoader::get`] yourself.
 
 use crate::{GrammarLoadError, GrammarLoader};
-use std::collections::HashMap;
+use std::collections::{HashMap, VecDeque};
+use std::path::{Path, PathBuf};
+use std::sync::atomic::{AtomicBool, Ordering};
 use std::sync::{Arc, Mutex, OnceLock};
-use tree_sitter::Parser;
+use tree_sitter::{InputEdit, Parser, Point, Tree};
 
 /// Global grammar loader singleton — avoids reloading grammars for each parse.
 static GRAMMAR_LOADER: OnceLock<Arc<GrammarLoader>> = OnceLock::new();
@@ -149,8 +151,144 @@ pub fn parser_for(grammar: &str) -> Option<Parser> {
 /// (e.g., "python", "rust", "typescript"). Emits a warning to stderr on the
 /// first call where the grammar fails to load.
 pub fn parse_with_grammar(grammar: &str, source: &str) -> Option<tree_sitter::Tree> {
-    let mut parser = parser_for(grammar)?;
-    parser.parse(source, None)
+    with_pooled_parser(grammar, |parser| parser.parse(source, None))?
+}
+
+/// Idle parsers per grammar, handed out by [`with_pooled_parser`].
+static PARSER_POOL: OnceLock<Mutex<HashMap<String, Vec<Parser>>>> = OnceLock::new();
+
+/// Run `f` with a parser for `grammar` taken from a process-wide pool.
+/// `f` must leave the parser's language and included ranges alone.
+///
+/// Indexing calls [`parse_with_grammar`] once per file; reusing parsers keeps
+/// their allocations across files instead of building a new one each time.
+/// Each parser is used by one caller at a time and is reset before it goes
+/// back, so the pool holds at most one parser per concurrent caller.
+fn with_pooled_parser<R>(grammar: &str, f: impl FnOnce(&mut Parser) -> R) -> Option<R> {
+    let pool = PARSER_POOL.get_or_init(|| Mutex::new(HashMap::new()));
+    let pooled = pool
+        .lock()
+        .unwrap_or_else(|e| e.into_inner())
+        .get_mut(grammar)
+        .and_then(Vec::pop);
+    let mut parser = match pooled {
+        Some(parser) => parser,
+        None => parser_for(grammar)?,
+    };
+    let result = f(&mut parser);
+    parser.reset();
+    let mut pool = pool.lock().unwrap_or_else(|e| e.into_inner());
+    match pool.get_mut(grammar) {
+        Some(idle) => idle.push(parser),
+        None => {
+            pool.insert(grammar.to_string(), vec![parser]);
+        }
+    }
+    Some(result)
+}
+
+/// How many recently parsed files keep their tree for [`GrammarLoader::reparse`].
+const RECENT_TREE_CAPACITY: usize = 32;
+
+/// A recently parsed file: the source it was parsed from and its tree.
+struct RecentTree {
+    path: PathBuf,
+    source: String,
+    tree: Tree,
+}
+
+/// A loader's trees for its most recently parsed files, most recent last.
+///
+/// Off until [`GrammarLoader::retain_recent_trees`] turns it on: a one-shot
+/// run never parses a file twice, so copying every source and tree into the
+/// window would only cost memory and a contended lock.
+#[derive(Default)]
+pub(crate) struct RecentTrees {
+    enabled: AtomicBool,
+    trees: Mutex<VecDeque<RecentTree>>,
+}
+
+impl RecentTrees {
+    pub(crate) fn enable(&self) {
+        self.enabled.store(true, Ordering::Relaxed);
+    }
+
+    /// See [`GrammarLoader::reparse`].
+    pub(crate) fn reparse(&self, parser: &mut Parser, path: &Path, source: &str) -> Option<Tree> {
+        if !self.enabled.load(Ordering::Relaxed) {
+            return parser.parse(source, None);
+        }
+
+        // Match on the language itself, not its name: two builds of a grammar
+        // with the same name must not share trees.
+        let previous = {
+            let language = parser.language()?;
+            let mut trees = self.trees.lock().unwrap_or_else(|e| e.into_inner());
+            trees
+                .iter()
+                .position(|t| t.path == path && *t.tree.language() == *language)
+                .and_then(|i| trees.remove(i))
+        };
+
+        let tree = match previous {
+            Some(prev) if prev.source == source => prev.tree,
+            Some(mut prev) => {
+                prev.tree.edit(&input_edit(&prev.source, source));
+                parser.parse(source, Some(&prev.tree))?
+            }
+            None => parser.parse(source, None)?,
+        };
+
+        let mut trees = self.trees.lock().unwrap_or_else(|e| e.into_inner());
+        if trees.len() >= RECENT_TREE_CAPACITY {
+            trees.pop_front();
+        }
+        trees.push_back(RecentTree {
+            path: path.to_path_buf(),
+            source: source.to_string(),
+            tree: tree.clone(),
+        });
+        Some(tree)
+    }
+}
+
+/// Describe the change from `old` to `new` as a single edit spanning
+/// everything between their common prefix and common suffix.
+fn input_edit(old: &str, new: &str) -> InputEdit {
+    let (old_bytes, new_bytes) = (old.as_bytes(), new.as_bytes());
+    let prefix = old_bytes
+        .iter()
+        .zip(new_bytes)
+        .take_while(|(a, b)| a == b)
+        .count();
+    let suffix = old_bytes[prefix..]
+        .iter()
+        .rev()
+        .zip(new_bytes[prefix..].iter().rev())
+        .take_while(|(a, b)| a == b)
+        .count();
+    let old_end = old_bytes.len() - suffix;
+    let new_end = new_bytes.len() - suffix;
+    InputEdit {
+        start_byte: prefix,
+        old_end_byte: old_end,
+        new_end_byte: new_end,
+        start_position: point_at(old_bytes, prefix),
+        old_end_position: point_at(old_bytes, old_end),
+        new_end_position: point_at(new_bytes, new_end),
+    }
+}
+
+/// Row/byte-column position of `offset` in `text`.
+fn point_at(text: &[u8], offset: usize) -> Point {
+    let before = &text[..offset];
+    match before.iter().rposition(|&b| b == b'\n') {
+        Some(nl) => Point::new(
+            before.iter().filter(|&&b| b == b'\n').count(),
+            offset - nl - 1,
+        ),
+        None => Point::new(0, offset),
+    }
 }
 
 /// List grammars available in external search paths.
@@ -162,3 +300,88 @@ pub fn available_external_grammars() -> Vec<String> {
 pub fn available_external_grammars_with_paths() -> Vec<(String, std::path::PathBuf)> {
     grammar_loader().available_external_with_paths()
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn input_edit_spans_changed_region() {
+        let edit = input_edit("fn a() {}\nfn b() {}\n", "fn a() {}\nfn bc() {}\n");
+        assert_eq!(edit.start_byte, 14);
+        assert_eq!(edit.old_end_byte, 14);
+        assert_eq!(edit.new_end_byte, 15);
+        assert_eq!(edit.start_position, Point::new(1, 4));
+        assert_eq!(edit.new_end_position, Point::new(1, 5));
+    }
+
+    #[test]
+    fn input_edit_handles_deletion_at_end() {
+        let edit = input_edit("x = 1\ny = 2\n", "x = 1\n");
+        assert_eq!(edit.start_byte, 6);
+        assert_eq!(edit.old_end_byte, 12);
+        assert_eq!(edit.new_end_byte, 6);
+        assert_eq!(edit.old_end_position, Point::new(2, 0));
+        assert_eq!(edit.new_end_position, Point::new(1, 0));
+    }
+
+    /// A parser set to the rust grammar, or `None` when the grammar is not built.
+    fn rust_parser(loader: &GrammarLoader) -> Option<Parser> {
+        let Ok(rust) = loader.get("rust") else {
+            eprintln!(
+                "Skipping: rust grammar .so not found, run `cargo xtask build-grammars` first"
+            );
+            return None;
+        };
+        let mut parser = Parser::new();
+        parser.set_language(&rust).ok()?;
+        Some(parser)
+    }
+
+    #[test]
+    fn reparse_matches_cold_parse_after_edits() {
+        let loader = GrammarLoader::new();
+        let Some(mut parser) = rust_parser(&loader) else {
+            return;
+        };
+        loader.retain_recent_trees();
+        let path = Path::new("src/lib.rs");
+        let versions = [
+            "fn a() { let x = 1; }\nfn b() {}\n",
+            "fn a() { let x = foo(1, 2); }\nstruct S;\nfn b() {}\n",
+            "fn a() { let x = foo(1, 2); }\nfn b() {}\n",
+            "fn a() { let x = foo(1, 2); }\nfn b() {}\n",
+            "",
+            "fn c() {}\n",
+        ];
+
+        for source in versions {
+            let incremental = loader
+                .reparse(&mut parser, path, source)
+                .expect("incremental parse");
+            let cold = parser.parse(source, None).expect("cold parse");
+            assert_eq!(
+                incremental.root_node().to_sexp(),
+                cold.root_node().to_sexp(),
+                "incremental tree differs from a cold parse of {source:?}"
+            );
+        }
+    }
+
+    #[test]
+    fn recent_trees_keep_nothing_until_enabled() {
+        let loader = GrammarLoader::new();
+        let Some(mut parser) = rust_parser(&loader) else {
+            return;
+        };
+        let recent = RecentTrees::default();
+        let path = Path::new("src/lib.rs");
+
+        recent.reparse(&mut parser, path, "fn a() {}\n");
+        assert!(recent.trees.lock().unwrap().is_empty());
+
+        recent.enable();
+        recent.reparse(&mut parser, path, "fn a() {}\n");
+        assert_eq!(recent.trees.lock().unwrap().len(), 1);
+    }
+}
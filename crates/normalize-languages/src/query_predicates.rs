@@ -7,6 +7,9 @@
 //! [`satisfies_predicates`] evaluates the standard tree-sitter predicates so that
 //! query authors can use them in `.scm` files and have them honoured at runtime.
 
+use regex::Regex;
+use std::collections::HashMap;
+use std::sync::{OnceLock, RwLock};
 use tree_sitter::{Query, QueryMatch, QueryPredicateArg};
 
 /// Return `true` if all predicates on `m`'s pattern are satisfied, `false` otherwise.
@@ -84,11 +87,37 @@ fn resolve_arg<'a>(arg: &'a QueryPredicateArg, m: &'a QueryMatch, source: &'a [u
 ///
 /// Errors (invalid regex) are treated as non-matching so a bad predicate doesn't panic.
 fn regex_matches(pattern: &str, text: &str) -> bool {
-    // Compile the regex on each call. In practice predicates are called on every
-    // match so a caching approach would be better for hot paths, but this is correct
-    // and avoids adding a HashMap dependency to this helper.
-    match regex::Regex::new(pattern) {
-        Ok(re) => re.is_match(text),
-        Err(_) => false,
+    compiled_regex(pattern).is_some_and(|re| re.is_match(text))
+}
+
+/// Compiled form of a predicate regex, or `None` if the pattern is invalid.
+///
+/// Predicates run on every match, so each distinct pattern is compiled once per
+/// process and shared; `Regex` clones are reference-counted and cheap.
+pub fn compiled_regex(pattern: &str) -> Option<Regex> {
+    static CACHE: OnceLock<RwLock<HashMap<String, Option<Regex>>>> = OnceLock::new();
+    let cache = CACHE.get_or_init(Default::default);
+    if let Some(re) = cache.read().unwrap_or_else(|e| e.into_inner()).get(pattern) {
+        return re.clone();
+    }
+    let re = Regex::new(pattern).ok();
+    cache
+        .write()
+        .unwrap_or_else(|e| e.into_inner())
+        .insert(pattern.to_string(), re.clone());
+    re
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_compiled_regex_caches_valid_and_invalid_patterns() {
+        assert!(regex_matches("^foo_", "foo_bar"));
+        assert!(!regex_matches("^foo_", "bar_foo"));
+        assert!(compiled_regex("(unclosed").is_none());
+        assert!(compiled_regex("(unclosed").is_none());
+        assert!(!regex_matches("(unclosed", "(unclosed"));
     }
 }
@@ -1,6 +1,7 @@
 //! Language support registry with extension-based lookup.
 
 use crate::Language;
+use regex::RegexSet;
 use std::collections::HashMap;
 use std::path::Path;
 use std::sync::{OnceLock, RwLock};
@@ -481,15 +482,46 @@ fn lookup_by_name(name: &str) -> Option<&'static dyn Language> {
     })
 }
 
+/// Per-language literal matchers over [`crate::SniffHints::content_signals`],
+/// keyed by language name and built on first use. `None` records a signal
+/// list that could not be compiled (falls back to per-needle scans).
+static CONTENT_SIGNAL_SETS: OnceLock<RwLock<HashMap<&'static str, Option<RegexSet>>>> =
+    OnceLock::new();
+
 /// Score a single candidate's [`crate::SniffHints::content_signals`] against
 /// `content`.
+///
+/// All of a candidate's needles are matched in one pass over `content` with a
+/// cached [`RegexSet`], instead of one `contains` scan per needle.
 fn heuristic_score(lang: &'static dyn Language, content: &str) -> i32 {
-    lang.sniff_hints()
-        .content_signals
-        .iter()
-        .filter(|(needle, _)| content.contains(needle))
-        .map(|(_, weight)| *weight)
-        .sum()
+    let signals = lang.sniff_hints().content_signals;
+    if signals.is_empty() {
+        return 0;
+    }
+    match content_signal_set(lang.name(), signals) {
+        Some(set) => set.matches(content).iter().map(|i| signals[i].1).sum(),
+        None => signals
+            .iter()
+            .filter(|(needle, _)| content.contains(needle))
+            .map(|(_, weight)| *weight)
+            .sum(),
+    }
+}
+
+fn content_signal_set(
+    name: &'static str,
+    signals: &'static [(&'static str, i32)],
+) -> Option<RegexSet> {
+    let sets = CONTENT_SIGNAL_SETS.get_or_init(Default::default);
+    if let Some(set) = sets.read().unwrap_or_else(|e| e.into_inner()).get(name) {
+        return set.clone();
+    }
+    let set = RegexSet::new(signals.iter().map(|(needle, _)| regex::escape(needle))).ok();
+    sets.write()
+        .unwrap_or_else(|e| e.into_inner())
+        .entry(name)
+        .or_insert(set)
+        .clone()
 }
 
 /// Layered language resolver: explicit `--lang` flag, then project config
@@ -105,14 +105,9 @@ impl Language for TypeScript {
             return Some(body);
         }
         // Fallback: find interface_body or class_body child
-        for i in 0..node.child_count() as u32 {
-            if let Some(child) = node.child(i)
-                && (child.kind() == "interface_body" || child.kind() == "class_body")
-            {
-                return Some(child);
-            }
-        }
-        None
+        let mut cursor = node.walk();
+        node.children(&mut cursor)
+            .find(|child| matches!(child.kind(), "interface_body" | "class_body"))
     }
 
     fn analyze_container_body(
@@ -278,14 +273,9 @@ impl Language for Tsx {
             return Some(body);
         }
         // Fallback: find interface_body or class_body child
-        for i in 0..node.child_count() as u32 {
-            if let Some(child) = node.child(i)
-                && (child.kind() == "interface_body" || child.kind() == "class_body")
-            {
-                return Some(child);
-            }
-        }
-        None
+        let mut cursor = node.walk();
+        node.children(&mut cursor)
+            .find(|child| matches!(child.kind(), "interface_body" | "class_body"))
     }
 
     fn analyze_container_body(
@@ -6,6 +6,7 @@
 
 use crate::OutputFormatter;
 use serde::{Deserialize, Serialize};
+use std::collections::HashSet;
 
 /// Severity level for a diagnostic issue.
 #[derive(
@@ -202,75 +203,60 @@ impl DiagnosticsReport {
 
     /// Format as SARIF 2.1.0 JSON.
     pub fn format_sarif(&self) -> String {
-        // Collect unique rule IDs to build the tool.driver.rules array
-        let mut rule_ids: Vec<String> = Vec::new();
-        for issue in &self.issues {
-            if !rule_ids.contains(&issue.rule_id) {
-                rule_ids.push(issue.rule_id.clone());
-            }
-        }
-
-        let sarif_rules: Vec<serde_json::Value> = rule_ids
+        // Build the tool.driver.rules array in one pass: the first issue seen
+        // for each rule_id supplies its default severity.
+        let mut seen_rules: HashSet<&str> = HashSet::new();
+        let rules: Vec<SarifRuleDescriptor<'_>> = self
+            .issues
             .iter()
-            .map(|id| {
-                // Find the first issue with this rule_id to derive default severity
-                let first = self.issues.iter().find(|i| &i.rule_id == id);
-                let level = first.map_or("warning", |i| severity_to_sarif_level(i.severity));
-                serde_json::json!({
-                    "id": id,
-                    "defaultConfiguration": { "level": level }
-                })
+            .filter(|issue| seen_rules.insert(issue.rule_id.as_str()))
+            .map(|issue| SarifRuleDescriptor {
+                id: &issue.rule_id,
+                default_configuration: SarifConfiguration {
+                    level: severity_to_sarif_level(issue.severity),
+                },
             })
             .collect();
 
-        let results: Vec<serde_json::Value> = self
+        let results: Vec<SarifResult<'_>> = self
             .issues
             .iter()
-            .map(|issue| {
-                let mut region = serde_json::Map::new();
-                if let Some(line) = issue.line {
-                    region.insert("startLine".into(), serde_json::json!(line));
-                }
-                if let Some(col) = issue.column {
-                    region.insert("startColumn".into(), serde_json::json!(col));
-                }
-                if let Some(end_line) = issue.end_line {
-                    region.insert("endLine".into(), serde_json::json!(end_line));
-                }
-                if let Some(end_col) = issue.end_column {
-                    region.insert("endColumn".into(), serde_json::json!(end_col));
-                }
-
-                serde_json::json!({
-                    "ruleId": issue.rule_id,
-                    "level": severity_to_sarif_level(issue.severity),
-                    "message": { "text": issue.message },
-                    "locations": [{
-                        "physicalLocation": {
-                            "artifactLocation": { "uri": issue.file },
-                            "region": region
-                        }
-                    }]
-                })
+            .map(|issue| SarifResult {
+                rule_id: &issue.rule_id,
+                level: severity_to_sarif_level(issue.severity),
+                message: SarifText {
+                    text: &issue.message,
+                },
+                locations: [SarifLocation {
+                    physical_location: SarifPhysicalLocation {
+                        artifact_location: SarifArtifactLocation { uri: &issue.file },
+                        region: SarifRegion {
+                            start_line: issue.line,
+                            start_column: issue.column,
+                            end_line: issue.end_line,
+                            end_column: issue.end_column,
+                        },
+                    },
+                }],
             })
             .collect();
 
-        let sarif = serde_json::json!({
-            "version": "2.1.0",
-            "$schema": "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json",
-            "runs": [{
-                "tool": {
-                    "driver": {
-                        "name": "normalize",
-                        "informationUri": "https://github.com/rhi-zone/normalize",
-                        "rules": sarif_rules
-                    }
+        let sarif = SarifLog {
+            version: "2.1.0",
+            schema: "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json",
+            runs: [SarifRun {
+                tool: SarifTool {
+                    driver: SarifDriver {
+                        name: "normalize",
+                        information_uri: "https://github.com/rhi-zone/normalize",
+                        rules,
+                    },
                 },
-                "results": results
-            }]
-        });
+                results,
+            }],
+        };
 
-        // normalize-syntax-allow: rust/unwrap-in-impl - serde_json::Value is always serializable
+        // normalize-syntax-allow: rust/unwrap-in-impl - the SARIF structs only hold strings and integers
         serde_json::to_string_pretty(&sarif).unwrap()
     }
 
@@ -575,6 +561,96 @@ impl OutputFormatter for DiagnosticsReport {
     }
 }
 
+// SARIF 2.1.0 output shapes for `format_sarif`. These borrow from the report
+// and serialize straight to the writer, so field names are emitted as static
+// strings rather than allocated as `serde_json::Value` map keys per result.
+
+#[derive(Serialize)]
+struct SarifLog<'a> {
+    version: &'static str,
+    #[serde(rename = "$schema")]
+    schema: &'static str,
+    runs: [SarifRun<'a>; 1],
+}
+
+#[derive(Serialize)]
+struct SarifRun<'a> {
+    tool: SarifTool<'a>,
+    results: Vec<SarifResult<'a>>,
+}
+
+#[derive(Serialize)]
+struct SarifTool<'a> {
+    driver: SarifDriver<'a>,
+}
+
+#[derive(Serialize)]
+#[serde(rename_all = "camelCase")]
+struct SarifDriver<'a> {
+    name: &'static str,
+    information_uri: &'static str,
+    rules: Vec<SarifRuleDescriptor<'a>>,
+}
+
+#[derive(Serialize)]
+#[serde(rename_all = "camelCase")]
+struct SarifRuleDescriptor<'a> {
+    id: &'a str,
+    default_configuration: SarifConfiguration,
+}
+
+#[derive(Serialize)]
+struct SarifConfiguration {
+    level: &'static str,
+}
+
+#[derive(Serialize)]
+#[serde(rename_all = "camelCase")]
+struct SarifResult<'a> {
+    rule_id: &'a str,
+    level: &'static str,
+    message: SarifText<'a>,
+    locations: [SarifLocation<'a>; 1],
+}
+
+#[derive(Serialize)]
+struct SarifText<'a> {
+    text: &'a str,
+}
+
+#[derive(Serialize)]
+#[serde(rename_all = "camelCase")]
+struct SarifLocation<'a> {
+    physical_location: SarifPhysicalLocation<'a>,
+}
+
+#[derive(Serialize)]
+#[serde(rename_all = "camelCase")]
+struct SarifPhysicalLocation<'a> {
+    artifact_location: SarifArtifactLocation<'a>,
+    region: SarifRegion,
+}
+
+#[derive(Serialize)]
+struct SarifArtifactLocation<'a> {
+    uri: &'a str,
+}
+
+/// SARIF `region` object. Absent positions are dropped by the serializer
+/// instead of being inserted key-by-key for every issue.
+#[derive(Serialize)]
+#[serde(rename_all = "camelCase")]
+struct SarifRegion {
+    #[serde(skip_serializing_if = "Option::is_none")]
+    start_line: Option<usize>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    start_column: Option<usize>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    end_line: Option<usize>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    end_column: Option<usize>,
+}
+
 /// Convert diagnostic `Severity` to SARIF level string.
 fn severity_to_sarif_level(severity: Severity) -> &'static str {
     match severity {
@@ -784,4 +860,129 @@ mod tests {
         assert_eq!(a.tool_errors[0].tool, "tool-a");
         assert_eq!(a.tool_errors[1].tool, "tool-b");
     }
+
+    #[test]
+    fn test_sarif_region_omits_missing_positions() {
+        let report = DiagnosticsReport {
+            issues: vec![Issue {
+                file: "src/lib.rs".into(),
+                line: Some(3),
+                column: None,
+                end_line: None,
+                end_column: None,
+                rule_id: "r".into(),
+                message: "m".into(),
+                severity: Severity::Warning,
+                source: "syntax".into(),
+                related: vec![],
+                suggestion: None,
+            }],
+            files_checked: 1,
+            sources_run: vec!["syntax".into()],
+            tool_errors: vec![],
+            daemon_cached: false,
+        };
+        let sarif: serde_json::Value = serde_json::from_str(&report.format_sarif()).unwrap();
+        let region = &sarif["runs"][0]["results"][0]["locations"][0]["physicalLocation"]["region"];
+        assert_eq!(region, &serde_json::json!({ "startLine": 3 }));
+    }
+
+    /// Pins the exact serialized document, key order included, so consumers
+    /// that diff or hash SARIF output notice any change in the bytes.
+    #[test]
+    fn test_sarif_document_is_byte_stable() {
+        let mut report = DiagnosticsReport::new();
+        report.issues = vec![Issue {
+            file: "src/lib.rs".into(),
+            line: Some(3),
+            column: Some(5),
+            end_line: Some(3),
+            end_column: Some(13),
+            rule_id: "rust/unwrap".into(),
+            message: "avoid unwrap".into(),
+            severity: Severity::Warning,
+            source: "syntax".into(),
+            related: vec![],
+            suggestion: None,
+        }];
+        let expected = r#"{
+  "version": "2.1.0",
+  "$schema": "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json",
+  "runs": [
+    {
+      "tool": {
+        "driver": {
+          "name": "normalize",
+          "informationUri": "https://github.com/rhi-zone/normalize",
+          "rules": [
+            {
+              "id": "rust/unwrap",
+              "defaultConfiguration": {
+                "level": "warning"
+              }
+            }
+          ]
+        }
+      },
+      "results": [
+        {
+          "ruleId": "rust/unwrap",
+          "level": "warning",
+          "message": {
+            "text": "avoid unwrap"
+          },
+          "locations": [
+            {
+              "physicalLocation": {
+                "artifactLocation": {
+                  "uri": "src/lib.rs"
+                },
+                "region": {
+                  "startLine": 3,
+                  "startColumn": 5,
+                  "endLine": 3,
+                  "endColumn": 13
+                }
+              }
+            }
+          ]
+        }
+      ]
+    }
+  ]
+}"#;
+        assert_eq!(report.format_sarif(), expected);
+    }
+
+    #[test]
+    fn test_sarif_rules_deduped_in_first_seen_order() {
+        let issue = |rule: &str, severity| Issue {
+            file: "a.rs".into(),
+            line: Some(1),
+            column: None,
+            end_line: None,
+            end_column: None,
+            rule_id: rule.into(),
+            message: "m".into(),
+            severity,
+            source: "syntax".into(),
+            related: vec![],
+            suggestion: None,
+        };
+        let mut report = DiagnosticsReport::new();
+        report.issues = vec![
+            issue("b", Severity::Error),
+            issue("a", Severity::Info),
+            issue("b", Severity::Warning),
+        ];
+        let sarif: serde_json::Value = serde_json::from_str(&report.format_sarif()).unwrap();
+        let rules = &sarif["runs"][0]["tool"]["driver"]["rules"];
+        assert_eq!(
+            rules,
+            &serde_json::json!([
+                { "id": "b", "defaultConfiguration": { "level": "error" } },
+                { "id": "a", "defaultConfiguration": { "level": "note" } },
+            ])
+        );
+    }
 }
@@ -583,6 +583,23 @@ fn normalize_for_match(s: &str) -> String {
     s.chars().map(normalize_char).collect()
 }
 
+/// Whether a file name or stem equals the query, case-insensitively or with
+/// `-`, `.` and `_` treated as equivalent.
+fn name_matches(name: &str, query_lower: &str, query_normalized: &str) -> bool {
+    if name.is_ascii() {
+        // Lowercasing an ASCII name is ASCII folding, so compare in place
+        // instead of allocating lowercased and normalized copies per path.
+        return name.eq_ignore_ascii_case(query_lower)
+            || (name.len() == query_normalized.len()
+                && name
+                    .chars()
+                    .map(normalize_char)
+                    .eq(query_normalized.chars()));
+    }
+    let lower = name.to_lowercase();
+    lower == query_lower || normalize_for_match(&lower) == query_normalized
+}
+
 /// Resolve from a pre-loaded list of paths
 fn resolve_from_paths(query: &str, all_paths: &[(String, bool)]) -> Vec<PathMatch> {
     // Handle glob patterns (* and **)
@@ -630,21 +647,12 @@ fn resolve_from_paths(query: &str, all_paths: &[(String, bool)]) -> Vec<PathMatc
     // Try exact filename/dirname match (case-insensitive, _ and - equivalent)
     let mut exact_matches: Vec<PathMatch> = Vec::new();
     for (path, is_dir) in all_paths {
-        let name = Path::new(path)
-            .file_name()
-            .map(|n| n.to_string_lossy().to_lowercase())
-            .unwrap_or_default();
-        let stem = Path::new(path)
-            .file_stem()
-            .map(|n| n.to_string_lossy().to_lowercase())
-            .unwrap_or_default();
-        let name_normalized = normalize_for_match(&name);
-        let stem_normalized = normalize_for_match(&stem);
-
-        if name == query_lower
-            || stem == query_lower
-            || name_normalized == query_normalized
-            || stem_normalized == query_normalized
+        let path_ref = Path::new(path);
+        let name = path_ref.file_name().and_then(|n| n.to_str()).unwrap_or("");
+        let stem = path_ref.file_stem().and_then(|n| n.to_str()).unwrap_or("");
+
+        if name_matches(name, &query_lower, &query_normalized)
+            || name_matches(stem, &query_lower, &query_normalized)
         {
             exact_matches.push(PathMatch {
                 path: path.clone(),
@@ -788,6 +796,18 @@ mod tests {
         assert_eq!(matches[0].path, "docs/prior-art.md");
     }
 
+    #[test]
+    fn test_name_matches_case_and_separators() {
+        let check = |name: &str, query: &str| {
+            name_matches(name, &query.to_lowercase(), &normalize_for_match(query))
+        };
+        assert!(check("Prior-Art", "prior_art"));
+        assert!(check("README", "readme"));
+        assert!(check("Ärger", "ärger"));
+        assert!(check("Ärger-Log", "ärger_log"));
+        assert!(!check("prior-art", "prior-arts"));
+    }
+
     #[test]
     fn test_unified_path_file_only() {
         let dir = tempdir().unwrap();
@@ -44,11 +44,11 @@ impl BaselineFile {
     /// `Ok(Some(file))` on success, and `Err` on IO or parse errors.
     pub fn load(root: &Path) -> anyhow::Result<Option<Self>> {
         let path = ratchet_path(root);
-        if !path.exists() {
-            return Ok(None);
-        }
-        let content = std::fs::read_to_string(&path)
-            .map_err(|e| anyhow::anyhow!("failed to read {}: {e}", path.display()))?;
+        let content = match std::fs::read_to_string(&path) {
+            Ok(content) => content,
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(None),
+            Err(e) => anyhow::bail!("failed to read {}: {e}", path.display()),
+        };
         let file = serde_json::from_str(&content)
             .map_err(|e| anyhow::anyhow!("failed to parse {}: {e}", path.display()))?;
         Ok(Some(file))
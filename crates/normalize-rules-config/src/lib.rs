@@ -114,6 +114,24 @@ where
     }
 }
 
+/// The string elements of a rule-frontmatter array; other elements are skipped.
+pub fn frontmatter_strings(arr: Vec<toml::Value>) -> Vec<String> {
+    arr.into_iter()
+        .filter_map(|v| match v {
+            toml::Value::String(s) => Some(s),
+            _ => None,
+        })
+        .collect()
+}
+
+/// The valid glob patterns in a rule-frontmatter array; other elements are skipped.
+pub fn frontmatter_globs(arr: Vec<toml::Value>) -> Vec<glob::Pattern> {
+    arr.iter()
+        .filter_map(|v| v.as_str())
+        .filter_map(|s| glob::Pattern::new(s).ok())
+        .collect()
+}
+
 impl normalize_core::Merge for RuleOverride {
     /// Merge two `RuleOverride` values, with `other` taking priority.
     ///
@@ -1092,4 +1110,19 @@ threshold = 50
         assert!(diff.requires_full_reprime());
         assert!(!diff.is_filter_only());
     }
+
+    #[test]
+    fn frontmatter_arrays_skip_unusable_elements() {
+        let arr: toml::Table = toml::from_str(r#"a = ["x", 1, "**/tests/**", "[", true]"#).unwrap();
+        let toml::Value::Array(arr) = arr["a"].clone() else {
+            panic!("expected an array");
+        };
+
+        assert_eq!(frontmatter_strings(arr.clone()), ["x", "**/tests/**", "["]);
+        let globs: Vec<String> = frontmatter_globs(arr)
+            .iter()
+            .map(|p| p.as_str().to_string())
+            .collect();
+        assert_eq!(globs, ["x", "**/tests/**"]);
+    }
 }
@@ -101,9 +101,6 @@ struct RulesLock {
 
 impl RulesLock {
     fn load(path: &Path) -> Self {
-        if !path.exists() {
-            return Self::default();
-        }
         std::fs::read_to_string(path)
             .ok()
             .and_then(|content| toml::from_str(&content).ok())
@@ -1848,67 +1845,98 @@ pub fn run_sarif_tools(
     let mut report = DiagnosticsReport::new();
     let root_str = root.to_string_lossy();
 
-    for tool in tools {
-        if tool.command.is_empty() {
-            continue;
-        }
-
-        // Mtime-based cache: if `watch` patterns are set, check whether the tool's
-        // output is already cached for the current max mtime of watched files.
-        enum CacheDecision {
-            /// Tool must run; no caching (watch is empty or no files matched).
-            Run,
-            /// Cache hit: issues already added; skip running the tool.
-            Hit,
-            /// Cache miss: run the tool and store results at this mtime.
-            Miss(Box<normalize_native_rules::FindingsCache>, u64),
-        }
+    // Mtime-based cache: if `watch` patterns are set, check whether the tool's
+    // output is already cached for the current max mtime of watched files.
+    enum CacheDecision {
+        /// Tool must run; no caching (watch is empty or no files matched).
+        Run,
+        /// Cache hit: the cached issues; skip running the tool.
+        Hit(Vec<Issue>),
+        /// Cache miss: run the tool and store results at this mtime.
+        Miss(Box<normalize_native_rules::FindingsCache>, u64),
+    }
 
-        let cache_decision = if tool.watch.is_empty() {
-            CacheDecision::Run
-        } else {
-            match sarif_watch_mtime(root, &tool.watch) {
-                None => CacheDecision::Run,
-                Some(max_mtime) => {
-                    let cache = normalize_native_rules::FindingsCache::open(root);
-                    let cache_path = format!("sarif:{}", tool.name);
-                    if let Some(json) = cache.get(&cache_path, max_mtime, "", "sarif") {
-                        if let Ok(issues) = serde_json::from_str::<Vec<Issue>>(&json) {
-                            for issue in issues {
-                                let source = issue.source.clone();
-                                if !report.sources_run.contains(&source) {
-                                    report.sources_run.push(source);
-                                }
-                                report.issues.push(issue);
-                            }
+    let planned: Vec<(&SarifTool, CacheDecision)> = tools
+        .iter()
+        .filter(|tool| !tool.command.is_empty())
+        .map(|tool| {
+            let cache_decision = if tool.watch.is_empty() {
+                CacheDecision::Run
+            } else {
+                match sarif_watch_mtime(root, &tool.watch) {
+                    None => CacheDecision::Run,
+                    Some(max_mtime) => {
+                        let cache = normalize_native_rules::FindingsCache::open(root);
+                        let cache_path = format!("sarif:{}", tool.name);
+                        if let Some(json) = cache.get(&cache_path, max_mtime, "", "sarif") {
+                            CacheDecision::Hit(
+                                serde_json::from_str::<Vec<Issue>>(&json).unwrap_or_default(),
+                            )
+                        } else {
+                            CacheDecision::Miss(Box::new(cache), max_mtime)
                         }
-                        CacheDecision::Hit
-                    } else {
-                        CacheDecision::Miss(Box::new(cache), max_mtime)
                     }
                 }
-            }
-        };
-
-        if matches!(cache_decision, CacheDecision::Hit) {
-            continue;
-        }
-
-        let issues_start = report.issues.len();
+            };
+            (tool, cache_decision)
+        })
+        .collect();
 
-        let args: Vec<String> = tool
-            .command
+    // Each tool is an independent process, so launch every uncached one at once
+    // and let them share the cores; output is still consumed in config order.
+    let outputs: Vec<Option<std::io::Result<std::process::Output>>> = std::thread::scope(|scope| {
+        let handles: Vec<_> = planned
             .iter()
-            .map(|a| a.replace("{root}", &root_str))
+            .map(|(tool, cache_decision)| {
+                if matches!(cache_decision, CacheDecision::Hit(_)) {
+                    return None;
+                }
+                let args: Vec<String> = tool
+                    .command
+                    .iter()
+                    .map(|a| a.replace("{root}", &root_str))
+                    .collect();
+                Some(scope.spawn(move || {
+                    std::process::Command::new(&args[0])
+                        .args(&args[1..])
+                        .current_dir(root)
+                        .output()
+                }))
+            })
             .collect();
+        handles
+            .into_iter()
+            .map(|handle| {
+                handle.map(|h| {
+                    h.join().unwrap_or_else(|_| {
+                        Err(std::io::Error::other("tool runner thread panicked"))
+                    })
+                })
+            })
+            .collect()
+    });
 
-        let output = std::process::Command::new(&args[0])
-            .args(&args[1..])
-            .current_dir(root)
-            .output();
+    for ((tool, cache_decision), output) in planned.into_iter().zip(outputs) {
+        let cache_miss = match cache_decision {
+            CacheDecision::Hit(issues) => {
+                for issue in issues {
+                    let source = issue.source.clone();
+                    if !report.sources_run.contains(&source) {
+                        report.sources_run.push(source);
+                    }
+                    report.issues.push(issue);
+                }
+                continue;
+            }
+            CacheDecision::Run => None,
+            CacheDecision::Miss(cache, max_mtime) => Some((cache, max_mtime)),
+        };
+        let Some(output) = output else { continue };
+
+        let issues_start = report.issues.len();
 
         let stdout = match output {
-            Ok(o) => String::from_utf8_lossy(&o.stdout).into_owned(),
+            Ok(o) => o.stdout,
             Err(e) => {
                 let msg = format!("failed to run: {e}");
                 eprintln!("normalize: SARIF tool '{}' {}", tool.name, msg);
@@ -1922,7 +1950,9 @@ pub fn run_sarif_tools(
             }
         };
 
-        let sarif: serde_json::Value = match serde_json::from_str(&stdout) {
+        // Parse stdout bytes directly rather than decoding to a String first;
+        // SARIF dumps can be large and serde_json validates UTF-8 as it goes.
+        let sarif: serde_json::Value = match serde_json::from_slice(&stdout) {
             Ok(v) => v,
             Err(e) => {
                 let msg = format!("did not emit valid JSON: {e}");
@@ -2018,7 +2048,7 @@ pub fn run_sarif_tools(
             report.sources_run.push(source);
         }
 
-        if let CacheDecision::Miss(cache, max_mtime) = cache_decision {
+        if let Some((cache, max_mtime)) = cache_miss {
             let cache_path = format!("sarif:{}", tool.name);
             let tool_issues = &report.issues[issues_start..];
             if let Ok(json) = serde_json::to_string(tool_issues) {
@@ -214,7 +214,7 @@ impl<'a> ScopeEngine<'a> {
 
         // First pass: collect binding leaf kinds declared via @local.binding-leaf
         // and defer @local.definition.each nodes (can't expand until leaf kinds known).
-        let mut binding_leaf_kinds: std::collections::HashSet<String> =
+        let mut binding_leaf_kinds: std::collections::HashSet<&'static str> =
             std::collections::HashSet::new();
         let mut deferred_each: Vec<tree_sitter::Node> = Vec::new();
         let mut scopes: Vec<ScopeRange> = Vec::new();
@@ -250,7 +250,7 @@ impl<'a> ScopeEngine<'a> {
                     // Declares which leaf node kinds @local.definition.each should
                     // collect when recursing. The .scm file is the authority on
                     // what counts as a binding identifier in that language.
-                    binding_leaf_kinds.insert(node.kind().to_string());
+                    binding_leaf_kinds.insert(node.kind());
                 } else if name == "local.definition.each" {
                     // Defer: we need binding_leaf_kinds fully populated first.
                     deferred_each.push(node);
@@ -425,7 +425,7 @@ fn resolve_reference(
 fn collect_binding_identifiers(
     node: tree_sitter::Node,
     source: &[u8],
-    binding_leaf_kinds: &std::collections::HashSet<String>,
+    binding_leaf_kinds: &std::collections::HashSet<&str>,
     out: &mut Vec<RawCapture>,
 ) {
     if !node.is_named() {
@@ -68,6 +68,42 @@ impl Embedder {
     }
 }
 
+/// Query embeddings kept by [`embed_query`] before the cache is cleared.
+#[cfg(feature = "embeddings")]
+const QUERY_CACHE_CAPACITY: usize = 256;
+
+/// Embed a search query, reusing the result of an earlier identical query.
+///
+/// Embeddings are deterministic for a given model, so a repeated query in a
+/// long-lived process (daemon, MCP server) skips both loading the model and
+/// running inference. The cache is bounded and simply cleared when full.
+#[cfg(feature = "embeddings")]
+pub fn embed_query(model_name: &str, query: &str) -> anyhow::Result<Vec<f32>> {
+    use anyhow::Context;
+    use std::collections::HashMap;
+    use std::sync::{Mutex, OnceLock};
+
+    type QueryCache = HashMap<(String, String), Vec<f32>>;
+    static CACHE: OnceLock<Mutex<QueryCache>> = OnceLock::new();
+    let cache = CACHE.get_or_init(Default::default);
+
+    let key = (model_name.to_string(), query.to_string());
+    if let Some(v) = cache.lock().unwrap_or_else(|e| e.into_inner()).get(&key) {
+        return Ok(v.clone());
+    }
+
+    let v = Embedder::load(model_name, None)
+        .context("Failed to load embedding model")?
+        .embed_one(query)
+        .context("Embedding failed")?;
+    let mut cache = cache.lock().unwrap_or_else(|e| e.into_inner());
+    if cache.len() >= QUERY_CACHE_CAPACITY {
+        cache.clear();
+    }
+    cache.insert(key, v.clone());
+    Ok(v)
+}
+
 /// Convert a slice of f32 to a little-endian byte blob for SQLite storage.
 pub fn encode_vector(v: &[f32]) -> Vec<u8> {
     let mut bytes = Vec::with_capacity(v.len() * 4);
@@ -88,14 +124,24 @@ pub fn decode_vector(bytes: &[u8]) -> Vec<f32> {
 /// Cosine similarity between two equal-length vectors.
 /// Returns 0.0 if either vector has zero magnitude.
 pub fn cosine_similarity(a: &[f32], b: &[f32]) -> f32 {
+    cosine_similarity_with_norm(a, l2_norm(a), b)
+}
+
+/// Euclidean length of a vector.
+pub fn l2_norm(v: &[f32]) -> f32 {
+    v.iter().map(|x| x * x).sum::<f32>().sqrt()
+}
+
+/// [`cosine_similarity`] with `a`'s magnitude supplied by the caller, so a
+/// query compared against many vectors computes its norm once.
+pub fn cosine_similarity_with_norm(a: &[f32], mag_a: f32, b: &[f32]) -> f32 {
     debug_assert_eq!(
         a.len(),
         b.len(),
         "cosine_similarity: vector length mismatch"
     );
     let dot: f32 = a.iter().zip(b.iter()).map(|(x, y)| x * y).sum();
-    let mag_a: f32 = a.iter().map(|x| x * x).sum::<f32>().sqrt();
-    let mag_b: f32 = b.iter().map(|x| x * x).sum::<f32>().sqrt();
+    let mag_b = l2_norm(b);
     if mag_a == 0.0 || mag_b == 0.0 {
         return 0.0;
     }
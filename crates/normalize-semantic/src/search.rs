@@ -13,7 +13,7 @@
 //! into memory.  Used when sqlite-vec is not available or `vec_embeddings`
 //! does not yet exist (e.g. on the first rebuild before the schema migration).
 
-use crate::embedder::{cosine_similarity, decode_vector};
+use crate::embedder::{cosine_similarity_with_norm, decode_vector, l2_norm};
 
 /// Weight applied to staleness during re-ranking. Tunable.
 const STALENESS_WEIGHT: f32 = 0.3;
@@ -59,12 +59,37 @@ pub struct StoredEmbedding {
 /// Re-rank a list of stored embeddings against a query vector.
 ///
 /// Returns hits sorted by final score descending, limited to `top_k`.
+///
+/// Since cosine similarity is at most 1, a candidate's score can never exceed
+/// its staleness factor. Candidates are visited in descending order of that
+/// bound, and once the bound drops below the current `top_k`-th score the
+/// rest are skipped without computing their similarity. Ties keep input order.
 pub fn rerank(query_vec: &[f32], stored: Vec<StoredEmbedding>, top_k: usize) -> Vec<SearchHit> {
-    let mut hits: Vec<SearchHit> = stored
-        .into_iter()
-        .map(|e| {
-            let similarity = cosine_similarity(query_vec, &e.vector);
-            let score = similarity * (1.0 - STALENESS_WEIGHT * e.staleness);
+    if top_k == 0 {
+        return Vec::new();
+    }
+    let query_norm = l2_norm(query_vec);
+    let upper_bound = |e: &StoredEmbedding| (1.0 - STALENESS_WEIGHT * e.staleness).abs();
+
+    let mut candidates: Vec<(usize, StoredEmbedding)> = stored.into_iter().enumerate().collect();
+    candidates.sort_by(|(_, a), (_, b)| upper_bound(b).total_cmp(&upper_bound(a)));
+
+    // Best `top_k` scores seen so far, descending.
+    let mut best: Vec<f32> = Vec::with_capacity(top_k + 1);
+    let mut hits: Vec<(usize, SearchHit)> = Vec::new();
+    for (order, e) in candidates {
+        if best.len() == top_k && upper_bound(&e) < best[top_k - 1] {
+            break;
+        }
+        let similarity = cosine_similarity_with_norm(query_vec, query_norm, &e.vector);
+        let score = similarity * (1.0 - STALENESS_WEIGHT * e.staleness);
+        let pos = best.partition_point(|&s| s >= score);
+        if pos < top_k {
+            best.insert(pos, score);
+            best.truncate(top_k);
+        }
+        hits.push((
+            order,
             SearchHit {
                 id: e.id,
                 source_type: e.source_type,
@@ -75,18 +100,19 @@ pub fn rerank(query_vec: &[f32], stored: Vec<StoredEmbedding>, top_k: usize) ->
                 score,
                 chunk_text: e.chunk_text,
                 last_commit: e.last_commit,
-            }
-        })
-        .collect();
+            },
+        ));
+    }
 
-    // Sort descending by final score
-    hits.sort_by(|a, b| {
+    // Sort descending by final score, then by input order
+    hits.sort_by(|(oa, a), (ob, b)| {
         b.score
             .partial_cmp(&a.score)
             .unwrap_or(std::cmp::Ordering::Equal)
+            .then(oa.cmp(ob))
     });
     hits.truncate(top_k);
-    hits
+    hits.into_iter().map(|(_, hit)| hit).collect()
 }
 
 /// Parse a raw BLOB from the database into a f32 vector via `decode_vector`.
@@ -133,4 +159,36 @@ mod tests {
         let hits = rerank(&query, stored, 3);
         assert_eq!(hits.len(), 3);
     }
+
+    #[test]
+    fn test_rerank_early_exit_matches_full_ranking() {
+        let query = vec![1.0_f32, 0.5, -0.25];
+        let stored = || {
+            (0..50)
+                .map(|i| {
+                    let f = i as f32;
+                    make_stored(
+                        i,
+                        vec![(f * 0.37).sin(), (f * 0.11).cos(), f % 3.0 - 1.0],
+                        (i % 7) as f32 / 6.0,
+                    )
+                })
+                .collect::<Vec<_>>()
+        };
+
+        let mut expected: Vec<(i64, f32)> = stored()
+            .iter()
+            .map(|e| {
+                let sim = crate::embedder::cosine_similarity(&query, &e.vector);
+                (e.id, sim * (1.0 - STALENESS_WEIGHT * e.staleness))
+            })
+            .collect();
+        expected.sort_by(|a, b| b.1.total_cmp(&a.1));
+        expected.truncate(5);
+
+        let hits = rerank(&query, stored(), 5);
+        let got: Vec<i64> = hits.iter().map(|h| h.id).collect();
+        let want: Vec<i64> = expected.iter().map(|(id, _)| *id).collect();
+        assert_eq!(got, want);
+    }
 }
@@ -179,12 +179,8 @@ pub async fn run_search(
         });
     }
 
-    let mut embedder = crate::embedder::Embedder::load(&config.model, None)
-        .map_err(|e| format!("Failed to load embedding model: {e}"))?;
-
-    let query_vec = embedder
-        .embed_one(&query)
-        .map_err(|e| format!("Embedding failed: {e}"))?;
+    let query_vec =
+        crate::embedder::embed_query(&config.model, &query).map_err(|e| format!("{e:#}"))?;
 
     // Try ANN path first (sqlite-vec `vec_embeddings` virtual table).
     // Fall back to brute-force if the extension isn't loaded or the table
@@ -321,12 +317,8 @@ pub async fn run_context_search(
     let dims = crate::embedder::dims_for_model(&config.model).unwrap_or(768);
     store::ensure_vec_schema(conn, dims, vec_conn.as_ref()).await;
 
-    let mut embedder = crate::embedder::Embedder::load(&config.model, None)
-        .map_err(|e| format!("Failed to load embedding model: {e}"))?;
-
-    let query_vec = embedder
-        .embed_one(&query)
-        .map_err(|e| format!("Embedding failed: {e}"))?;
+    let query_vec =
+        crate::embedder::embed_query(&config.model, &query).map_err(|e| format!("{e:#}"))?;
 
     // For context blocks, use the brute-force path scoped to source_type='context'.
     // ANN search returns all source types; post-filtering would waste candidates.
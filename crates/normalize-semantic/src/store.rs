@@ -379,16 +379,15 @@ pub async fn delete_embeddings_for_path(
         )
         .await?;
 
-    for id in ids {
+    // One statement for the whole file rather than one per chunk. The ids are
+    // integers read back from the database, so inlining them is safe.
+    if !ids.is_empty() {
+        let id_list = ids.iter().map(i64::to_string).collect::<Vec<_>>().join(",");
+        let sql = format!("DELETE FROM vec_embeddings WHERE rowid IN ({id_list})");
         if let Some(vc) = vec_conn {
-            if let Ok(stmt) = vc.prepare("DELETE FROM vec_embeddings WHERE rowid = ?1") {
-                stmt.bind_int64(1, id);
-                let _ = stmt.step();
-            }
+            let _ = vc.execute(&sql);
         } else {
-            let _ = conn
-                .execute("DELETE FROM vec_embeddings WHERE rowid = ?1", params![id])
-                .await;
+            let _ = conn.execute(&sql, ()).await;
         }
     }
 
@@ -1617,13 +1617,15 @@ fn extract_file_path(tool_name: &str, input: &serde_json::Value) -> Option<Strin
 /// Detect correction patterns in assistant text.
 /// Returns (category, excerpt) if a correction is found.
 pub fn detect_correction(text: &str) -> Option<(CorrectionKind, String)> {
-    let lower = text.to_lowercase();
+    // ASCII lowercasing keeps byte offsets aligned with `text`, so a match
+    // position can slice the original directly (the phrases are all ASCII).
+    let lower = text.to_ascii_lowercase();
 
     // Look for apology patterns
     let apology_phrases = ["i apologize", "i'm sorry", "sorry about", "my apologies"];
     for phrase in &apology_phrases {
         if let Some(pos) = lower.find(phrase) {
-            let excerpt = text.chars().skip(pos).take(80).collect();
+            let excerpt = text[pos..].chars().take(80).collect();
             return Some((CorrectionKind::Apology, excerpt));
         }
     }
@@ -1637,7 +1639,7 @@ pub fn detect_correction(text: &str) -> Option<(CorrectionKind, String)> {
     ];
     for phrase in &mistake_phrases {
         if let Some(pos) = lower.find(phrase) {
-            let excerpt = text.chars().skip(pos).take(80).collect();
+            let excerpt = text[pos..].chars().take(80).collect();
             return Some((CorrectionKind::Mistake, excerpt));
         }
     }
@@ -1646,7 +1648,7 @@ pub fn detect_correction(text: &str) -> Option<(CorrectionKind, String)> {
     let fix_phrases = ["let me fix", "i'll fix", "let me correct"];
     for phrase in &fix_phrases {
         if let Some(pos) = lower.find(phrase) {
-            let excerpt = text.chars().skip(pos).take(80).collect();
+            let excerpt = text[pos..].chars().take(80).collect();
             return Some((CorrectionKind::LetMeFix, excerpt));
         }
     }
@@ -1655,7 +1657,7 @@ pub fn detect_correction(text: &str) -> Option<(CorrectionKind, String)> {
     let actually_phrases = ["actually,", "actually i", "actually that"];
     for phrase in &actually_phrases {
         if let Some(pos) = lower.find(phrase) {
-            let excerpt = text.chars().skip(pos).take(80).collect();
+            let excerpt = text[pos..].chars().take(80).collect();
             return Some((CorrectionKind::Actually, excerpt));
         }
     }
@@ -2393,4 +2395,12 @@ mod tests {
         assert_eq!(agg.tool_stats.get("Edit").unwrap().calls, 4);
         assert_eq!(agg.total_tool_calls(), 5);
     }
+
+    #[test]
+    fn correction_excerpt_starts_at_phrase_after_multibyte_text() {
+        let (kind, excerpt) =
+            detect_correction("Résumé générée — I apologize, that was off.").expect("apology");
+        assert_eq!(kind, CorrectionKind::Apology);
+        assert_eq!(excerpt, "I apologize, that was off.");
+    }
 }
@@ -74,8 +74,11 @@ pub fn aggregate_sessions(
     Some(SessionAnalysisReport::aggregate(&reports))
 }
 
-/// Apply jq filter to each line of a JSONL file.
-pub fn print_session_jq(path: &Path, filter: &str) -> i32 {
+/// Apply jq filter to each line of each JSONL file.
+///
+/// The filter is compiled once and shared across all files. Returns non-zero
+/// if the filter fails to compile or any file cannot be read.
+pub fn print_sessions_jq(paths: &[PathBuf], filter: &str) -> i32 {
     use jaq_core::load::{Arena, File as JaqFile, Loader};
     use jaq_core::{Compiler, Ctx, Vars, data::JustLut};
     use jaq_json::Val;
@@ -120,48 +123,52 @@ pub fn print_session_jq(path: &Path, filter: &str) -> i32 {
         }
     };
 
-    let file = match File::open(path) {
-        Ok(f) => f,
-        Err(e) => {
-            eprintln!("Failed to open {}: {}", path.display(), e);
-            return 1;
-        }
-    };
-
-    let reader = BufReader::new(file);
     let stdout = std::io::stdout();
     let mut stdout = stdout.lock();
+    let mut exit_code = 0;
 
-    for line in reader.lines() {
-        let line = match line {
-            Ok(l) => l,
+    'files: for path in paths {
+        let file = match File::open(path) {
+            Ok(f) => f,
             Err(e) => {
-                eprintln!("Read error: {}", e);
-                return 1;
+                eprintln!("Failed to open {}: {}", path.display(), e);
+                exit_code = 1;
+                continue;
             }
         };
 
-        if line.trim().is_empty() {
-            continue;
-        }
+        for line in BufReader::new(file).lines() {
+            let line = match line {
+                Ok(l) => l,
+                Err(e) => {
+                    eprintln!("Read error: {}", e);
+                    exit_code = 1;
+                    continue 'files;
+                }
+            };
 
-        let val: Val = match jaq_json::read::parse_single(line.as_bytes()) {
-            Ok(v) => v,
-            Err(_) => continue,
-        };
+            if line.trim().is_empty() {
+                continue;
+            }
 
-        let ctx = Ctx::<JustLut<Val>>::new(&filter_compiled.lut, Vars::new([]));
-        for result in filter_compiled.id.run((ctx, val)) {
-            match result {
-                Ok(v) => {
-                    let _ = writeln!(stdout, "{}", v);
-                }
-                Err(e) => {
-                    eprintln!("jq error: {:?}", e);
+            let val: Val = match jaq_json::read::parse_single(line.as_bytes()) {
+                Ok(v) => v,
+                Err(_) => continue,
+            };
+
+            let ctx = Ctx::<JustLut<Val>>::new(&filter_compiled.lut, Vars::new([]));
+            for result in filter_compiled.id.run((ctx, val)) {
+                match result {
+                    Ok(v) => {
+                        let _ = writeln!(stdout, "{}", v);
+                    }
+                    Err(e) => {
+                        eprintln!("jq error: {:?}", e);
+                    }
                 }
             }
         }
     }
 
-    0
+    exit_code
 }
@@ -407,9 +407,6 @@ fn collect_all_candidates(
     if let Some(until) = until_time {
         sessions.retain(|s| s.mtime <= until);
     }
-    if let Some(ref re) = grep_re {
-        sessions.retain(|s| session_matches_grep(&s.path, re));
-    }
     if let Some(at) = filter.agent_type {
         let at_lower = at.to_lowercase();
         sessions.retain(|s| {
@@ -418,6 +415,9 @@ fn collect_all_candidates(
                 .is_some_and(|t| t.to_lowercase() == at_lower)
         });
     }
+    if let Some(ref re) = grep_re {
+        sessions.retain(|s| session_matches_grep(&s.path, re));
+    }
 
     sessions.sort_by_key(|s| std::cmp::Reverse(s.mtime));
     if filter.session_limit > 0 {
@@ -420,9 +420,6 @@ pub fn build_cost_report(
     if let Some(until) = until_time {
         sessions.retain(|s| s.mtime <= until);
     }
-    if let Some(ref re) = grep_re {
-        sessions.retain(|s| session_matches_grep(&s.path, re));
-    }
     if let Some(at) = agent_type {
         let at_lower = at.to_lowercase();
         sessions.retain(|s| {
@@ -431,6 +428,9 @@ pub fn build_cost_report(
                 .is_some_and(|t| t.to_lowercase() == at_lower)
         });
     }
+    if let Some(ref re) = grep_re {
+        sessions.retain(|s| session_matches_grep(&s.path, re));
+    }
 
     sessions.sort_by_key(|b| std::cmp::Reverse(b.mtime));
     if limit > 0 {
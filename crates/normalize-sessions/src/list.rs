@@ -7,7 +7,6 @@ use crate::sessions::{
     ContentBlock, FormatRegistry, Role, SessionFile, SessionSource, parse_session,
 };
 use serde::Serialize;
-use std::collections::HashSet;
 use std::path::{Path, PathBuf};
 use std::str::FromStr;
 
@@ -96,9 +95,11 @@ impl SessionListReport {
 
     /// Returns true if sessions span more than one project.
     fn is_multi_project(&self) -> bool {
-        let projects: HashSet<Option<&str>> =
-            self.sessions.iter().map(|s| s.project.as_deref()).collect();
-        projects.len() > 1
+        let mut projects = self.sessions.iter().map(|s| s.project.as_deref());
+        match projects.next() {
+            Some(first) => projects.any(|p| p != first),
+            None => false,
+        }
     }
 }
 
@@ -370,10 +371,6 @@ pub fn build_session_list(
         }
     }
 
-    if let Some(ref re) = grep_re {
-        sessions.retain(|s| super::session_matches_grep(&s.path, re));
-    }
-
     // Agent type filtering (case-insensitive match on subagent_type)
     if let Some(at) = agent_type {
         let at_lower = at.to_lowercase();
@@ -384,6 +381,10 @@ pub fn build_session_list(
         });
     }
 
+    if let Some(ref re) = grep_re {
+        sessions.retain(|s| super::session_matches_grep(&s.path, re));
+    }
+
     // Parse sort spec. Default when no --sort given: date descending (newest first).
     let sort_spec: SortSpec<ListSortField> = match sort {
         Some(s) => SortSpec::parse(s)?,
@@ -10,6 +10,7 @@ use crate::sessions::{
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 use std::fmt;
+use std::fmt::Write;
 use std::path::Path;
 use std::str::FromStr;
 use std::time::{Duration, SystemTime};
@@ -267,7 +268,7 @@ fn role_abbrev(role: &str) -> &str {
 
 impl OutputFormatter for MessagesReport {
     fn format_text(&self) -> String {
-        let mut lines = Vec::new();
+        let mut out = String::new();
 
         if self.line_mode {
             // Line mode: group by (session_id, turn) — unchanged behaviour
@@ -291,29 +292,30 @@ impl OutputFormatter for MessagesReport {
                 let key = (msg.session_id.clone(), msg.turn);
                 if last_header.as_ref() != Some(&key) {
                     if last_header.is_some() {
-                        lines.push(String::new());
+                        out.push('\n');
                     }
-                    lines.push(format!(
+                    let _ = writeln!(
+                        out,
                         "[{}] turn {} ({}, {}){}",
                         id_short, msg.turn, msg.role, ts_display, usage_suffix
-                    ));
+                    );
                     last_header = Some(key);
                 }
                 let line_num = msg.line_num.unwrap_or(0);
                 for (i, ctx) in msg.context_before.iter().enumerate() {
                     let n = line_num - msg.context_before.len() + i;
-                    lines.push(format!("  {:>4}-  {}", n + 1, ctx));
+                    let _ = writeln!(out, "  {:>4}-  {}", n + 1, ctx);
                 }
-                lines.push(format!("  {:>4}:  {}", line_num + 1, msg.text));
+                let _ = writeln!(out, "  {:>4}:  {}", line_num + 1, msg.text);
                 for (i, ctx) in msg.context_after.iter().enumerate() {
-                    lines.push(format!("  {:>4}-  {}", line_num + 1 + i + 1, ctx));
+                    let _ = writeln!(out, "  {:>4}-  {}", line_num + 1 + i + 1, ctx);
                 }
             }
         } else if self.sort_spec.has_timestamp() {
             // Timestamp / flat mode: no session grouping; show session ID inline per message
             for (i, msg) in self.messages.iter().enumerate() {
                 if i > 0 {
-                    lines.push("---".to_string());
+                    out.push_str("---\n");
                 }
                 let id_short = if msg.session_id.len() > 8 {
                     &msg.session_id[..8]
@@ -329,10 +331,11 @@ impl OutputFormatter for MessagesReport {
                 } else {
                     String::new()
                 };
-                lines.push(format!(
+                let _ = writeln!(
+                    out,
                     "[{}] [{}] {}{}  {}",
                     id_short, abbrev, ts_display, usage_suffix, msg.text
-                ));
+                );
             }
         } else {
             // Normal mode: group consecutive messages by session_id
@@ -348,21 +351,21 @@ impl OutputFormatter for MessagesReport {
                 // Emit session header when session changes
                 if last_session.as_deref() != Some(&msg.session_id) {
                     if last_session.is_some() {
-                        lines.push(String::new());
+                        out.push('\n');
                     }
                     let ts = msg.timestamp.as_deref().unwrap_or("?");
                     let date = ts_date(ts);
                     let project = msg.project.as_deref().unwrap_or("");
-                    lines.push(format!("[{}] {}  {}", id_short, project, date));
+                    let _ = writeln!(out, "[{}] {}  {}", id_short, project, date);
                     last_session = Some(msg.session_id.clone());
                     last_date = Some(date.to_owned());
                 } else if msg.sequence_gap {
                     // Gap between separate sequence match groups within the same session
-                    lines.push(String::new());
-                    lines.push("~~~ (gap) ~~~".to_string());
+                    out.push('\n');
+                    out.push_str("~~~ (gap) ~~~\n");
                 } else {
                     // Separator between consecutive messages within the same session
-                    lines.push("---".to_string());
+                    out.push_str("---\n");
                 }
 
                 let ts = msg.timestamp.as_deref().unwrap_or("?");
@@ -380,10 +383,11 @@ impl OutputFormatter for MessagesReport {
                 } else {
                     String::new()
                 };
-                lines.push(format!(
+                let _ = writeln!(
+                    out,
                     "  [{}] {}{}  {}",
                     abbrev, ts_part, usage_suffix, msg.text
-                ));
+                );
             }
         }
 
@@ -404,22 +408,25 @@ impl OutputFormatter for MessagesReport {
         } else {
             String::new()
         };
-        lines.push(format!(
+        let _ = writeln!(
+            out,
             "--- {} messages from {} sessions ({}){} ---",
             self.stats.total_messages,
             self.stats.total_sessions,
             role_summary.join(", "),
             token_summary,
-        ));
+        );
         if let Some(ref t) = self.truncated {
-            lines.push(t.notice());
+            let _ = writeln!(out, "{}", t.notice());
         }
 
-        lines.join("\n")
+        // Every line above ends in a newline; drop the last one.
+        out.pop();
+        out
     }
 
     fn format_pretty(&self) -> String {
-        let mut lines = Vec::new();
+        let mut out = String::new();
 
         if self.line_mode {
             // Line mode: group by (session_id, turn) — unchanged behaviour
@@ -457,30 +464,28 @@ impl OutputFormatter for MessagesReport {
                 let key = (msg.session_id.clone(), msg.turn);
                 if last_header.as_ref() != Some(&key) {
                     if last_header.is_some() {
-                        lines.push(String::new());
+                        out.push('\n');
                     }
-                    lines.push(format!(
+                    let _ = writeln!(
+                        out,
                         "\x1b[33m{}\x1b[0m {} \x1b[90m{}\x1b[0m{}{}",
                         id_short, role_badge, ts_display, project_tag, usage_tag
-                    ));
+                    );
                     last_header = Some(key);
                 }
                 let line_num = msg.line_num.unwrap_or(0);
                 for (i, ctx) in msg.context_before.iter().enumerate() {
                     let n = line_num - msg.context_before.len() + i;
-                    lines.push(format!("  \x1b[90m{:>4}-  {}\x1b[0m", n + 1, ctx));
+                    let _ = writeln!(out, "  \x1b[90m{:>4}-  {}\x1b[0m", n + 1, ctx);
                 }
-                lines.push(format!(
-                    "  \x1b[32m{:>4}\x1b[0m:  {}",
-                    line_num + 1,
-                    msg.text
-                ));
+                let _ = writeln!(out, "  \x1b[32m{:>4}\x1b[0m:  {}", line_num + 1, msg.text);
                 for (i, ctx) in msg.context_after.iter().enumerate() {
-                    lines.push(format!(
+                    let _ = writeln!(
+                        out,
                         "  \x1b[90m{:>4}-  {}\x1b[0m",
                         line_num + 1 + i + 1,
                         ctx
-                    ));
+                    );
                 }
             }
         } else if self.sort_spec.has_timestamp() {
@@ -506,10 +511,11 @@ impl OutputFormatter for MessagesReport {
                 } else {
                     String::new()
                 };
-                lines.push(format!(
+                let _ = writeln!(
+                    out,
                     "\x1b[33m{}\x1b[0m {} \x1b[90m{}\x1b[0m{}  {}",
                     id_short, role_badge, ts_display, usage_tag, msg.text
-                ));
+                );
             }
         } else {
             // Normal mode: group consecutive messages by session_id
@@ -525,15 +531,16 @@ impl OutputFormatter for MessagesReport {
                 // Emit session header when session changes
                 if last_session.as_deref() != Some(&msg.session_id) {
                     if last_session.is_some() {
-                        lines.push(String::new());
+                        out.push('\n');
                     }
                     let ts = msg.timestamp.as_deref().unwrap_or("?");
                     let date = ts_date(ts);
                     let project = msg.project.as_deref().unwrap_or("");
-                    lines.push(format!(
+                    let _ = writeln!(
+                        out,
                         "\x1b[33m[{}]\x1b[0m \x1b[36m{}\x1b[0m  \x1b[90m{}\x1b[0m",
                         id_short, project, date
-                    ));
+                    );
                     last_session = Some(msg.session_id.clone());
                     last_date = Some(date.to_owned());
                 }
@@ -559,10 +566,11 @@ impl OutputFormatter for MessagesReport {
                 } else {
                     String::new()
                 };
-                lines.push(format!(
+                let _ = writeln!(
+                    out,
                     "  {} \x1b[90m{}\x1b[0m{}  {}",
                     role_badge, ts_part, usage_tag, msg.text
-                ));
+                );
             }
         }
 
@@ -583,18 +591,21 @@ impl OutputFormatter for MessagesReport {
         } else {
             String::new()
         };
-        lines.push(format!(
+        let _ = writeln!(
+            out,
             "\x1b[1m--- {} messages from {} sessions ({}){} ---\x1b[0m",
             self.stats.total_messages,
             self.stats.total_sessions,
             role_summary.join(", "),
             token_summary,
-        ));
+        );
         if let Some(ref t) = self.truncated {
-            lines.push(format!("\x1b[90m{}\x1b[0m", t.notice()));
+            let _ = writeln!(out, "\x1b[90m{}\x1b[0m", t.notice());
         }
 
-        lines.join("\n")
+        // Every line above ends in a newline; drop the last one.
+        out.pop();
+        out
     }
 }
 
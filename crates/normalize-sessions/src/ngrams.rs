@@ -1,7 +1,9 @@
 //! N-gram frequency analysis of session message text.
 
 use crate::output::OutputFormatter;
-use crate::sessions::{ContentBlock, FormatRegistry, SessionFile, SessionSource, parse_session};
+use crate::sessions::{
+    ContentBlock, FormatRegistry, Role, SessionFile, SessionSource, parse_session,
+};
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 use std::fmt::Write as _;
@@ -93,30 +95,46 @@ impl OutputFormatter for NgramsReport {
 
 /// Normalize text for n-gram extraction: lowercase, strip punctuation, collapse whitespace.
 fn normalize_text(text: &str) -> String {
-    // Replace punctuation with spaces, lowercase everything
-    text.chars()
-        .map(|c| {
-            if c.is_alphabetic() || c.is_ascii_digit() || c == '\'' {
-                c.to_lowercase().next().unwrap_or(c)
-            } else {
-                ' '
+    // Single pass: punctuation and whitespace runs become one separating space.
+    let mut out = String::with_capacity(text.len());
+    let mut pending_space = false;
+    for c in text.chars() {
+        if c.is_alphabetic() || c.is_ascii_digit() || c == '\'' {
+            if pending_space && !out.is_empty() {
+                out.push(' ');
             }
-        })
-        .collect::<String>()
-        .split_whitespace()
-        .collect::<Vec<_>>()
-        .join(" ")
+            pending_space = false;
+            out.push(c.to_lowercase().next().unwrap_or(c));
+        } else {
+            pending_space = true;
+        }
+    }
+    out
 }
 
 /// Extract n-grams from normalized text and update the frequency map.
 fn extract_ngrams(text: &str, n: usize, counts: &mut HashMap<String, usize>) {
     let words: Vec<&str> = text.split_whitespace().collect();
-    if words.len() < n {
+    if n == 0 || words.len() < n {
         return;
     }
-    for i in 0..=(words.len() - n) {
-        let ngram = words[i..i + n].join(" ");
-        *counts.entry(ngram).or_insert(0) += 1;
+    // Build each window in one reused buffer; only n-grams seen for the first
+    // time are copied into the map.
+    let mut ngram = String::new();
+    for window in words.windows(n) {
+        ngram.clear();
+        for (i, word) in window.iter().enumerate() {
+            if i > 0 {
+                ngram.push(' ');
+            }
+            ngram.push_str(word);
+        }
+        match counts.get_mut(ngram.as_str()) {
+            Some(count) => *count += 1,
+            None => {
+                counts.insert(ngram.clone(), 1);
+            }
+        }
     }
 }
 
@@ -193,9 +211,6 @@ pub fn build_ngrams_report(
         }
     }
 
-    if let Some(ref re) = grep_re {
-        sessions.retain(|s| session_matches_grep(&s.path, re));
-    }
     if let Some(at) = agent_type {
         let at_lower = at.to_lowercase();
         sessions.retain(|s| {
@@ -204,6 +219,9 @@ pub fn build_ngrams_report(
                 .is_some_and(|t| t.to_lowercase() == at_lower)
         });
     }
+    if let Some(ref re) = grep_re {
+        sessions.retain(|s| session_matches_grep(&s.path, re));
+    }
 
     sessions.sort_by_key(|b| std::cmp::Reverse(b.mtime));
     if limit > 0 {
@@ -217,6 +235,9 @@ pub fn build_ngrams_report(
     let mut counts: HashMap<String, usize> = HashMap::new();
     let mut messages_processed = 0usize;
 
+    // Reused across messages: the current message's text blocks joined by spaces.
+    let mut joined = String::new();
+
     for sf in &sessions {
         let Ok(session) = parse_session(&sf.path) else {
             continue;
@@ -224,39 +245,37 @@ pub fn build_ngrams_report(
 
         for turn in &session.turns {
             for msg in &turn.messages {
-                let role_str = msg.role.to_string();
-                match role {
-                    NgramRole::All => {}
-                    NgramRole::Assistant => {
-                        if role_str != "assistant" {
-                            continue;
-                        }
-                    }
-                    NgramRole::User => {
-                        if role_str != "user" {
-                            continue;
-                        }
-                    }
+                let wanted = match role {
+                    NgramRole::All => true,
+                    NgramRole::Assistant => msg.role == Role::Assistant,
+                    NgramRole::User => msg.role == Role::User,
+                };
+                if !wanted {
+                    continue;
                 }
 
                 // Extract text from content blocks (skip tool results/uses for cleaner text)
-                let text: String = msg
-                    .content
-                    .iter()
-                    .filter_map(|c| match c {
-                        ContentBlock::Text { text } => Some(text.as_str()),
-                        ContentBlock::Thinking { text } => Some(text.as_str()),
+                joined.clear();
+                let mut blocks = 0usize;
+                for c in &msg.content {
+                    let block = match c {
+                        ContentBlock::Text { text } => text,
+                        ContentBlock::Thinking { text } => text,
                         // Skip tool calls and results — they contain code/paths, not natural language
-                        ContentBlock::ToolUse { .. } | ContentBlock::ToolResult { .. } => None,
-                    })
-                    .collect::<Vec<_>>()
-                    .join(" ");
+                        ContentBlock::ToolUse { .. } | ContentBlock::ToolResult { .. } => continue,
+                    };
+                    if blocks > 0 {
+                        joined.push(' ');
+                    }
+                    joined.push_str(block);
+                    blocks += 1;
+                }
 
-                if text.is_empty() {
+                if joined.is_empty() {
                     continue;
                 }
 
-                let normalized = normalize_text(&text);
+                let normalized = normalize_text(&joined);
                 extract_ngrams(&normalized, n, &mut counts);
                 messages_processed += 1;
             }
@@ -270,8 +289,15 @@ pub fn build_ngrams_report(
         .into_iter()
         .map(|(ngram, count)| NgramEntry { ngram, count })
         .collect();
-    sorted.sort_by(|a, b| b.count.cmp(&a.count).then_with(|| a.ngram.cmp(&b.ngram)));
-    sorted.truncate(top_k);
+    let by_rank =
+        |a: &NgramEntry, b: &NgramEntry| b.count.cmp(&a.count).then_with(|| a.ngram.cmp(&b.ngram));
+    // Only the top-K are reported: partition them out first so the sort is
+    // O(K log K) instead of sorting every unique n-gram.
+    if sorted.len() > top_k {
+        sorted.select_nth_unstable_by(top_k, by_rank);
+        sorted.truncate(top_k);
+    }
+    sorted.sort_by(by_rank);
 
     Ok(NgramsReport {
         ngrams: sorted,
@@ -280,3 +306,26 @@ pub fn build_ngrams_report(
         total_unique,
     })
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_normalize_text_collapses_punctuation_and_case() {
+        assert_eq!(
+            normalize_text("  Hello, World!!  It's 2 o'clock... "),
+            "hello world it's 2 o'clock"
+        );
+        assert_eq!(normalize_text("--- ?"), "");
+    }
+
+    #[test]
+    fn test_extract_ngrams_counts_repeated_windows() {
+        let mut counts = HashMap::new();
+        extract_ngrams("a b a b", 2, &mut counts);
+        assert_eq!(counts.get("a b"), Some(&2));
+        assert_eq!(counts.get("b a"), Some(&1));
+        assert_eq!(counts.len(), 2);
+    }
+}
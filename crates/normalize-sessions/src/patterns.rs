@@ -391,63 +391,63 @@ fn extract_tool_sequence(
     Some((tools, session.turns.len(), first_user_msg))
 }
 
+/// Transition counts keyed by `(from, to)` state names.
+///
+/// Keys borrow from the tool sequences (and the `"start"`/`"end"` literals),
+/// so counting never allocates a string per transition.
+type TransitionCounts<'a> = HashMap<(&'a str, &'a str), usize>;
+
 /// Build a transition count map from a tool sequence.
 /// Includes "start" -> first tool and last tool -> "end".
-fn build_transition_counts(tools: &[String]) -> HashMap<(String, String), usize> {
-    let mut counts: HashMap<(String, String), usize> = HashMap::new();
+fn build_transition_counts(tools: &[String]) -> TransitionCounts<'_> {
+    let mut counts = TransitionCounts::new();
 
-    if tools.is_empty() {
-        *counts
-            .entry(("start".to_string(), "end".to_string()))
-            .or_insert(0) += 1;
+    let (Some(first), Some(last)) = (tools.first(), tools.last()) else {
+        counts.insert(("start", "end"), 1);
         return counts;
-    }
+    };
 
     // start -> first tool
-    *counts
-        .entry(("start".to_string(), tools[0].clone()))
-        .or_insert(0) += 1;
+    *counts.entry(("start", first.as_str())).or_insert(0) += 1;
 
     // tool -> tool transitions
     for window in tools.windows(2) {
         *counts
-            .entry((window[0].clone(), window[1].clone()))
+            .entry((window[0].as_str(), window[1].as_str()))
             .or_insert(0) += 1;
     }
 
     // last tool -> end
-    *counts
-        .entry((tools[tools.len() - 1].clone(), "end".to_string()))
-        .or_insert(0) += 1;
+    *counts.entry((last.as_str(), "end")).or_insert(0) += 1;
 
     counts
 }
 
 /// Normalize transition counts into probabilities.
-fn normalize_counts(counts: &HashMap<(String, String), usize>) -> TransitionMatrix {
+fn normalize_counts(counts: &TransitionCounts<'_>) -> TransitionMatrix {
     // Collect all states
     let mut states_set = BTreeSet::new();
-    for (from, to) in counts.keys() {
-        states_set.insert(from.clone());
-        states_set.insert(to.clone());
+    for &(from, to) in counts.keys() {
+        states_set.insert(from);
+        states_set.insert(to);
     }
-    let states: Vec<String> = states_set.into_iter().collect();
+    let states: Vec<String> = states_set.into_iter().map(str::to_string).collect();
 
     // Sum outgoing counts per state
-    let mut row_totals: HashMap<String, usize> = HashMap::new();
-    for ((from, _), count) in counts {
-        *row_totals.entry(from.clone()).or_insert(0) += count;
+    let mut row_totals: HashMap<&str, usize> = HashMap::new();
+    for (&(from, _), count) in counts {
+        *row_totals.entry(from).or_insert(0) += count;
     }
 
     // Build probability matrix
     let mut transitions: BTreeMap<String, BTreeMap<String, f64>> = BTreeMap::new();
-    for ((from, to), count) in counts {
+    for (&(from, to), count) in counts {
         let total = row_totals[from] as f64;
         if total > 0.0 {
             transitions
-                .entry(from.clone())
+                .entry(from.to_string())
                 .or_default()
-                .insert(to.clone(), *count as f64 / total);
+                .insert(to.to_string(), *count as f64 / total);
         }
     }
 
@@ -552,9 +552,6 @@ pub fn build_patterns_report(
     if let Some(until) = until_time {
         sessions.retain(|s| s.mtime <= until);
     }
-    if let Some(ref re) = grep_re {
-        sessions.retain(|s| session_matches_grep(&s.path, re));
-    }
     if let Some(at) = agent_type {
         let at_lower = at.to_lowercase();
         sessions.retain(|s| {
@@ -563,6 +560,9 @@ pub fn build_patterns_report(
                 .is_some_and(|t| t.to_lowercase() == at_lower)
         });
     }
+    if let Some(ref re) = grep_re {
+        sessions.retain(|s| session_matches_grep(&s.path, re));
+    }
 
     sessions.sort_by_key(|b| std::cmp::Reverse(b.mtime));
     let total_before_limit = sessions.len();
@@ -584,19 +584,9 @@ pub fn build_patterns_report(
     }
 
     let mut session_data: Vec<SessionData> = Vec::new();
-    let mut population_counts: HashMap<(String, String), usize> = HashMap::new();
 
     for sf in &sessions {
         if let Some((tools, turn_count, first_msg)) = extract_tool_sequence(&sf.path, format_name) {
-            let counts = build_transition_counts(&tools);
-
-            // Accumulate into population counts
-            for ((from, to), count) in &counts {
-                *population_counts
-                    .entry((from.clone(), to.clone()))
-                    .or_insert(0) += count;
-            }
-
             session_data.push(SessionData {
                 path: sf.path.to_string_lossy().to_string(),
                 tools,
@@ -610,6 +600,19 @@ pub fn build_patterns_report(
         return Err("No sessions could be parsed".to_string());
     }
 
+    // Count each session's transitions once; the population counts borrow the
+    // same keys.
+    let session_counts: Vec<TransitionCounts<'_>> = session_data
+        .iter()
+        .map(|sd| build_transition_counts(&sd.tools))
+        .collect();
+    let mut population_counts = TransitionCounts::new();
+    for counts in &session_counts {
+        for (&key, count) in counts {
+            *population_counts.entry(key).or_insert(0) += count;
+        }
+    }
+
     // Build population matrix
     let population_matrix = normalize_counts(&population_counts);
 
@@ -617,9 +620,8 @@ pub fn build_patterns_report(
     let mut per_session = Vec::new();
     let mut outlier_data = Vec::new();
 
-    for sd in &session_data {
-        let counts = build_transition_counts(&sd.tools);
-        let session_matrix = normalize_counts(&counts);
+    for (sd, counts) in session_data.iter().zip(&session_counts) {
+        let session_matrix = normalize_counts(counts);
         let divergence = frobenius_divergence(&population_matrix, &session_matrix);
 
         per_session.push(SessionTransitions {
@@ -95,6 +95,7 @@ async fn api_sessions(State(state): State<Arc<SessionsState>>) -> axum::response
     if sessions_dir.exists()
         && let Ok(entries) = std::fs::read_dir(&sessions_dir)
     {
+        let registry = crate::sessions::FormatRegistry::new();
         for entry in entries.filter_map(|e| e.ok()) {
             let path = entry.path();
             if path.extension().and_then(|e| e.to_str()) == Some("jsonl")
@@ -102,7 +103,7 @@ async fn api_sessions(State(state): State<Arc<SessionsState>>) -> axum::response
                 && let Ok(mtime) = meta.modified()
             {
                 let id = path.file_stem().and_then(|s| s.to_str()).unwrap_or("");
-                let format = crate::sessions::FormatRegistry::new()
+                let format = registry
                     .detect(&path)
                     .map(|f| f.name().to_string())
                     .unwrap_or_else(|| "unknown".to_string());
@@ -140,13 +141,21 @@ async fn api_session(
 
     let content = std::fs::read_to_string(path).map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
 
-    let entries: Vec<serde_json::Value> = content
-        .lines()
-        .filter(|l| !l.trim().is_empty())
-        .filter_map(|l| serde_json::from_str(l).ok())
-        .collect();
-
-    let json = serde_json::to_string(&entries).unwrap_or_else(|_| "[]".to_string());
+    // Each JSONL line is already a serialized JSON value, so splice the valid
+    // lines into an array verbatim. Validating with `IgnoredAny` skips building
+    // a `Value` tree per entry and re-encoding it.
+    let mut json = String::with_capacity(content.len() + 2);
+    json.push('[');
+    for line in content.lines().map(str::trim).filter(|l| !l.is_empty()) {
+        if serde_json::from_str::<serde::de::IgnoredAny>(line).is_err() {
+            continue;
+        }
+        if json.len() > 1 {
+            json.push(',');
+        }
+        json.push_str(line);
+    }
+    json.push(']');
 
     Ok((
         [(axum::http::header::CONTENT_TYPE, "application/json")],
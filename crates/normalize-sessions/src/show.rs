@@ -1,6 +1,6 @@
 //! Show/analyze a specific session.
 
-use super::analyze::{print_session_analysis, print_session_jq, print_sessions_analysis};
+use super::analyze::{print_session_analysis, print_sessions_analysis, print_sessions_jq};
 use super::{resolve_session_paths, resolve_session_paths_literal};
 use crate::output::OutputFormatter;
 use normalize_chat_sessions::{ContentBlock, Role, Session};
@@ -722,14 +722,7 @@ pub fn print_session_show(
 
     // If --jq with multiple sessions, apply to all
     if let Some(jq) = jq_filter {
-        let mut exit_code = 0;
-        for path in &paths {
-            let code = print_session_jq(path, jq);
-            if code != 0 {
-                exit_code = code;
-            }
-        }
-        return exit_code;
+        return print_sessions_jq(&paths, jq);
     }
 
     // If --filter or --grep or --ngrams with message analysis
@@ -798,6 +791,11 @@ fn print_session_filter(
     grep_pattern: Option<&str>,
     errors_only: bool,
 ) -> i32 {
+    use std::io::Write;
+
+    // One locked, buffered writer for the whole dump: a session can hold
+    // thousands of blocks, and `println!` re-locks and flushes per line.
+    let mut out = std::io::BufWriter::new(std::io::stdout().lock());
     let mut shown = 0;
 
     for (turn_idx, turn) in session.turns.iter().enumerate() {
@@ -855,18 +853,20 @@ fn print_session_filter(
                 }
 
                 // Display the matching content
-                println!(
+                let _ = writeln!(
+                    out,
                     "=== Turn {} | {} ===",
                     turn_idx,
                     format_role_and_type(&msg.role, block)
                 );
                 match block {
                     ContentBlock::Text { text } => {
-                        println!("{}", text);
+                        let _ = writeln!(out, "{}", text);
                     }
                     ContentBlock::ToolUse { name, input, .. } => {
-                        println!("Tool: {}", name);
-                        println!(
+                        let _ = writeln!(out, "Tool: {}", name);
+                        let _ = writeln!(
+                            out,
                             "Input: {}",
                             serde_json::to_string_pretty(input)
                                 .unwrap_or_else(|_| format!("{:?}", input))
@@ -876,21 +876,23 @@ fn print_session_filter(
                         content, is_error, ..
                     } => {
                         if *is_error {
-                            println!("[ERROR]");
+                            let _ = writeln!(out, "[ERROR]");
                         }
-                        println!("{}", content);
+                        let _ = writeln!(out, "{}", content);
                     }
                     ContentBlock::Thinking { text } => {
-                        println!("[THINKING]");
-                        println!("{}", text);
+                        let _ = writeln!(out, "[THINKING]");
+                        let _ = writeln!(out, "{}", text);
                     }
                 }
-                println!();
+                let _ = writeln!(out);
                 shown += 1;
             }
         }
     }
 
+    let _ = out.flush();
+
     if shown == 0 {
         eprintln!("No matching messages found");
         return 1;
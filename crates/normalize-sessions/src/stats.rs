@@ -291,11 +291,6 @@ pub fn show_stats_grouped(
         sessions.retain(|s| s.mtime <= until);
     }
 
-    // Apply grep filter if provided
-    if let Some(ref re) = grep_re {
-        sessions.retain(|s| session_matches_grep(&s.path, re));
-    }
-
     // Agent type filtering (case-insensitive match on subagent_type)
     if let Some(at) = agent_type {
         let at_lower = at.to_lowercase();
@@ -306,6 +301,12 @@ pub fn show_stats_grouped(
         });
     }
 
+    // Apply grep filter if provided. It reads each session file, so it runs
+    // after the metadata-only filters have narrowed the set.
+    if let Some(ref re) = grep_re {
+        sessions.retain(|s| session_matches_grep(&s.path, re));
+    }
+
     // Sort by time (newest first) and limit
     sessions.sort_by_key(|b| std::cmp::Reverse(b.mtime));
     let total_before_limit = sessions.len();
@@ -426,9 +427,6 @@ pub fn build_stats_data(
     if let Some(until) = until_time {
         sessions.retain(|s| s.mtime <= until);
     }
-    if let Some(ref re) = grep_re {
-        sessions.retain(|s| session_matches_grep(&s.path, re));
-    }
 
     // Agent type filtering (case-insensitive match on subagent_type)
     if let Some(at) = agent_type {
@@ -440,6 +438,10 @@ pub fn build_stats_data(
         });
     }
 
+    if let Some(ref re) = grep_re {
+        sessions.retain(|s| session_matches_grep(&s.path, re));
+    }
+
     sessions.sort_by_key(|b| std::cmp::Reverse(b.mtime));
     let total_before_limit = sessions.len();
     if limit > 0 {
@@ -814,9 +816,6 @@ pub fn build_repo_stats(
     if let Some(ut) = until_time {
         sessions.retain(|s| s.mtime <= ut);
     }
-    if let Some(ref re) = grep_re {
-        sessions.retain(|s| super::session_matches_grep(&s.path, re));
-    }
     if let Some(at) = agent_type {
         let at_lower = at.to_lowercase();
         sessions.retain(|s| {
@@ -825,6 +824,9 @@ pub fn build_repo_stats(
                 .is_some_and(|t| t.to_lowercase() == at_lower)
         });
     }
+    if let Some(ref re) = grep_re {
+        sessions.retain(|s| super::session_matches_grep(&s.path, re));
+    }
 
     sessions.sort_by_key(|b| std::cmp::Reverse(b.mtime));
     if limit > 0 {
@@ -4,6 +4,7 @@
 //! commits after each `normalize edit` operation, preserving full edit history.
 
 use serde::{Deserialize, Serialize};
+use std::collections::HashSet;
 use std::path::{Path, PathBuf};
 use std::process::Command;
 
@@ -144,6 +145,55 @@ impl Shadow {
         }
     }
 
+    /// Read `<git_ref>:<path>` for every path using one `git cat-file --batch`
+    /// process instead of a `git show` per file.
+    ///
+    /// Returns one entry per input path, in order; `None` means the path does
+    /// not exist at `git_ref`. Fails only if git itself could not be run.
+    fn read_blobs_at(
+        &self,
+        git_ref: &str,
+        paths: &[&str],
+    ) -> std::io::Result<Vec<Option<Vec<u8>>>> {
+        use std::io::Write;
+        use std::process::Stdio;
+
+        if paths.is_empty() {
+            return Ok(Vec::new());
+        }
+
+        let mut child = Command::new("git")
+            .args(["cat-file", "--batch"])
+            .current_dir(&self.worktree)
+            .stdin(Stdio::piped())
+            .stdout(Stdio::piped())
+            .stderr(Stdio::null())
+            .spawn()?;
+
+        let mut request = String::new();
+        for path in paths {
+            request.push_str(git_ref);
+            request.push(':');
+            request.push_str(path);
+            request.push('\n');
+        }
+
+        // Feed requests from a separate thread: git interleaves reading requests
+        // with writing blobs, so writing everything up front could deadlock
+        // once both pipes fill.
+        let stdin = child.stdin.take();
+        let output = std::thread::scope(|scope| {
+            scope.spawn(move || {
+                if let Some(mut stdin) = stdin {
+                    let _ = stdin.write_all(request.as_bytes());
+                }
+            });
+            child.wait_with_output()
+        })?;
+
+        Ok(parse_cat_file_batch(&output.stdout, paths.len()))
+    }
+
     /// Copy a file to the shadow worktree, preserving relative path.
     fn copy_to_worktree(&self, file: &Path) -> Result<PathBuf, ShadowError> {
         let rel_path = file
@@ -189,33 +239,20 @@ impl Shadow {
             }
         }
 
-        // Stage all changes (run in worktree directory)
-        let status = Command::new("git")
-            .args(["add", "-A"])
-            .current_dir(&self.worktree)
-            .status()
-            .map_err(|e| ShadowError::Commit(format!("Failed to stage changes: {}", e)))?;
-
-        if !status.success() {
-            return Err(ShadowError::Commit("git add failed".to_string()));
-        }
-
-        // Check if there are changes to commit
-        let status = Command::new("git")
-            .args(["diff", "--cached", "--quiet"])
-            .current_dir(&self.worktree)
-            .status()
-            .map_err(|e| ShadowError::Commit(format!("Failed to check diff: {}", e)))?;
-
-        if status.success() {
+        // The real repo's HEAD is independent of the shadow worktree, so look it
+        // up while staging instead of after.
+        let (staged, git_head) = std::thread::scope(|scope| {
+            let git_head = scope.spawn(|| self.get_real_git_head());
+            let staged = self.stage_changes();
+            (staged, git_head.join().ok().flatten())
+        });
+        if !staged? {
             // No changes to commit
             return Ok(());
         }
 
         // Build commit message
-        let git_head = self
-            .get_real_git_head()
-            .unwrap_or_else(|| "none".to_string());
+        let git_head = git_head.unwrap_or_else(|| "none".to_string());
         let files_str: Vec<String> = info
             .files
             .iter()
@@ -250,6 +287,29 @@ impl Shadow {
         Ok(())
     }
 
+    /// Stage everything in the worktree. Returns whether anything is staged.
+    fn stage_changes(&self) -> Result<bool, ShadowError> {
+        // Stage all changes (run in worktree directory)
+        let status = Command::new("git")
+            .args(["add", "-A"])
+            .current_dir(&self.worktree)
+            .status()
+            .map_err(|e| ShadowError::Commit(format!("Failed to stage changes: {}", e)))?;
+
+        if !status.success() {
+            return Err(ShadowError::Commit("git add failed".to_string()));
+        }
+
+        // Check if there are changes to commit
+        let status = Command::new("git")
+            .args(["diff", "--cached", "--quiet"])
+            .current_dir(&self.worktree)
+            .status()
+            .map_err(|e| ShadowError::Commit(format!("Failed to check diff: {}", e)))?;
+
+        Ok(!status.success())
+    }
+
     /// Get history of shadow edits.
     /// Returns list of edits in reverse chronological order (newest first).
     pub fn history(&self, file_filter: Option<&str>, limit: usize) -> Vec<HistoryEntry> {
@@ -281,8 +341,7 @@ impl Shadow {
             _ => return Vec::new(),
         };
 
-        let stdout = String::from_utf8_lossy(&output.stdout);
-        let mut entries = Vec::new();
+        let stdout = output_to_string(output.stdout);
 
         // Split by record separator (0x1e)
         let blocks: Vec<&str> = stdout
@@ -290,18 +349,16 @@ impl Shadow {
             .filter(|b| !b.trim().is_empty())
             .collect();
         let total = blocks.len();
+        let mut entries = Vec::with_capacity(total);
 
         for (idx, block) in blocks.into_iter().enumerate() {
             // Parse the commit format: hash\x1fsubject\x1fbody\x1ftimestamp
-            let parts: Vec<&str> = block.split('\x1f').collect();
-            if parts.len() < 4 {
+            let mut parts = block.splitn(4, '\x1f').map(str::trim);
+            let (Some(hash), Some(subject), Some(body), Some(timestamp)) =
+                (parts.next(), parts.next(), parts.next(), parts.next())
+            else {
                 continue;
-            }
-
-            let hash = parts[0].trim();
-            let subject = parts[1].trim();
-            let body = parts[2].trim();
-            let timestamp = parts[3].trim();
+            };
 
             // Parse body for structured fields
             let mut operation = String::new();
@@ -357,7 +414,7 @@ impl Shadow {
             .ok()?;
 
         if output.status.success() {
-            Some(String::from_utf8_lossy(&output.stdout).to_string())
+            Some(output_to_string(output.stdout))
         } else {
             None
         }
@@ -383,7 +440,7 @@ impl Shadow {
             .ok()?;
 
         if output.status.success() {
-            Some(String::from_utf8_lossy(&output.stdout).to_string())
+            Some(output_to_string(output.stdout))
         } else {
             None
         }
@@ -393,8 +450,21 @@ impl Shadow {
     pub fn checkpoint(&self) -> Option<String> {
         self.history(None, 1)
             .first()
-            .map(|e| e.git_head.clone())
-            .filter(|h| h != "none")
+            .and_then(Self::entry_checkpoint)
+    }
+
+    /// Like [`Shadow::checkpoint`], but reads it from an unfiltered, newest-first
+    /// history listing the caller already has instead of running `git log`
+    /// again. Falls back to querying git when `entries` is empty.
+    pub fn checkpoint_from(&self, entries: &[HistoryEntry]) -> Option<String> {
+        match entries.first() {
+            Some(latest) => Self::entry_checkpoint(latest),
+            None => self.checkpoint(),
+        }
+    }
+
+    fn entry_checkpoint(entry: &HistoryEntry) -> Option<String> {
+        Some(entry.git_head.clone()).filter(|h| h != "none")
     }
 
     /// Run a validation command in the shadow worktree.
@@ -417,8 +487,8 @@ impl Shadow {
         Ok(ValidationResult {
             success: output.status.success(),
             exit_code: output.status.code(),
-            stdout: String::from_utf8_lossy(&output.stdout).to_string(),
-            stderr: String::from_utf8_lossy(&output.stderr).to_string(),
+            stdout: output_to_string(output.stdout),
+            stderr: output_to_string(output.stderr),
         })
     }
 
@@ -713,29 +783,29 @@ impl Shadow {
     /// Restore a set of files from a given git ref into both the real root and the worktree.
     /// Files that don't exist at `git_ref` are deleted; files that do are written.
     fn restore_files_from_ref(&self, files: &[String], git_ref: &str) -> Result<(), ShadowError> {
-        for file_path in files {
+        let paths: Vec<&str> = files.iter().map(String::as_str).collect();
+        let blobs = self
+            .read_blobs_at(git_ref, &paths)
+            .map_err(|e| ShadowError::Undo(format!("Failed to read shadow history: {}", e)))?;
+
+        for (file_path, blob) in files.iter().zip(blobs) {
             let worktree_file = self.worktree.join(file_path);
             let actual_file = self.root.join(file_path);
 
-            let show_output = Command::new("git")
-                .args(["show", &format!("{}:{}", git_ref, file_path)])
-                .current_dir(&self.worktree)
-                .output();
-
-            match show_output {
-                Ok(output) if output.status.success() => {
+            match blob {
+                Some(content) => {
                     if let Some(parent) = actual_file.parent() {
                         let _ = std::fs::create_dir_all(parent);
                     }
-                    std::fs::write(&actual_file, &output.stdout).map_err(|e| {
+                    std::fs::write(&actual_file, &content).map_err(|e| {
                         ShadowError::Undo(format!("Failed to write {}: {}", file_path, e))
                     })?;
                     if let Some(parent) = worktree_file.parent() {
                         let _ = std::fs::create_dir_all(parent);
                     }
-                    let _ = std::fs::write(&worktree_file, &output.stdout);
+                    let _ = std::fs::write(&worktree_file, &content);
                 }
-                _ => {
+                None => {
                     if actual_file.exists() {
                         std::fs::remove_file(&actual_file).map_err(|e| {
                             ShadowError::Undo(format!("Failed to delete {}: {}", file_path, e))
@@ -753,35 +823,42 @@ impl Shadow {
     fn detect_conflicts(&self, entries: &[HistoryEntry]) -> Vec<String> {
         let mut conflicts = Vec::new();
 
-        for entry in entries {
-            for file_path in &entry.files {
-                let actual_file = self.root.join(file_path);
-
-                // Get expected content from shadow git HEAD
-                let show_output = Command::new("git")
-                    .args(["show", &format!("HEAD:{}", file_path)])
-                    .current_dir(&self.worktree)
-                    .output();
-
-                match show_output {
-                    Ok(output) if output.status.success() => {
-                        // File exists in shadow - compare with actual
-                        if actual_file.exists() {
-                            if let Ok(actual_content) = std::fs::read(&actual_file)
-                                && actual_content != output.stdout
-                            {
-                                conflicts.push(file_path.clone());
-                            }
-                        } else {
-                            // File was deleted externally
-                            conflicts.push(file_path.clone());
+        // Undoing several edits usually touches the same files repeatedly; each
+        // file only needs comparing (and reporting) once.
+        let mut seen = HashSet::new();
+        let paths: Vec<&str> = entries
+            .iter()
+            .flat_map(|entry| entry.files.iter().map(String::as_str))
+            .filter(|path| seen.insert(*path))
+            .collect();
+
+        // Get expected content from shadow git HEAD. If git can't run at all,
+        // there is nothing to compare against, so report no conflicts.
+        let Ok(blobs) = self.read_blobs_at("HEAD", &paths) else {
+            return conflicts;
+        };
+
+        for (file_path, blob) in paths.into_iter().zip(blobs) {
+            let actual_file = self.root.join(file_path);
+
+            match blob {
+                Some(expected) => {
+                    // File exists in shadow - compare with actual
+                    if actual_file.exists() {
+                        if let Ok(actual_content) = std::fs::read(&actual_file)
+                            && actual_content != expected
+                        {
+                            conflicts.push(file_path.to_string());
                         }
+                    } else {
+                        // File was deleted externally
+                        conflicts.push(file_path.to_string());
                     }
-                    _ => {
-                        // File doesn't exist in shadow but might exist on disk
-                        if actual_file.exists() {
-                            conflicts.push(file_path.clone());
-                        }
+                }
+                None => {
+                    // File doesn't exist in shadow but might exist on disk
+                    if actual_file.exists() {
+                        conflicts.push(file_path.to_string());
                     }
                 }
             }
@@ -900,47 +977,35 @@ impl Shadow {
             return Err(ShadowError::Undo("No shadow history exists".to_string()));
         }
 
-        // Resolve the ref to a full commit hash
-        let rev_parse = Command::new("git")
-            .args(["rev-parse", ref_str])
+        // Resolve the ref, its subject and the files it touched in one query:
+        // the first line is `<hash>\x1f<subject>`, followed by the file names.
+        let show = Command::new("git")
+            .args([
+                "show",
+                "--format=%H%x1f%s",
+                "--name-only",
+                &format!("{}^{{commit}}", ref_str),
+            ])
             .current_dir(&self.worktree)
             .output()
             .map_err(|e| ShadowError::Undo(format!("Failed to resolve ref: {}", e)))?;
 
-        if !rev_parse.status.success() {
+        if !show.status.success() {
             return Err(ShadowError::Undo(format!(
                 "Invalid ref '{}': not found in shadow history",
                 ref_str
             )));
         }
 
-        let target_hash = String::from_utf8_lossy(&rev_parse.stdout)
-            .trim()
-            .to_string();
-
-        // Get files changed in the target commit
-        let files_output = Command::new("git")
-            .args(["show", "--format=", "--name-only", &target_hash])
-            .current_dir(&self.worktree)
-            .output()
-            .map_err(|e| ShadowError::Undo(format!("Failed to get files: {}", e)))?;
+        let show_text = String::from_utf8_lossy(&show.stdout);
+        let mut lines = show_text.lines();
+        let (target_hash, description) = lines
+            .next()
+            .and_then(|header| header.split_once('\x1f'))
+            .map(|(hash, subject)| (hash.to_string(), subject.trim().to_string()))
+            .ok_or_else(|| ShadowError::Undo(format!("Failed to resolve ref '{}'", ref_str)))?;
 
-        let files: Vec<String> = String::from_utf8_lossy(&files_output.stdout)
-            .lines()
-            .filter(|l| !l.is_empty())
-            .map(String::from)
-            .collect();
-
-        // Get the commit message for description
-        let log_output = Command::new("git")
-            .args(["log", "-1", "--format=%s", &target_hash])
-            .current_dir(&self.worktree)
-            .output()
-            .map_err(|e| ShadowError::Undo(format!("Failed to get log: {}", e)))?;
-
-        let description = String::from_utf8_lossy(&log_output.stdout)
-            .trim()
-            .to_string();
+        let files: Vec<String> = lines.filter(|l| !l.is_empty()).map(String::from).collect();
 
         if dry_run {
             return Ok(UndoResult {
@@ -977,39 +1042,7 @@ impl Shadow {
         }
 
         // Restore files from target commit state
-        for file_path in &files {
-            let worktree_file = self.worktree.join(file_path);
-            let actual_file = self.root.join(file_path);
-
-            let show_output = Command::new("git")
-                .args(["show", &format!("{}:{}", target_hash, file_path)])
-                .current_dir(&self.worktree)
-                .output();
-
-            match show_output {
-                Ok(output) if output.status.success() => {
-                    if let Some(parent) = actual_file.parent() {
-                        let _ = std::fs::create_dir_all(parent);
-                    }
-                    std::fs::write(&actual_file, &output.stdout).map_err(|e| {
-                        ShadowError::Undo(format!("Failed to write {}: {}", file_path, e))
-                    })?;
-                    if let Some(parent) = worktree_file.parent() {
-                        let _ = std::fs::create_dir_all(parent);
-                    }
-                    let _ = std::fs::write(&worktree_file, &output.stdout);
-                }
-                _ => {
-                    // File doesn't exist in target commit
-                    if actual_file.exists() {
-                        std::fs::remove_file(&actual_file).map_err(|e| {
-                            ShadowError::Undo(format!("Failed to delete {}: {}", file_path, e))
-                        })?;
-                    }
-                    let _ = std::fs::remove_file(&worktree_file);
-                }
-            }
-        }
+        self.restore_files_from_ref(&files, &target_hash)?;
 
         // Stage and commit the goto
         let add_status = Command::new("git")
@@ -1053,6 +1086,46 @@ impl Shadow {
     }
 }
 
+/// Convert captured process output to a `String`, reusing the buffer.
+///
+/// Diffs and validator logs can be large; `from_utf8_lossy(..).to_string()`
+/// copies them even when they are valid UTF-8, which is the common case.
+fn output_to_string(bytes: Vec<u8>) -> String {
+    String::from_utf8(bytes).unwrap_or_else(|e| String::from_utf8_lossy(e.as_bytes()).into_owned())
+}
+
+/// Split `git cat-file --batch` output into one blob per requested object.
+///
+/// Each response is either `<oid> <type> <size>\n<content>\n` or a single
+/// `<object> missing` / `<object> ambiguous` line, which maps to `None`.
+/// Missing trailing responses (e.g. git exited early) are also `None`.
+fn parse_cat_file_batch(mut out: &[u8], count: usize) -> Vec<Option<Vec<u8>>> {
+    let mut blobs = Vec::with_capacity(count);
+    while blobs.len() < count {
+        let Some(eol) = out.iter().position(|&b| b == b'\n') else {
+            break;
+        };
+        let header = &out[..eol];
+        out = &out[eol + 1..];
+
+        let size = header
+            .rsplit(|&b| b == b' ')
+            .next()
+            .and_then(|s| std::str::from_utf8(s).ok())
+            .and_then(|s| s.parse::<usize>().ok());
+        match size {
+            Some(size) if size <= out.len() => {
+                blobs.push(Some(out[..size].to_vec()));
+                // Skip the content and its trailing newline.
+                out = out.get(size + 1..).unwrap_or_default();
+            }
+            _ => blobs.push(None),
+        }
+    }
+    blobs.resize(count, None);
+    blobs
+}
+
 /// Result of an undo operation.
 pub struct UndoResult {
     /// Files that were modified by the undo
@@ -1143,4 +1216,56 @@ mod tests {
 
         assert_eq!(shadow.edit_count(), 1);
     }
+
+    #[test]
+    fn test_detect_conflicts_reports_each_file_once() {
+        // normalize-syntax-allow: rust/unwrap-in-impl - test code, panic is appropriate
+        let dir = TempDir::new().unwrap();
+        let test_file = dir.path().join("test.rs");
+        let shadow = Shadow::new(dir.path());
+
+        for (before, after) in [("fn a() {}", "fn b() {}"), ("fn b() {}", "fn c() {}")] {
+            // normalize-syntax-allow: rust/unwrap-in-impl - test code, panic is appropriate
+            std::fs::write(&test_file, before).unwrap();
+            // normalize-syntax-allow: rust/unwrap-in-impl - test code, panic is appropriate
+            shadow.before_edit(&[&test_file]).unwrap();
+            // normalize-syntax-allow: rust/unwrap-in-impl - test code, panic is appropriate
+            std::fs::write(&test_file, after).unwrap();
+            let info = EditInfo {
+                operation: "replace".to_string(),
+                target: "test.rs".to_string(),
+                files: vec![test_file.clone()],
+                message: None,
+                workflow: None,
+            };
+            // normalize-syntax-allow: rust/unwrap-in-impl - test code, panic is appropriate
+            shadow.after_edit(&info).unwrap();
+        }
+
+        // Modify externally after both edits
+        // normalize-syntax-allow: rust/unwrap-in-impl - test code, panic is appropriate
+        std::fs::write(&test_file, "fn external() {}").unwrap();
+
+        let entries = shadow.history(None, 2);
+        assert_eq!(entries.len(), 2);
+        assert_eq!(
+            shadow.detect_conflicts(&entries),
+            vec!["test.rs".to_string()]
+        );
+    }
+
+    #[test]
+    fn test_output_to_string_replaces_invalid_utf8() {
+        assert_eq!(output_to_string(b"diff --git".to_vec()), "diff --git");
+        assert_eq!(output_to_string(b"a\xffb".to_vec()), "a\u{fffd}b");
+    }
+
+    #[test]
+    fn test_parse_cat_file_batch() {
+        let out = b"abc123 blob 5\nhello\nHEAD:gone.rs missing\ndef456 blob 0\n\n";
+        assert_eq!(
+            parse_cat_file_batch(out, 4),
+            vec![Some(b"hello".to_vec()), None, Some(Vec::new()), None]
+        );
+    }
 }
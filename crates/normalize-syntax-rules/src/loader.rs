@@ -8,6 +8,7 @@
 use crate::builtin::BUILTIN_RULES;
 use crate::{Rule, Severity};
 use glob::Pattern;
+use normalize_rules_config::{frontmatter_globs, frontmatter_strings};
 use std::collections::HashMap;
 use std::path::{Path, PathBuf};
 
@@ -166,8 +167,8 @@ pub fn parse_rule_content(content: &str, default_id: &str, is_builtin: bool) ->
         if text.is_empty() { None } else { Some(text) }
     };
 
-    let frontmatter: toml::Value = if frontmatter_str.is_empty() {
-        toml::Value::Table(toml::map::Map::new())
+    let frontmatter: toml::Table = if frontmatter_str.is_empty() {
+        toml::Table::new()
     } else {
         match toml::from_str(&frontmatter_str) {
             Ok(v) => v,
@@ -178,116 +179,58 @@ pub fn parse_rule_content(content: &str, default_id: &str, is_builtin: bool) ->
         }
     };
 
-    let id = frontmatter
-        .get("id")
-        .and_then(|v| v.as_str())
-        .map(|s| s.to_string())
-        .unwrap_or_else(|| default_id.to_string());
-
-    let severity = frontmatter
-        .get("severity")
-        .and_then(|v| v.as_str())
-        .and_then(|s| s.parse().ok())
-        .unwrap_or(Severity::Warning);
-
-    let message = frontmatter
-        .get("message")
-        .and_then(|v| v.as_str())
-        .unwrap_or("Rule violation")
-        .to_string();
-
-    let allow: Vec<Pattern> = frontmatter
-        .get("allow")
-        .and_then(|v| v.as_array())
-        .map(|arr| {
-            arr.iter()
-                .filter_map(|v| v.as_str())
-                .filter_map(|s| Pattern::new(s).ok())
-                .collect()
-        })
-        .unwrap_or_default();
-
-    let files: Vec<Pattern> = frontmatter
-        .get("files")
-        .and_then(|v| v.as_array())
-        .map(|arr| {
-            arr.iter()
-                .filter_map(|v| v.as_str())
-                .filter_map(|s| Pattern::new(s).ok())
-                .collect()
-        })
-        .unwrap_or_default();
-
-    let languages: Vec<String> = frontmatter
-        .get("languages")
-        .and_then(|v| v.as_array())
-        .map(|arr| {
-            arr.iter()
-                .filter_map(|v| v.as_str())
-                .map(|s| s.to_string())
-                .collect()
-        })
-        .unwrap_or_default();
-
-    let enabled = frontmatter
-        .get("enabled")
-        .and_then(|v| v.as_bool())
-        .unwrap_or(true);
-
-    let requires: HashMap<String, String> = frontmatter
-        .get("requires")
-        .and_then(|v| v.as_table())
-        .map(|tbl| {
-            tbl.iter()
-                .filter_map(|(k, v)| v.as_str().map(|s| (k.clone(), s.to_string())))
-                .collect()
-        })
-        .unwrap_or_default();
-
-    let fix = frontmatter
-        .get("fix")
-        .and_then(|v| v.as_str())
-        .map(|s| s.to_string());
-
-    let tags: Vec<String> = frontmatter
-        .get("tags")
-        .and_then(|v| v.as_array())
-        .map(|arr| {
-            arr.iter()
-                .filter_map(|v| v.as_str())
-                .map(|s| s.to_string())
-                .collect()
-        })
-        .unwrap_or_default();
-
-    let recommended = frontmatter
-        .get("recommended")
-        .and_then(|v| v.as_bool())
-        .unwrap_or(false);
-
-    let applies_in_tests = frontmatter
-        .get("applies_in_tests")
-        .and_then(|v| v.as_bool())
-        .unwrap_or(false);
-
-    Some(Rule {
-        id,
+    let mut rule = Rule {
+        id: default_id.to_string(),
         query_str: query_str.trim().to_string(),
-        severity,
-        message,
-        allow,
-        files,
+        severity: Severity::Warning,
+        message: "Rule violation".to_string(),
+        allow: Vec::new(),
+        files: Vec::new(),
         source_path: PathBuf::new(),
-        languages,
-        enabled,
+        languages: Vec::new(),
+        enabled: true,
         builtin: is_builtin,
-        requires,
-        fix,
-        tags,
+        requires: HashMap::new(),
+        fix: None,
+        tags: Vec::new(),
         doc,
-        recommended,
-        applies_in_tests,
-    })
+        recommended: false,
+        applies_in_tests: false,
+    };
+
+    // One pass over the keys that are present, moving values out of the table;
+    // keys with an unexpected type are ignored and keep their default.
+    for (key, value) in frontmatter {
+        match (key.as_str(), value) {
+            ("id", toml::Value::String(s)) => rule.id = s,
+            ("severity", toml::Value::String(s)) => {
+                if let Ok(severity) = s.parse() {
+                    rule.severity = severity;
+                }
+            }
+            ("message", toml::Value::String(s)) => rule.message = s,
+            ("allow", toml::Value::Array(arr)) => rule.allow = frontmatter_globs(arr),
+            ("files", toml::Value::Array(arr)) => rule.files = frontmatter_globs(arr),
+            ("languages", toml::Value::Array(arr)) => rule.languages = frontmatter_strings(arr),
+            ("enabled", toml::Value::Boolean(b)) => rule.enabled = b,
+            ("requires", toml::Value::Table(tbl)) => {
+                rule.requires = tbl
+                    .into_iter()
+                    .filter_map(|(k, v)| match v {
+                        toml::Value::String(s) => Some((k, s)),
+                        _ => None,
+                    })
+                    .collect();
+            }
+            ("fix", toml::Value::String(s)) => rule.fix = Some(s),
+            ("tags", toml::Value::Array(arr)) => rule.tags = frontmatter_strings(arr),
+            ("recommended", toml::Value::Boolean(b)) => rule.recommended = b,
+            ("applies_in_tests", toml::Value::Boolean(b)) => rule.applies_in_tests = b,
+            _ => {}
+        }
+    }
+
+    Some(rule)
 }
 
 #[cfg(test)]
@@ -5,8 +5,9 @@
 
 use crate::evaluate_predicates;
 use normalize_languages::ast_grep::DynLang;
-use std::collections::HashMap;
+use std::collections::{HashMap, VecDeque};
 use std::path::{Path, PathBuf};
+use std::sync::{Arc, Mutex, OnceLock};
 use streaming_iterator::StreamingIterator;
 
 /// Match result from either pattern type.
@@ -96,6 +97,57 @@ mod tests {
     }
 }
 
+/// How many compiled S-expression queries [`compiled_sexp_query`] keeps.
+const SEXP_QUERY_CACHE_CAPACITY: usize = 64;
+
+/// A compiled S-expression query and the grammar and source it came from.
+struct CachedQuery {
+    grammar_name: String,
+    query_str: String,
+    query: Arc<tree_sitter::Query>,
+}
+
+/// Recently compiled S-expression queries, least recently used first.
+static SEXP_QUERY_CACHE: OnceLock<Mutex<VecDeque<CachedQuery>>> = OnceLock::new();
+
+/// Compile `query_str` for `grammar`, reusing a previous compile of the same
+/// query for the same grammar. A query run over every file of a grammar is
+/// compiled once instead of once per file. Failed compiles are not cached.
+fn compiled_sexp_query(
+    grammar: &tree_sitter::Language,
+    grammar_name: &str,
+    query_str: &str,
+) -> Result<Arc<tree_sitter::Query>, String> {
+    let cache = SEXP_QUERY_CACHE.get_or_init(|| Mutex::new(VecDeque::new()));
+    {
+        let mut cache = cache.lock().unwrap_or_else(|e| e.into_inner());
+        if let Some(i) = cache
+            .iter()
+            .position(|c| c.grammar_name == grammar_name && c.query_str == query_str)
+            && let Some(hit) = cache.remove(i)
+        {
+            // Move to the back so the most recently used entry is evicted last.
+            let query = Arc::clone(&hit.query);
+            cache.push_back(hit);
+            return Ok(query);
+        }
+    }
+
+    let query = Arc::new(
+        tree_sitter::Query::new(grammar, query_str).map_err(|e| format!("Invalid query: {}", e))?,
+    );
+    let mut cache = cache.lock().unwrap_or_else(|e| e.into_inner());
+    if cache.len() >= SEXP_QUERY_CACHE_CAPACITY {
+        cache.pop_front();
+    }
+    cache.push_back(CachedQuery {
+        grammar_name: grammar_name.to_string(),
+        query_str: query_str.to_string(),
+        query: Arc::clone(&query),
+    });
+    Ok(query)
+}
+
 /// Run a tree-sitter S-expression query against a single file's content.
 ///
 /// Returns one `MatchResult` per capture per match.
@@ -115,8 +167,7 @@ pub fn run_sexp_query(
         .parse(content, None)
         .ok_or_else(|| "Failed to parse file".to_string())?;
 
-    let query =
-        tree_sitter::Query::new(grammar, query_str).map_err(|e| format!("Invalid query: {}", e))?;
+    let query = compiled_sexp_query(grammar, grammar_name, query_str)?;
 
     let mut cursor = tree_sitter::QueryCursor::new();
     let mut matches_iter = cursor.matches(&query, tree.root_node(), content.as_bytes());
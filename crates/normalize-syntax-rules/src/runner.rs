@@ -814,7 +814,9 @@ pub fn run_rules(
             let Ok(content) = std::fs::read_to_string(file) else {
                 continue;
             };
-            let Some(tree) = parser.parse(&content, None) else {
+            // Files edited between runs (e.g. under the daemon) re-parse
+            // incrementally against their previous tree.
+            let Some(tree) = loader.reparse(&mut parser, file, &content) else {
                 continue;
             };
 
@@ -935,7 +937,7 @@ fn eval_match(
         tree_sitter::QueryPredicateArg::String(s) => s.as_ref(),
         _ => return None,
     };
-    let regex = regex::Regex::new(pattern).ok()?;
+    let regex = normalize_languages::query_predicates::compiled_regex(pattern)?;
     let matched = regex.is_match(capture_text);
     Some(if negated { !matched } else { matched })
 }
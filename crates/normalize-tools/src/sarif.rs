@@ -249,22 +249,23 @@ impl SarifReport {
                 let results = diags
                     .iter()
                     .map(|d| {
+                        // Format the path once; it's shared by the location and any fix.
+                        let uri = d.location.file.display().to_string();
+                        let region = SarifRegion {
+                            start_line: d.location.line,
+                            start_column: d.location.column,
+                            end_line: d.location.end_line,
+                            end_column: d.location.end_column,
+                        };
                         let fixes = if let Some(fix) = &d.fix {
                             vec![SarifFix {
                                 description: SarifMessage {
                                     text: fix.description.clone(),
                                 },
                                 artifact_changes: vec![SarifArtifactChange {
-                                    artifact_location: SarifArtifactLocation {
-                                        uri: d.location.file.display().to_string(),
-                                    },
+                                    artifact_location: SarifArtifactLocation { uri: uri.clone() },
                                     replacements: vec![SarifReplacement {
-                                        deleted_region: SarifRegion {
-                                            start_line: d.location.line,
-                                            start_column: d.location.column,
-                                            end_line: d.location.end_line,
-                                            end_column: d.location.end_column,
-                                        },
+                                        deleted_region: region.clone(),
                                         inserted_content: SarifContent {
                                             text: fix.replacement.clone(),
                                         },
@@ -283,15 +284,8 @@ impl SarifReport {
                             },
                             locations: vec![SarifLocation {
                                 physical_location: SarifPhysicalLocation {
-                                    artifact_location: SarifArtifactLocation {
-                                        uri: d.location.file.display().to_string(),
-                                    },
-                                    region: SarifRegion {
-                                        start_line: d.location.line,
-                                        start_column: d.location.column,
-                                        end_line: d.location.end_line,
-                                        end_column: d.location.end_column,
-                                    },
+                                    artifact_location: SarifArtifactLocation { uri },
+                                    region,
                                 },
                             }],
                             fixes,
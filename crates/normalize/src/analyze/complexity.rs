@@ -5,7 +5,7 @@
 
 use crate::output::{OutputFormatter, tier_color};
 use crate::parsers;
-use normalize_facts::extract::compute_complexity;
+use normalize_facts::extract::compute_complexities;
 use normalize_languages::{Language, support_for_path};
 use normalize_rank::ranked::{Column, RankEntry, RiskTier, format_ranked_table};
 use serde::Serialize;
@@ -310,9 +310,10 @@ impl ComplexityAnalyzer {
     /// Collect function complexity data using a tags query.
     ///
     /// Runs the tags query to find `@definition.function` and `@definition.method`
-    /// nodes, computes complexity for each via `normalize_facts::extract::compute_complexity`
-    /// (which handles the `.complexity.scm` query internally), and reconstructs parent
-    /// names via line-range containment.
+    /// nodes, computes their complexity in one pass via
+    /// `normalize_facts::extract::compute_complexities` (which handles the
+    /// `.complexity.scm` query internally), and reconstructs parent names via
+    /// line-range containment.
     fn collect_functions_from_tags(
         &self,
         tree: &tree_sitter::Tree,
@@ -382,6 +383,7 @@ impl ComplexityAnalyzer {
         };
 
         let mut functions = Vec::new();
+        let mut function_nodes = Vec::new();
 
         for i in 0..tag_nodes.len() {
             let tn = &tag_nodes[i];
@@ -412,11 +414,10 @@ impl ComplexityAnalyzer {
                 None => continue,
             };
 
-            let complexity = compute_complexity(&tn.node, support, content.as_bytes());
-
+            function_nodes.push(tn.node);
             functions.push(FunctionComplexity {
                 name,
-                complexity,
+                complexity: 1,
                 start_line: fn_start,
                 end_line: fn_end,
                 parent: parent_name,
@@ -425,6 +426,12 @@ impl ComplexityAnalyzer {
             });
         }
 
+        let complexities =
+            compute_complexities(&root, &function_nodes, support, content.as_bytes());
+        for (function, complexity) in functions.iter_mut().zip(complexities) {
+            function.complexity = complexity;
+        }
+
         functions
     }
 }
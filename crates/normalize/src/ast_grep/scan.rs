@@ -208,18 +208,20 @@ impl PathWorker for ScanWithConfig {
             return Ok(vec![]);
         };
         let items = crate::ast_grep::utils::filter_file_rule(path, lang)?;
+        // Every item (the file plus its injected languages) shares the same
+        // path: resolve it once rather than per item.
+        let abs_path = path.canonicalize()?;
+        let normalized_path = abs_path.strip_prefix(&self.proj_dir).unwrap_or(path);
+        let interactive = self.arg.output.needs_interactive();
         let mut error_count = 0usize;
         let mut ret = vec![];
         for grep in items {
             let file_content = grep.source();
-            let abs_path = path.canonicalize()?;
-            let normalized_path = abs_path.strip_prefix(&self.proj_dir).unwrap_or(path);
             let rules = self
                 .configs
                 .get_rule_from_lang(normalized_path, grep.lang().clone());
             let mut combined = CombinedScan::new(rules);
             combined.set_unused_suppression_rule(&self.unused_suppression_rule);
-            let interactive = self.arg.output.needs_interactive();
             let scanned = combined.scan(&grep, interactive);
             if interactive {
                 let diffs = scanned.diffs;
@@ -1,16 +1,30 @@
 //! AST inspection for syntax rule authoring.
 
+use crate::tree::walk_with_fields;
+
 pub fn node_to_json(node: tree_sitter::Node, source: &str) -> serde_json::Value {
-    node_to_json_depth(node, source, -1, 0)
+    node_to_json_depth(node, source, -1, 0, false)
+}
+
+/// Number of children shown for `node`: all of them, or only named ones.
+fn shown_child_count(node: tree_sitter::Node, named_only: bool) -> usize {
+    if named_only {
+        node.named_child_count()
+    } else {
+        node.child_count()
+    }
 }
 
 /// Build a JSON representation of the tree, stopping at `max_depth` levels.
 /// `max_depth` of -1 means unlimited; 0 means root only (no children).
+/// With `named_only`, anonymous nodes (punctuation, keywords) are left out and
+/// never converted.
 pub fn node_to_json_depth(
     node: tree_sitter::Node,
     source: &str,
     max_depth: i32,
     current_depth: i32,
+    named_only: bool,
 ) -> serde_json::Value {
     let mut obj = serde_json::json!({
         "kind": node.kind(),
@@ -24,21 +38,26 @@ pub fn node_to_json_depth(
         }
     });
 
-    if node.child_count() == 0 {
+    let child_count = shown_child_count(node, named_only);
+    if child_count == 0 {
         obj["text"] = serde_json::json!(node.utf8_text(source.as_bytes()).unwrap_or(""));
     } else if max_depth >= 0 && current_depth >= max_depth {
         // Depth limit reached — mark children as truncated
         obj["truncated"] = serde_json::json!(true);
-        obj["child_count"] = serde_json::json!(node.child_count());
+        obj["child_count"] = serde_json::json!(child_count);
     } else {
-        let mut children = Vec::new();
+        let mut children = Vec::with_capacity(child_count);
         let mut cursor = node.walk();
         for child in node.children(&mut cursor) {
+            if named_only && !child.is_named() {
+                continue;
+            }
             children.push(node_to_json_depth(
                 child,
                 source,
                 max_depth,
                 current_depth + 1,
+                named_only,
             ));
         }
         obj["children"] = serde_json::json!(children);
@@ -47,127 +66,125 @@ pub fn node_to_json_depth(
     obj
 }
 
+/// Append `depth` levels of two-space indentation and an optional `field: ` label.
+fn push_line_prefix(buf: &mut String, depth: usize, field: Option<&str>) {
+    for _ in 0..depth {
+        buf.push_str("  ");
+    }
+    if let Some(field) = field {
+        buf.push_str(field);
+        buf.push_str(": ");
+    }
+}
+
 /// Build a compact outline of the tree (node type + field name, no source text).
-/// When `max_depth` >= 0, stops at that many levels deep.
+/// When `max_depth` >= 0, stops at that many levels deep. With `named_only`,
+/// anonymous nodes are skipped.
 pub fn tree_to_outline(
     node: tree_sitter::Node,
     max_depth: i32,
     current_depth: i32,
+    named_only: bool,
     buf: &mut String,
 ) {
-    let prefix = "  ".repeat(current_depth as usize);
-    let kind = node.kind();
-    let start = node.start_position();
-    let end = node.end_position();
-
-    let field_info = if let Some(parent) = node.parent() {
-        let mut cursor = parent.walk();
-        let mut result = String::new();
-        for (i, child) in parent.children(&mut cursor).enumerate() {
-            if child.id() == node.id() {
-                if let Some(field) = parent.field_name_for_child(i as u32) {
-                    result = format!("{}: ", field);
-                }
-                break;
-            }
-        }
-        result
-    } else {
-        String::new()
-    };
-
-    buf.push_str(&format!(
-        "{}{}({}) [L{}-L{}]\n",
-        prefix,
-        field_info,
-        kind,
-        start.row + 1,
-        end.row + 1,
-    ));
-
-    if max_depth >= 0 && current_depth >= max_depth {
-        if node.child_count() > 0 {
-            let child_prefix = "  ".repeat(current_depth as usize + 1);
-            buf.push_str(&format!(
-                "{}... {} children truncated\n",
-                child_prefix,
-                node.child_count()
-            ));
+    use std::fmt::Write;
+
+    walk_with_fields(node, |node, depth, field| {
+        if named_only && !node.is_named() {
+            return false;
         }
-        return;
-    }
+        let depth = current_depth as usize + depth;
+        let start = node.start_position();
+        let end = node.end_position();
+        push_line_prefix(buf, depth, field);
+        let _ = writeln!(
+            buf,
+            "({}) [L{}-L{}]",
+            node.kind(),
+            start.row + 1,
+            end.row + 1,
+        );
 
-    let mut cursor = node.walk();
-    for child in node.children(&mut cursor) {
-        tree_to_outline(child, max_depth, current_depth + 1, buf);
-    }
+        if max_depth >= 0 && depth as i32 >= max_depth {
+            let child_count = shown_child_count(node, named_only);
+            if child_count > 0 {
+                push_line_prefix(buf, depth + 1, None);
+                let _ = writeln!(buf, "... {child_count} children truncated");
+            }
+            return false;
+        }
+        true
+    });
 }
 
-fn tree_to_string(source: &str, node: tree_sitter::Node, indent: usize, buf: &mut String) {
-    let prefix = "  ".repeat(indent);
-    let kind = node.kind();
-    let start = node.start_position();
-    let end = node.end_position();
-
-    let field_info = if let Some(parent) = node.parent() {
-        let mut cursor = parent.walk();
-        let mut result = String::new();
-        for (i, child) in parent.children(&mut cursor).enumerate() {
-            if child.id() == node.id() {
-                if let Some(field) = parent.field_name_for_child(i as u32) {
-                    result = format!("{}: ", field);
-                }
-                break;
-            }
+fn tree_to_string(
+    source: &str,
+    node: tree_sitter::Node,
+    indent: usize,
+    named_only: bool,
+    buf: &mut String,
+) {
+    use std::fmt::Write;
+
+    walk_with_fields(node, |node, depth, field| {
+        if named_only && !node.is_named() {
+            return false;
         }
-        result
-    } else {
-        String::new()
-    };
+        let start = node.start_position();
+        let end = node.end_position();
+        push_line_prefix(buf, indent + depth, field);
 
-    if node.child_count() == 0 {
-        let text = node.utf8_text(source.as_bytes()).unwrap_or("");
-        let text_preview = if text.len() > 40 {
-            format!("{}...", &text[..40])
+        if shown_child_count(node, named_only) == 0 {
+            let text = node.utf8_text(source.as_bytes()).unwrap_or("");
+            let text_preview = if text.len() > 40 {
+                format!("{}...", &text[..40])
+            } else {
+                text.to_string()
+            };
+            let _ = writeln!(
+                buf,
+                "({}) {:?} [L{}:{}]",
+                node.kind(),
+                text_preview,
+                start.row + 1,
+                start.column + 1
+            );
         } else {
-            text.to_string()
-        };
-        buf.push_str(&format!(
-            "{}{}({}) {:?} [L{}:{}]\n",
-            prefix,
-            field_info,
-            kind,
-            text_preview,
-            start.row + 1,
-            start.column + 1
-        ));
-    } else {
-        buf.push_str(&format!(
-            "{}{}({}) [L{}-L{}]\n",
-            prefix,
-            field_info,
-            kind,
-            start.row + 1,
-            end.row + 1
-        ));
-        let mut cursor = node.walk();
-        for child in node.children(&mut cursor) {
-            tree_to_string(source, child, indent + 1, buf);
+            let _ = writeln!(
+                buf,
+                "({}) [L{}-L{}]",
+                node.kind(),
+                start.row + 1,
+                end.row + 1
+            );
         }
-    }
+        true
+    });
 }
 
-fn node_at_line_to_string(source: &str, root: tree_sitter::Node, line: usize, buf: &mut String) {
+/// Describe the chain of nodes enclosing `line`. With `named_only`, anonymous
+/// nodes are neither descended into nor listed.
+fn node_at_line_to_string(
+    source: &str,
+    root: tree_sitter::Node,
+    line: usize,
+    named_only: bool,
+    buf: &mut String,
+) {
     let target_row = line.saturating_sub(1);
 
     fn find_deepest_at_line<'a>(
         node: tree_sitter::Node<'a>,
         row: usize,
+        named_only: bool,
     ) -> Option<tree_sitter::Node<'a>> {
         if node.start_position().row <= row && node.end_position().row >= row {
             let mut cursor = node.walk();
             for child in node.children(&mut cursor) {
-                if let Some(deeper) = find_deepest_at_line(child, row) {
+                if named_only && !child.is_named() {
+                    continue;
+                }
+                if let Some(deeper) = find_deepest_at_line(child, row, named_only) {
                     return Some(deeper);
                 }
             }
@@ -177,7 +194,7 @@ fn node_at_line_to_string(source: &str, root: tree_sitter::Node, line: usize, bu
         }
     }
 
-    if let Some(node) = find_deepest_at_line(root, target_row) {
+    if let Some(node) = find_deepest_at_line(root, target_row, named_only) {
         buf.push_str(&format!("Line {} is inside:\n\n", line));
 
         let mut current = Some(node);
@@ -185,7 +202,9 @@ fn node_at_line_to_string(source: &str, root: tree_sitter::Node, line: usize, bu
         let mut ancestors = Vec::new();
 
         while let Some(n) = current {
-            ancestors.push(n);
+            if !named_only || n.is_named() {
+                ancestors.push(n);
+            }
             current = n.parent();
         }
 
@@ -197,7 +216,7 @@ fn node_at_line_to_string(source: &str, root: tree_sitter::Node, line: usize, bu
             let start = ancestor.start_position();
             let end = ancestor.end_position();
 
-            if ancestor.child_count() == 0 {
+            if shown_child_count(*ancestor, named_only) == 0 {
                 let text = ancestor.utf8_text(source.as_bytes()).unwrap_or("");
                 buf.push_str(&format!(
                     "{}{} {:?} (L{}:{}-L{}:{})\n",
@@ -230,6 +249,7 @@ fn node_at_line_to_string(source: &str, root: tree_sitter::Node, line: usize, bu
 /// Build AST output as (json_value, text_string).
 /// `depth`: -1 = unlimited, 0 = root only, N = N levels deep.
 /// `compact`: if true, produce an outline without source text instead of the full tree dump.
+/// `named_only`: if true, leave anonymous nodes (punctuation, keywords) out of the tree.
 /// `lang_override`: explicit `--lang` value (language or grammar name), if the
 /// caller passed one. Takes priority over `.normalize/config.toml` `[languages]`
 /// overrides and content sniffing — see [`normalize_languages::resolve_language`].
@@ -239,6 +259,7 @@ pub fn build_ast_output(
     sexp: bool,
     depth: i32,
     compact: bool,
+    named_only: bool,
     lang_override: Option<&str>,
 ) -> Result<(serde_json::Value, String), String> {
     use crate::parsers::grammar_loader;
@@ -289,18 +310,99 @@ pub fn build_ast_output(
 
     let root = tree.root_node();
 
-    let json_value = node_to_json_depth(root, &content, depth, 0);
+    let json_value = node_to_json_depth(root, &content, depth, 0, named_only);
 
     let mut text = String::new();
     if let Some(line) = at_line {
-        node_at_line_to_string(&content, root, line, &mut text);
+        node_at_line_to_string(&content, root, line, named_only, &mut text);
     } else if sexp {
         text = root.to_sexp();
     } else if compact {
-        tree_to_outline(root, depth, 0, &mut text);
+        tree_to_outline(root, depth, 0, named_only, &mut text);
     } else {
-        tree_to_string(&content, root, 0, &mut text);
+        tree_to_string(&content, root, 0, named_only, &mut text);
     }
 
     Ok((json_value, text))
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::parsers;
+
+    const SOURCE: &str = "fn main() { let x = (1 + 2); }\n";
+
+    /// Parse [`SOURCE`], or `None` when the Rust grammar isn't built in this
+    /// environment (tests then skip, as in `highlight_tests`).
+    fn parse() -> Option<tree_sitter::Tree> {
+        parsers::parse_with_grammar("rust", SOURCE)
+    }
+
+    fn json_kinds(value: &serde_json::Value, out: &mut Vec<String>) {
+        if let Some(kind) = value["kind"].as_str() {
+            out.push(kind.to_string());
+        }
+        if let Some(children) = value["children"].as_array() {
+            for child in children {
+                json_kinds(child, out);
+            }
+        }
+    }
+
+    #[test]
+    fn named_only_omits_anonymous_tokens() {
+        let Some(tree) = parse() else { return };
+        let root = tree.root_node();
+
+        let mut full = String::new();
+        tree_to_string(SOURCE, root, 0, false, &mut full);
+        let mut named = String::new();
+        tree_to_string(SOURCE, root, 0, true, &mut named);
+        assert!(full.contains("({)"));
+        assert!(!named.contains("({)"));
+        assert!(!named.contains("(;)"));
+
+        let mut full = String::new();
+        tree_to_outline(root, -1, 0, false, &mut full);
+        let mut named = String::new();
+        tree_to_outline(root, -1, 0, true, &mut named);
+        assert!(full.contains("({)"));
+        assert!(!named.contains("({)"));
+        assert!(!named.contains("(;)"));
+
+        let mut full = Vec::new();
+        json_kinds(&node_to_json_depth(root, SOURCE, -1, 0, false), &mut full);
+        let mut named = Vec::new();
+        json_kinds(&node_to_json_depth(root, SOURCE, -1, 0, true), &mut named);
+        assert!(full.iter().any(|k| k == "{"));
+        assert!(named.iter().all(|k| k != "{" && k != ";" && k != "fn"));
+        assert!(named.iter().any(|k| k == "identifier"));
+
+        let mut full = String::new();
+        node_at_line_to_string(SOURCE, root, 1, false, &mut full);
+        let mut named = String::new();
+        node_at_line_to_string(SOURCE, root, 1, true, &mut named);
+        assert!(full.contains("fn \"fn\""));
+        assert!(!named.contains("fn \"fn\""));
+        assert!(named.contains("identifier \"main\""));
+    }
+
+    #[test]
+    fn named_only_truncation_counts_named_children() {
+        let Some(tree) = parse() else { return };
+        let root = tree.root_node();
+        let Some(function) = root.named_child(0) else {
+            panic!("expected a function_item");
+        };
+        let named_count = function.named_child_count();
+        assert!(named_count < function.child_count());
+
+        let json = node_to_json_depth(root, SOURCE, 1, 0, true);
+        assert_eq!(json["children"][0]["child_count"], named_count);
+
+        let mut outline = String::new();
+        tree_to_outline(root, 1, 0, true, &mut outline);
+        assert!(outline.contains(&format!("... {named_count} children truncated")));
+    }
+}
@@ -363,15 +363,18 @@ fn extract_call_edges(
 ) -> Vec<((String, String), String)> {
     use normalize_facts::SymbolParser;
     use normalize_facts_core::SymbolKind;
-    let mut parser = SymbolParser::new();
+    let parser = SymbolParser::new();
     let symbols = parser.parse_file(abs_path, content).unwrap_or_default();
+    let Some(tree) = parser.parse_for_calls(abs_path, content) else {
+        return Vec::new();
+    };
     let mut edges = Vec::new();
     for sym in &symbols {
         if sym.kind != SymbolKind::Function && sym.kind != SymbolKind::Method {
             continue;
         }
         let caller_key = (rel_path.to_string(), sym.name.clone());
-        let callees = parser.find_callees_for_symbol(abs_path, content, sym);
+        let callees = parser.find_callees_in_tree(abs_path, &tree, content, sym);
         for (callee_name, _, _, _) in callees {
             edges.push((caller_key.clone(), callee_name));
         }
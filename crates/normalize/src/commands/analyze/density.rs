@@ -300,11 +300,14 @@ fn shannon_entropy_normalized<K>(counts: &HashMap<K, usize>) -> f64 {
 }
 
 /// Walk a tree-sitter tree and collect a frequency map of node-kind strings.
-fn collect_node_kinds(tree: &tree_sitter::Tree) -> HashMap<String, usize> {
-    let mut counts: HashMap<String, usize> = HashMap::new();
+///
+/// Kind names are the grammar's own `'static` strings, so they are used as keys
+/// directly instead of allocating a `String` for every node.
+fn collect_node_kinds(tree: &tree_sitter::Tree) -> HashMap<&'static str, usize> {
+    let mut counts: HashMap<&'static str, usize> = HashMap::new();
     let mut cursor = tree.walk();
     loop {
-        *counts.entry(cursor.node().kind().to_string()).or_insert(0) += 1;
+        *counts.entry(cursor.node().kind()).or_insert(0) += 1;
         if cursor.goto_first_child() {
             continue;
         }
@@ -3,7 +3,7 @@
 //! Provides report structs for each analysis type and the `analyze()` function
 //! that orchestrates running multiple analyses based on flags.
 
-use std::collections::HashMap;
+use std::collections::HashSet;
 use std::path::Path;
 
 use crate::analyze::complexity::{ComplexityReport, RiskLevel};
@@ -69,7 +69,10 @@ pub struct SecurityFinding {
     /// Human-readable description of the finding.
     pub message: String,
     /// Name of the analysis tool that produced the finding.
-    pub tool: String,
+    ///
+    /// Tool names are a fixed set, so this borrows a static string rather
+    /// than allocating one per finding.
+    pub tool: &'static str,
 }
 
 /// Security analysis results
@@ -81,16 +84,11 @@ pub struct SecurityReport {
 }
 
 impl SecurityReport {
-    pub fn count_by_severity(&self) -> HashMap<&'static str, usize> {
-        let mut counts = HashMap::new();
-        counts.insert("critical", 0);
-        counts.insert("high", 0);
-        counts.insert("medium", 0);
-        counts.insert("low", 0);
-
+    /// Count findings per severity, indexed by `Severity as usize`.
+    pub fn count_by_severity(&self) -> [usize; 4] {
+        let mut counts = [0; 4];
         for f in &self.findings {
-            // normalize-syntax-allow: rust/unwrap-in-impl - keys are compile-time constants inserted above
-            *counts.get_mut(f.severity.as_str()).unwrap() += 1;
+            counts[f.severity as usize] += 1;
         }
         counts
     }
@@ -99,10 +97,10 @@ impl SecurityReport {
     /// 100 if no findings, penalized by severity.
     pub fn score(&self) -> f64 {
         let counts = self.count_by_severity();
-        let penalty = counts["critical"] * 40
-            + counts["high"] * 20
-            + counts["medium"] * 10
-            + counts["low"] * 5;
+        let penalty = counts[Severity::Critical as usize] * 40
+            + counts[Severity::High as usize] * 20
+            + counts[Severity::Medium as usize] * 10
+            + counts[Severity::Low as usize] * 5;
         (100.0 - penalty as f64).max(0.0)
     }
 }
@@ -116,7 +114,10 @@ impl OutputFormatter for SecurityReport {
         let counts = self.count_by_severity();
         lines.push(format!(
             "Findings: {} critical, {} high, {} medium, {} low",
-            counts["critical"], counts["high"], counts["medium"], counts["low"]
+            counts[Severity::Critical as usize],
+            counts[Severity::High as usize],
+            counts[Severity::Medium as usize],
+            counts[Severity::Low as usize]
         ));
 
         if !self.tools_run.is_empty() {
@@ -540,15 +541,14 @@ fn analyze_glob(
     // Security analysis works at directory level, so we run on root and filter
     let security = if run_security {
         let full_report = security::analyze_security(root);
-        // Filter findings to only files matching our glob pattern
+        // Filter findings to only files matching our glob pattern. Build the
+        // lookup set once so each finding is an O(1) membership test rather
+        // than a scan over every matched file.
+        let file_set: HashSet<&Path> = files.iter().map(PathBuf::as_path).collect();
         let matching_findings: Vec<_> = full_report
             .findings
             .into_iter()
-            .filter(|f| {
-                // Check if this finding's file matches our glob pattern
-                let finding_path = root.join(&f.file);
-                files.iter().any(|p| p == &finding_path)
-            })
+            .filter(|f| file_set.contains(root.join(&f.file).as_path()))
             .collect();
 
         if !matching_findings.is_empty() {
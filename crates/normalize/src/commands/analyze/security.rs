@@ -1,32 +1,54 @@
 //! Security analysis - run security scanning tools
 
 use super::report::{SecurityFinding, SecurityReport, Severity};
-use std::path::Path;
+use std::path::{Path, PathBuf};
 use std::process::Command;
+use std::sync::OnceLock;
 
-/// Check if a command is available on the system
-fn command_available(cmd: &str) -> bool {
-    Command::new("which")
-        .arg(cmd)
-        .output()
-        .map(|o| o.status.success())
+/// Resolved path to the `bandit` executable, discovered once per process.
+static BANDIT: OnceLock<Option<PathBuf>> = OnceLock::new();
+
+/// Locate `cmd` by scanning `PATH` directly, without spawning `which`.
+fn find_in_path(cmd: &str) -> Option<PathBuf> {
+    let paths = std::env::var_os("PATH")?;
+    std::env::split_paths(&paths)
+        .map(|dir| dir.join(cmd))
+        .find(|path| is_executable(path))
+}
+
+#[cfg(unix)]
+fn is_executable(path: &Path) -> bool {
+    use std::os::unix::fs::PermissionsExt;
+    path.metadata()
+        .map(|m| m.is_file() && m.permissions().mode() & 0o111 != 0)
         .unwrap_or(false)
 }
 
+#[cfg(not(unix))]
+fn is_executable(path: &Path) -> bool {
+    path.is_file()
+}
+
+/// Path to `bandit`, if installed. The `PATH` scan runs at most once.
+fn bandit_binary() -> Option<&'static Path> {
+    BANDIT.get_or_init(|| find_in_path("bandit")).as_deref()
+}
+
 /// Run bandit security scanner on Python code
-fn run_bandit(root: &Path) -> Result<Vec<SecurityFinding>, String> {
-    let output = Command::new("bandit")
+fn run_bandit(bandit: &Path, root: &Path) -> Result<Vec<SecurityFinding>, String> {
+    let output = Command::new(bandit)
         .args(["-r", "-f", "json", "-q"])
         .arg(root)
         .output()
         .map_err(|e| e.to_string())?;
 
-    let stdout = String::from_utf8_lossy(&output.stdout);
-    if stdout.is_empty() {
+    if output.stdout.is_empty() {
         return Ok(Vec::new());
     }
 
-    let json: serde_json::Value = serde_json::from_str(&stdout).map_err(|e| e.to_string())?;
+    // Parse the raw bytes directly; no intermediate UTF-8 string copy.
+    let json: serde_json::Value =
+        serde_json::from_slice(&output.stdout).map_err(|e| e.to_string())?;
 
     let mut findings = Vec::new();
     if let Some(results) = json.get("results").and_then(|r| r.as_array()) {
@@ -61,7 +83,7 @@ fn run_bandit(root: &Path) -> Result<Vec<SecurityFinding>, String> {
                 severity: Severity::parse(severity_str),
                 rule_id,
                 message,
-                tool: "bandit".to_string(),
+                tool: "bandit",
             });
         }
     }
@@ -73,8 +95,8 @@ fn run_bandit(root: &Path) -> Result<Vec<SecurityFinding>, String> {
 pub fn analyze_security(root: &Path) -> SecurityReport {
     let mut report = SecurityReport::default();
 
-    if command_available("bandit") {
-        match run_bandit(root) {
+    if let Some(bandit) = bandit_binary() {
+        match run_bandit(bandit, root) {
             Ok(findings) => {
                 report.findings.extend(findings);
                 report.tools_run.push("bandit".to_string());
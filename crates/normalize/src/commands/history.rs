@@ -73,6 +73,11 @@ impl HistoryDiffReport {
     pub fn new(commit_ref: String, diff: String) -> Self {
         Self { commit_ref, diff }
     }
+
+    /// The raw diff text, as printed in text mode.
+    pub fn diff_text(&self) -> &str {
+        &self.diff
+    }
 }
 
 impl OutputFormatter for HistoryDiffReport {
@@ -234,8 +234,16 @@ fn collect_trigram_symbols(
     scored: &mut Vec<(index::SymbolMatch, f32)>,
 ) {
     for sym in symbols {
-        let name_lower = sym.name.to_lowercase();
-        let score = trigram_containment(q_trigrams, &name_lower);
+        // A name with n chars has at most n - 2 trigrams, which caps its score;
+        // skip building the trigram set when even that cap misses the threshold.
+        // Only ASCII names are bounded this way since lowercasing keeps their length.
+        let max_shared = sym.name.len().saturating_sub(2).min(q_trigrams.len());
+        let bound = max_shared as f32 / q_trigrams.len() as f32;
+        let score = if sym.name.is_ascii() && bound < threshold {
+            0.0
+        } else {
+            trigram_containment(q_trigrams, &sym.name.to_lowercase())
+        };
         if score >= threshold {
             scored.push((
                 index::SymbolMatch {
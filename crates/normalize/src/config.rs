@@ -85,7 +85,10 @@ use normalize_ratchet::RatchetConfig;
 use normalize_rules::RulesConfig;
 use schemars::JsonSchema;
 use serde::{Deserialize, Serialize};
-use std::path::Path;
+use std::collections::HashMap;
+use std::path::{Path, PathBuf};
+use std::sync::{Arc, Mutex, OnceLock};
+use std::time::SystemTime;
 
 /// User-defined rule tag groups.
 ///
@@ -213,7 +216,45 @@ impl NormalizeConfig {
     /// When neither file exists, returns [`NormalizeConfig::bootstrap`] (which
     /// embeds the opinions a fresh project should start with — currently just
     /// `[walk] exclude = [".git/"]`).
+    ///
+    /// Results are cached per `root` for the life of the process and reused
+    /// until one of the config files it read changes (by mtime or size) or a
+    /// config file appears/disappears along the ancestor chain. Repeated loads
+    /// (the daemon, commands that open the index) skip re-parsing every file.
+    ///
+    /// Returns an owned copy; read-only callers should prefer
+    /// [`NormalizeConfig::load_shared`], which skips the deep clone.
     pub fn load(root: &Path) -> Self {
+        (*Self::load_shared(root)).clone()
+    }
+
+    /// Like [`NormalizeConfig::load`], but returns the cached config itself.
+    ///
+    /// The cached value is never mutated — a changed config file produces a
+    /// fresh `Arc` — so a cache hit costs a refcount bump instead of cloning
+    /// every rule table, alias and glob list.
+    pub fn load_shared(root: &Path) -> Arc<Self> {
+        static CACHE: OnceLock<Mutex<HashMap<PathBuf, (ConfigStamp, Arc<NormalizeConfig>)>>> =
+            OnceLock::new();
+        let cache = CACHE.get_or_init(Default::default);
+
+        let stamp = config_stamp(root);
+        if let Some((cached_stamp, config)) =
+            cache.lock().unwrap_or_else(|e| e.into_inner()).get(root)
+            && *cached_stamp == stamp
+        {
+            return Arc::clone(config);
+        }
+
+        let config = Arc::new(Self::load_uncached(root));
+        cache
+            .lock()
+            .unwrap_or_else(|e| e.into_inner())
+            .insert(root.to_path_buf(), (stamp, Arc::clone(&config)));
+        config
+    }
+
+    fn load_uncached(root: &Path) -> Self {
         let project_config = root.join(".normalize").join("config.toml");
         let global_config = Self::global_config_path();
         let project_exists = project_config.exists();
@@ -233,9 +274,11 @@ impl NormalizeConfig {
         for path in [Some(&project_config), global_config.as_ref()]
             .into_iter()
             .flatten()
-            .filter(|p| p.exists())
         {
+            // Substring pre-check: almost no config mentions the section, so
+            // skip the full TOML parse unless the name appears at all.
             if let Ok(raw) = std::fs::read_to_string(path)
+                && raw.contains("embeddings")
                 && let Ok(value) = raw.parse::<toml::Value>()
                 && value.get("embeddings").is_some()
             {
@@ -269,8 +312,6 @@ impl NormalizeConfig {
         // ancestor walking lets subdirectories define their own aliases.
         config.aliases = normalize_config_paths::load_section_hierarchical(root, "aliases");
         normalize_filter::validate_aliases(&config.aliases);
-        #[cfg(feature = "cli")]
-        validate_command_aliases(&config.aliases);
 
         config
     }
@@ -285,15 +326,41 @@ impl NormalizeConfig {
     }
 }
 
+/// The config files a load of some root depends on, each with the
+/// `(mtime, size)` it had at the time. Two equal stamps mean the load would
+/// read exactly the same inputs.
+type ConfigStamp = Vec<(PathBuf, Option<(SystemTime, u64)>)>;
+
+fn config_stamp(root: &Path) -> ConfigStamp {
+    normalize_config_paths::ancestor_config_paths(root)
+        .into_iter()
+        .map(|path| {
+            let meta = std::fs::metadata(&path)
+                .ok()
+                .and_then(|m| Some((m.modified().ok()?, m.len())));
+            (path, meta)
+        })
+        .collect()
+}
+
 /// Validate command-syntax aliases against the real CLI command tree.
 ///
 /// Uses server-less's `CliSubcommand::cli_command()` to build the full clap
-/// `Command` and tries matching the tokenized alias value against it. This
-/// catches unknown subcommands and invalid flags at config-load time.
+/// `Command` and tries matching the tokenized alias value against it. Returns
+/// `(alias name, problem)` for unknown subcommands and invalid flags.
+///
+/// Run by `normalize config validate` rather than on every config load: an
+/// alias that is actually invoked is parsed by the real CLI anyway.
 #[cfg(feature = "cli")]
-fn validate_command_aliases(config: &AliasConfig) {
+pub(crate) fn validate_command_aliases(config: &AliasConfig) -> Vec<(String, String)> {
     use crate::filter::AliasSyntax;
 
+    let mut problems = Vec::new();
+
+    // The clap tree covers every command and is costly to build: do it only
+    // once a command alias actually needs checking, and share it across aliases.
+    let mut cli: Option<clap::Command> = None;
+
     for (name, entry) in &config.entries {
         if entry.resolved_syntax() != AliasSyntax::Command {
             continue;
@@ -318,15 +385,17 @@ fn validate_command_aliases(config: &AliasConfig) {
         }
 
         // Build the clap Command tree and try matching.
-        let cmd = <crate::service::NormalizeService as server_less::CliSubcommand>::cli_command()
-            .no_binary_name(true)
-            .disable_help_flag(true)
-            .disable_version_flag(true);
+        let cmd = cli.get_or_insert_with(|| {
+            <crate::service::NormalizeService as server_less::CliSubcommand>::cli_command()
+                .no_binary_name(true)
+                .disable_help_flag(true)
+                .disable_version_flag(true)
+        });
 
-        // Use try_get_matches_from to validate without side effects.
+        // Use try_get_matches_from_mut to validate without side effects.
         // We allow trailing args (the user may append more at invocation time),
-        // so we use try_get_matches_from and accept TrailingArg-like failures.
-        match cmd.try_get_matches_from(tokens.iter()) {
+        // so we accept TrailingArg-like failures.
+        match cmd.try_get_matches_from_mut(tokens.iter()) {
             Ok(_) => {} // Valid
             Err(e) => {
                 // InvalidSubcommand and UnknownArgument are real problems.
@@ -335,11 +404,14 @@ fn validate_command_aliases(config: &AliasConfig) {
                 use clap::error::ErrorKind;
                 match e.kind() {
                     ErrorKind::InvalidSubcommand | ErrorKind::UnknownArgument => {
-                        tracing::warn!(
-                            "alias @{}: command validation failed: {}",
-                            name,
-                            e.to_string().lines().next().unwrap_or("unknown error")
-                        );
+                        problems.push((
+                            name.clone(),
+                            e.to_string()
+                                .lines()
+                                .next()
+                                .unwrap_or("unknown error")
+                                .to_string(),
+                        ));
                     }
                     _ => {
                         // Missing required args, etc. — expected for partial commands.
@@ -353,6 +425,8 @@ fn validate_command_aliases(config: &AliasConfig) {
             }
         }
     }
+
+    problems
 }
 
 #[cfg(test)]
@@ -396,6 +470,41 @@ enabled = true
         assert!(config.index.enabled());
     }
 
+    #[test]
+    fn test_load_sees_config_edits() {
+        let dir = TempDir::new().unwrap();
+        let moss_dir = dir.path().join(".normalize");
+        std::fs::create_dir_all(&moss_dir).unwrap();
+        let config_path = moss_dir.join("config.toml");
+
+        std::fs::write(&config_path, "[daemon]\nenabled = false\n").unwrap();
+        assert!(!NormalizeConfig::load(dir.path()).daemon.enabled());
+        // Served from the cache while the file is unchanged.
+        assert!(!NormalizeConfig::load(dir.path()).daemon.enabled());
+
+        std::fs::write(&config_path, "[daemon]\nenabled = true\n").unwrap();
+        assert!(NormalizeConfig::load(dir.path()).daemon.enabled());
+    }
+
+    #[test]
+    fn test_load_shared_reuses_cached_config() {
+        let dir = TempDir::new().unwrap();
+        let moss_dir = dir.path().join(".normalize");
+        std::fs::create_dir_all(&moss_dir).unwrap();
+        let config_path = moss_dir.join("config.toml");
+
+        std::fs::write(&config_path, "[daemon]\nenabled = false\n").unwrap();
+        let first = NormalizeConfig::load_shared(dir.path());
+        let second = NormalizeConfig::load_shared(dir.path());
+        assert!(Arc::ptr_eq(&first, &second));
+
+        std::fs::write(&config_path, "[daemon]\nenabled = true\n").unwrap();
+        let third = NormalizeConfig::load_shared(dir.path());
+        assert!(!Arc::ptr_eq(&first, &third));
+        assert!(!first.daemon.enabled());
+        assert!(third.daemon.enabled());
+    }
+
     #[test]
     fn test_partial_config() {
         let dir = TempDir::new().unwrap();
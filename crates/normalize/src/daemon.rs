@@ -1531,7 +1531,7 @@ mod unix_impl {
         /// Results are persisted to the SQLite index and immediately dropped from heap.
         /// Called lazily on the first `RunRules` request or after config invalidation.
         fn prime_diagnostics_cache(&self, root: &Path) {
-            let config = NormalizeConfig::load(root);
+            let config = NormalizeConfig::load_shared(root);
             let config_hash = compute_config_hash(root);
 
             // --- Fact rules ---
@@ -2262,7 +2262,7 @@ mod unix_impl {
                             "index refreshed"
                         );
 
-                        let config = NormalizeConfig::load(root);
+                        let config = NormalizeConfig::load_shared(root);
                         let config_hash = compute_config_hash(root);
 
                         // --- Fact rules (incremental via ENGINE_CACHE) ---
@@ -2451,7 +2451,7 @@ mod unix_impl {
         /// that read staged state (ratchet, check-refs, etc.) see fresh results without
         /// triggering a full index rebuild.
         fn refresh_native_rules(&self, root: &Path) {
-            let config = NormalizeConfig::load(root);
+            let config = NormalizeConfig::load_shared(root);
             let root_owned = root.to_path_buf();
             let rules_config = config.rules.clone();
             let walk_config = config.walk.clone();
@@ -2907,6 +2907,10 @@ mod unix_impl {
         // Leak the File so the flock is held until process exit
         std::mem::forget(lock);
 
+        // Rules re-run on files as they change: keep their trees so re-parses
+        // are incremental.
+        normalize_languages::parsers::grammar_loader().retain_recent_trees();
+
         // Safe to remove socket now -- we hold the lock
         let _ = std::fs::remove_file(&socket_path);
 
@@ -3238,20 +3242,23 @@ mod unix_impl {
                 }
 
                 // JSON mode: reconstruct the first line from the already-read byte.
-                let mut line = String::new();
+                // Lines are kept as raw bytes: serde_json validates UTF-8 while
+                // parsing, so a separate `read_line` validation pass is redundant.
+                let mut line = Vec::new();
+                let mut out = Vec::new();
                 if first[0] != b'\n' {
-                    line.push(first[0] as char);
+                    line.push(first[0]);
                     // Read the rest of the first line.
-                    reader.read_line(&mut line).await.unwrap_or(0);
+                    reader.read_until(b'\n', &mut line).await.unwrap_or(0);
                 }
-                if !line.trim().is_empty() {
-                    handle_json_line(&server, &line, &mut writer).await;
+                if !line.trim_ascii().is_empty() {
+                    handle_json_line(&server, &line, &mut writer, &mut out).await;
                 }
                 line.clear();
 
-                while reader.read_line(&mut line).await.unwrap_or(0) > 0 {
-                    if !line.trim().is_empty() {
-                        handle_json_line(&server, &line, &mut writer).await;
+                while reader.read_until(b'\n', &mut line).await.unwrap_or(0) > 0 {
+                    if !line.trim_ascii().is_empty() {
+                        handle_json_line(&server, &line, &mut writer, &mut out).await;
                     }
                     line.clear();
                 }
@@ -3260,20 +3267,22 @@ mod unix_impl {
     }
 
     /// Handle one JSON request line in the legacy JSON IPC protocol.
+    ///
+    /// `out` is the connection's outbound buffer, reused across requests so
+    /// each response is encoded in place and sent with a single write.
     #[cfg(feature = "daemon")]
     async fn handle_json_line(
         server: &Arc<DaemonServer>,
-        line: &str,
+        line: &[u8],
         writer: &mut tokio::net::unix::OwnedWriteHalf,
+        out: &mut Vec<u8>,
     ) {
         use tokio::io::AsyncWriteExt;
-        match serde_json::from_str::<Request>(line) {
+        match serde_json::from_slice::<Request>(line) {
             Ok(Request::Shutdown) => {
                 let resp = server.handle_request(Request::Shutdown);
-                // normalize-syntax-allow: rust/unwrap-in-impl - Response is always JSON-serializable
-                let resp_str = serde_json::to_string(&resp).unwrap();
-                let _ = writer.write_all(resp_str.as_bytes()).await;
-                let _ = writer.write_all(b"\n").await;
+                push_json_line(out, &resp);
+                let _ = write_out(writer, out).await;
                 let _ = writer.flush().await;
                 // Graceful cleanup before exit. The OS releases the flock on
                 // process exit regardless (flock is fd/process-scoped, not
@@ -3298,11 +3307,22 @@ mod unix_impl {
                 loop {
                     match rx.recv().await {
                         Ok(event) => {
-                            // normalize-syntax-allow: rust/unwrap-in-impl - Event is always JSON-serializable
-                            let json = serde_json::to_string(&event).unwrap();
-                            if writer.write_all(json.as_bytes()).await.is_err()
-                                || writer.write_all(b"\n").await.is_err()
-                            {
+                            // Coalesce whatever else is already queued into the
+                            // same write: a burst of file events (e.g. a branch
+                            // checkout) costs one syscall, not two per event.
+                            push_json_line(out, &event);
+                            loop {
+                                match rx.try_recv() {
+                                    Ok(event) => push_json_line(out, &event),
+                                    Err(broadcast::error::TryRecvError::Lagged(n)) => {
+                                        eprintln!("Subscriber lagged, dropped {} events", n);
+                                    }
+                                    // Empty or Closed: flush what we have; a
+                                    // close is observed by the next `recv`.
+                                    Err(_) => break,
+                                }
+                            }
+                            if write_out(writer, out).await.is_err() {
                                 // Client disconnected
                                 return;
                             }
@@ -3320,21 +3340,53 @@ mod unix_impl {
             }
             Ok(req) => {
                 let response = server.handle_request(req);
-                // normalize-syntax-allow: rust/unwrap-in-impl - Response is always JSON-serializable
-                let resp_str = serde_json::to_string(&response).unwrap();
-                let _ = writer.write_all(resp_str.as_bytes()).await;
-                let _ = writer.write_all(b"\n").await;
+                push_json_line(out, &response);
+                let _ = write_out(writer, out).await;
             }
             Err(e) => {
                 let response = Response::err(&format!("Invalid request: {}", e));
-                // normalize-syntax-allow: rust/unwrap-in-impl - Response is always JSON-serializable
-                let resp_str = serde_json::to_string(&response).unwrap();
-                let _ = writer.write_all(resp_str.as_bytes()).await;
-                let _ = writer.write_all(b"\n").await;
+                push_json_line(out, &response);
+                let _ = write_out(writer, out).await;
             }
         }
     }
 
+    /// Outbound buffers that grew past this size (one huge response) are shrunk
+    /// back after the write rather than pinned for the connection's lifetime.
+    #[cfg(feature = "daemon")]
+    const MAX_RETAINED_OUT_BUF: usize = 64 * 1024;
+
+    /// Append `value` to `buf` as one newline-terminated JSON line.
+    #[cfg(feature = "daemon")]
+    fn push_json_line<T: Serialize>(buf: &mut Vec<u8>, value: &T) {
+        // normalize-syntax-allow: rust/unwrap-in-impl - Response and Event are always JSON-serializable
+        serde_json::to_writer(&mut *buf, value).unwrap();
+        buf.push(b'\n');
+    }
+
+    /// Append one `[type_byte][4-byte LE len][payload]` rkyv-mode frame to `buf`.
+    #[cfg(feature = "daemon")]
+    fn push_frame(buf: &mut Vec<u8>, type_byte: u8, payload: &[u8]) {
+        buf.reserve(5 + payload.len());
+        buf.push(type_byte);
+        buf.extend_from_slice(&(payload.len() as u32).to_le_bytes());
+        buf.extend_from_slice(payload);
+    }
+
+    /// Write out everything queued in `out` with one `write_all`, then empty it
+    /// for reuse.
+    #[cfg(feature = "daemon")]
+    async fn write_out(
+        writer: &mut tokio::net::unix::OwnedWriteHalf,
+        out: &mut Vec<u8>,
+    ) -> std::io::Result<()> {
+        use tokio::io::AsyncWriteExt;
+        let result = writer.write_all(out).await;
+        out.clear();
+        out.shrink_to(MAX_RETAINED_OUT_BUF);
+        result
+    }
+
     /// Handle one connection in rkyv binary IPC mode.
     ///
     /// Protocol: client sends `[0x01][json_request_bytes][\n]` (magic byte already
@@ -3348,13 +3400,13 @@ mod unix_impl {
     ) {
         use tokio::io::AsyncWriteExt;
 
-        let mut line = String::new();
-        if reader.read_line(&mut line).await.unwrap_or(0) == 0 {
+        let mut line = Vec::new();
+        if reader.read_until(b'\n', &mut line).await.unwrap_or(0) == 0 {
             return;
         }
 
         // Parse JSON request (same schema as the JSON protocol).
-        let raw_response = match serde_json::from_str::<Request>(&line) {
+        let raw_response = match serde_json::from_slice::<Request>(&line) {
             Ok(Request::RunRules {
                 root,
                 filter_ids,
@@ -3370,6 +3422,7 @@ mod unix_impl {
                     server.add_root(r);
                 }
                 let mut rx = server.event_tx.subscribe();
+                let mut out = Vec::new();
                 loop {
                     match rx.recv().await {
                         Ok(event) => {
@@ -3380,13 +3433,9 @@ mod unix_impl {
                                     continue;
                                 }
                             };
-                            if writer.write_all(&[0x01]).await.is_err()
-                                || writer
-                                    .write_all(&(blob.len() as u32).to_le_bytes())
-                                    .await
-                                    .is_err()
-                                || writer.write_all(&blob).await.is_err()
-                            {
+                            // One write per frame rather than one per header field.
+                            push_frame(&mut out, 0x01, &blob);
+                            if write_out(writer, &mut out).await.is_err() {
                                 return;
                             }
                         }
@@ -3406,10 +3455,12 @@ mod unix_impl {
             RawResponse::Error(msg) => (0x00, msg.into_bytes()),
         };
 
-        let _ = writer.write_all(&[type_byte]).await;
-        let _ = writer
-            .write_all(&(payload.len() as u32).to_le_bytes())
-            .await;
+        // The payload can be a large diagnostics blob: send the 5-byte header
+        // from the stack and the payload as-is instead of copying it into a
+        // frame buffer.
+        let mut header = [type_byte; 5];
+        header[1..].copy_from_slice(&(payload.len() as u32).to_le_bytes());
+        let _ = writer.write_all(&header).await;
         let _ = writer.write_all(&payload).await;
     }
 
@@ -3765,6 +3816,23 @@ mod unix_impl {
         }
     }
 
+    // =========================================================================
+    // Tests for the rkyv-mode socket framing (`push_frame`).
+    // =========================================================================
+    #[cfg(all(test, feature = "daemon"))]
+    mod frame_tests {
+        use super::*;
+
+        /// Frames queue back to back as `[type][u32 LE len][payload]`.
+        #[test]
+        fn push_frame_appends_header_and_payload() {
+            let mut buf = Vec::new();
+            push_frame(&mut buf, 0x01, b"abc");
+            push_frame(&mut buf, 0x00, b"");
+            assert_eq!(buf, [0x01, 3, 0, 0, 0, b'a', b'b', b'c', 0x00, 0, 0, 0, 0]);
+        }
+    }
+
     // =========================================================================
     // Tests for per-file diagnostics + JSON mirror.
     //
@@ -4539,7 +4607,7 @@ pub fn maybe_start_daemon(root: &Path) {
     #[cfg(all(unix, feature = "daemon"))]
     {
         use crate::config::NormalizeConfig;
-        let config = NormalizeConfig::load(root);
+        let config = NormalizeConfig::load_shared(root);
         if !config.daemon.enabled() || !config.daemon.auto_start() || !config.index.enabled() {
             return;
         }
@@ -19,14 +19,14 @@ pub use normalize_index::{
 /// Open or create an index for a directory.
 /// Index is stored in .normalize/index.sqlite (or NORMALIZE_INDEX_DIR if set).
 pub async fn open(root: &Path) -> Result<FileIndex, libsql::Error> {
-    let config = NormalizeConfig::load(root);
+    let config = NormalizeConfig::load_shared(root);
     normalize_index::open(root, &config.walk).await
 }
 
 /// Open index only if indexing is enabled in config.
 /// Returns None if `[index] enabled = false`.
 pub async fn open_if_enabled(root: &Path) -> Option<FileIndex> {
-    let config = NormalizeConfig::load(root);
+    let config = NormalizeConfig::load_shared(root);
     normalize_index::open_if_enabled(root, &config.index, &config.walk).await
 }
 
@@ -34,18 +34,18 @@ pub async fn open_if_enabled(root: &Path) -> Option<FileIndex> {
 ///
 /// Returns an error if indexing is disabled in config.
 pub async fn ensure_ready(root: &Path) -> Result<FileIndex, String> {
-    let config = NormalizeConfig::load(root);
+    let config = NormalizeConfig::load_shared(root);
     normalize_index::ensure_ready(root, &config.index, &config.walk).await
 }
 
 /// Ensure the index is ready **and** contains import-graph data.
 pub async fn require_import_graph(root: &Path) -> Result<FileIndex, String> {
-    let config = NormalizeConfig::load(root);
+    let config = NormalizeConfig::load_shared(root);
     normalize_index::require_import_graph(root, &config.index, &config.walk).await
 }
 
 /// Like [`ensure_ready`] but returns `Option`, printing a hint to stderr on failure.
 pub async fn ensure_ready_or_warn(root: &Path) -> Option<FileIndex> {
-    let config = NormalizeConfig::load(root);
+    let config = NormalizeConfig::load_shared(root);
     normalize_index::ensure_ready_or_warn(root, &config.index, &config.walk).await
 }
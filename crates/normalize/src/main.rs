@@ -377,7 +377,11 @@ async fn main() -> std::process::ExitCode {
     record_last_command(&argv);
 
     let service = normalize::service::NormalizeService::new();
-    match service.cli_run_with_async(argv).await {
+    let result = service.cli_run_with_async(argv).await;
+    // The symbol cache is a never-dropped static: write its pending recency
+    // bumps before the process exits.
+    normalize_facts::flush_symbol_cache();
+    match result {
         Ok(()) => std::process::ExitCode::SUCCESS,
         Err(e) => {
             eprintln!("{}", e);
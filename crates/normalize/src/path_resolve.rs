@@ -81,7 +81,7 @@ impl PathSource for IndexPathSource {
 }
 
 fn alias_lookup(root: &Path) -> impl Fn(&str) -> Option<Vec<String>> {
-    let config = NormalizeConfig::load(root);
+    let config = NormalizeConfig::load_shared(root);
     move |name: &str| config.aliases.get(name)
 }
 
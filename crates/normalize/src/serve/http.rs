@@ -6,14 +6,17 @@ use crate::index::FileIndex;
 use crate::skeleton::SkeletonExtractor;
 use axum::{
     Json, Router,
+    body::Bytes,
     extract::{Path, Query, State},
-    http::StatusCode,
+    http::{StatusCode, header},
+    response::IntoResponse,
     routing::get,
+    serve::ListenerExt,
 };
 use serde::{Deserialize, Serialize};
+use std::collections::HashSet;
 use std::net::SocketAddr;
-use std::sync::Arc;
-use tokio::sync::Mutex;
+use std::sync::{Arc, OnceLock};
 use utoipa::{OpenApi, ToSchema};
 
 /// OpenAPI documentation
@@ -40,9 +43,13 @@ use utoipa::{OpenApi, ToSchema};
 pub struct ApiDoc;
 
 /// Shared server state.
+///
+/// All `FileIndex` queries take `&self`, so the index is shared without a lock:
+/// requests run in parallel across the runtime's worker threads instead of
+/// queueing behind a single mutex.
 struct AppState {
     root: std::path::PathBuf,
-    index: Mutex<FileIndex>,
+    index: FileIndex,
 }
 
 /// Start the HTTP server.
@@ -58,7 +65,19 @@ pub async fn run_http_server(root: &std::path::Path, port: u16) -> i32 {
 
     let state = Arc::new(AppState {
         root: root.to_path_buf(),
-        index: Mutex::new(index),
+        index,
+    });
+
+    // Grammars are loaded and their tags queries compiled lazily, so without
+    // this the first `/files/{path}` request per language would pay for it.
+    // Warm them in the background while the listener comes up.
+    let warm_state = state.clone();
+    tokio::spawn(async move {
+        let files = warm_state.index.all_files().await.unwrap_or_default();
+        let _ = tokio::task::spawn_blocking(move || {
+            warm_grammars(files.iter().map(|f| f.path.as_str()));
+        })
+        .await;
     });
 
     // Build routes
@@ -66,9 +85,9 @@ pub async fn run_http_server(root: &std::path::Path, port: u16) -> i32 {
         .route("/openapi.json", get(openapi_spec))
         .route("/health", get(health))
         .route("/files", get(list_files))
-        .route("/files/*path", get(get_file))
+        .route("/files/{*path}", get(get_file))
         .route("/symbols", get(list_symbols))
-        .route("/symbols/:name", get(get_symbol))
+        .route("/symbols/{name}", get(get_symbol))
         .route("/search", get(search))
         .with_state(state);
 
@@ -76,8 +95,14 @@ pub async fn run_http_server(root: &std::path::Path, port: u16) -> i32 {
     eprintln!("HTTP server listening on http://{}", addr);
     eprintln!("OpenAPI spec available at http://{}/openapi.json", addr);
 
+    // Responses are small JSON bodies written in one go; disable Nagle so they
+    // aren't held back waiting for the client's delayed ACK.
     let listener = match tokio::net::TcpListener::bind(addr).await {
-        Ok(l) => l,
+        Ok(l) => l.tap_io(|tcp| {
+            if let Err(e) = tcp.set_nodelay(true) {
+                tracing::trace!("failed to set TCP_NODELAY on incoming connection: {e}");
+            }
+        }),
         Err(e) => {
             eprintln!("Failed to bind to port {}: {}", port, e);
             return 1;
@@ -92,9 +117,43 @@ pub async fn run_http_server(root: &std::path::Path, port: u16) -> i32 {
     0
 }
 
+/// Load the grammar and compile the tags query once for each language among
+/// `paths`.
+fn warm_grammars<'a>(paths: impl Iterator<Item = &'a str>) {
+    let loader = normalize_languages::parsers::grammar_loader();
+    let mut seen = HashSet::new();
+    for path in paths {
+        let Some(lang) = normalize_languages::support_for_path(std::path::Path::new(path)) else {
+            continue;
+        };
+        let grammar = lang.grammar_name();
+        if seen.insert(grammar)
+            && let Some(tags) = loader.get_tags(grammar)
+        {
+            let _ = loader.get_compiled_query(grammar, "tags", &tags);
+        }
+    }
+}
+
 /// Serve OpenAPI spec as JSON
-async fn openapi_spec() -> Json<utoipa::openapi::OpenApi> {
-    Json(ApiDoc::openapi())
+///
+/// The spec is fixed for the life of the process, so it is built and
+/// serialized once; every request then shares the same encoded body. Only a
+/// successful encoding is cached, so a failure answers 500 and is retried on
+/// the next request.
+async fn openapi_spec() -> axum::response::Response {
+    static SPEC_JSON: OnceLock<Bytes> = OnceLock::new();
+    let body = match SPEC_JSON.get() {
+        Some(body) => body.clone(),
+        None => match serde_json::to_vec(&ApiDoc::openapi()) {
+            Ok(json) => SPEC_JSON.get_or_init(|| Bytes::from(json)).clone(),
+            Err(e) => {
+                tracing::warn!("failed to serialize OpenAPI spec: {e}");
+                return (StatusCode::INTERNAL_SERVER_ERROR, e.to_string()).into_response();
+            }
+        },
+    };
+    ([(header::CONTENT_TYPE, "application/json")], body).into_response()
 }
 
 /// Health check response.
@@ -116,7 +175,7 @@ pub struct HealthResponse {
     tag = "health"
 )]
 async fn health(State(state): State<Arc<AppState>>) -> Json<HealthResponse> {
-    let files_indexed = state.index.lock().await.count().await.unwrap_or(0);
+    let files_indexed = state.index.count().await.unwrap_or(0);
     Json(HealthResponse {
         status: "ok",
         files_indexed,
@@ -158,8 +217,6 @@ async fn list_files(
 
     let files = state
         .index
-        .lock()
-        .await
         .find_like(pattern)
         .await
         .unwrap_or_default()
@@ -186,7 +243,7 @@ pub struct SymbolInfo {
     /// Symbol name
     name: String,
     /// Symbol kind (function, class, etc.)
-    kind: String,
+    kind: &'static str,
     /// Line number
     line: usize,
 }
@@ -209,30 +266,34 @@ async fn get_file(
     Path(path): Path<String>,
 ) -> Result<Json<FileInfoResponse>, StatusCode> {
     let file_path = state.root.join(&path);
-    if !file_path.exists() {
-        return Err(StatusCode::NOT_FOUND);
-    }
-
-    let content =
-        std::fs::read_to_string(&file_path).map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
 
-    let extractor = SkeletonExtractor::new();
-    let result = extractor.extract(&file_path, &content);
+    // Reading and parsing the file is synchronous CPU/disk work; run it on the
+    // blocking pool so it doesn't stall other requests on this worker thread.
+    let symbols = tokio::task::spawn_blocking(move || {
+        if !file_path.exists() {
+            return Err(StatusCode::NOT_FOUND);
+        }
 
-    let symbols: Vec<SymbolInfo> = result
-        .symbols
-        .iter()
-        .map(|s| SymbolInfo {
-            name: s.name.clone(),
-            kind: s.kind.as_str().to_string(),
-            line: s.start_line,
-        })
-        .collect();
+        let content =
+            std::fs::read_to_string(&file_path).map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
+
+        let extractor = SkeletonExtractor::new();
+        let result = extractor.extract(&file_path, &content);
+
+        Ok(result
+            .symbols
+            .iter()
+            .map(|s| SymbolInfo {
+                name: s.name.clone(),
+                kind: s.kind.as_str(),
+                line: s.start_line,
+            })
+            .collect::<Vec<_>>())
+    })
+    .await
+    .map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)??;
 
-    Ok(Json(FileInfoResponse {
-        path: path.clone(),
-        symbols,
-    }))
+    Ok(Json(FileInfoResponse { path, symbols }))
 }
 
 /// Symbol search query.
@@ -285,8 +346,6 @@ async fn list_symbols(
 
     let symbols = state
         .index
-        .lock()
-        .await
         .find_symbols(name, query.kind.as_deref(), false, limit)
         .await
         .unwrap_or_default()
@@ -334,13 +393,7 @@ async fn get_symbol(
     State(state): State<Arc<AppState>>,
     Path(name): Path<String>,
 ) -> Result<Json<SymbolDetailResponse>, StatusCode> {
-    let matches = state
-        .index
-        .lock()
-        .await
-        .find_symbol(&name)
-        .await
-        .unwrap_or_default();
+    let matches = state.index.find_symbol(&name).await.unwrap_or_default();
 
     if matches.is_empty() {
         return Err(StatusCode::NOT_FOUND);
@@ -349,8 +402,9 @@ async fn get_symbol(
     // Return the first match with its source code
     let (file, _kind, start, end) = &matches[0];
     let abs_path = state.root.join(file);
-    let content =
-        std::fs::read_to_string(&abs_path).map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
+    let content = tokio::fs::read_to_string(&abs_path)
+        .await
+        .map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
     let lines: Vec<&str> = content.lines().collect();
     let start_idx = (*start).saturating_sub(1);
     let end_idx = (*end).min(lines.len());
@@ -416,7 +470,7 @@ async fn search(
     let limit = query.limit.unwrap_or(20);
     let mut results = Vec::new();
 
-    let index = state.index.lock().await;
+    let index = &state.index;
 
     if search_type == "all" || search_type == "file" {
         // Search files
@@ -5,7 +5,8 @@
 
 use crate::index::FileIndex;
 use crate::skeleton::SkeletonExtractor;
-use std::collections::HashSet;
+use normalize_facts::ExtractResult;
+use std::collections::{HashMap, HashSet};
 use std::path::PathBuf;
 use std::sync::Arc;
 use tokio::sync::Mutex;
@@ -13,6 +14,101 @@ use tower_lsp::jsonrpc::Result;
 use tower_lsp::lsp_types::*;
 use tower_lsp::{Client, LanguageServer, LspService, Server};
 
+/// Maximum number of files whose skeletons are kept by the LSP backend.
+const SKELETON_CACHE_CAPACITY: usize = 256;
+
+/// A rule engine that publishes LSP diagnostics.
+#[derive(Clone, Copy)]
+enum DiagnosticEngine {
+    Syntax = 0,
+    Fact = 1,
+    Native = 2,
+}
+
+impl DiagnosticEngine {
+    fn rule_kind(self) -> normalize_rules::RuleKind {
+        match self {
+            Self::Syntax => normalize_rules::RuleKind::Syntax,
+            Self::Fact => normalize_rules::RuleKind::Fact,
+            Self::Native => normalize_rules::RuleKind::Native,
+        }
+    }
+}
+
+/// Diagnostics per file from every engine.
+///
+/// `publishDiagnostics` replaces everything the client holds for a URI, so each
+/// publish must carry the combined syntax + fact + native list. Keeping the
+/// combined list last sent per file also lets a re-run skip files whose
+/// diagnostics did not change.
+#[derive(Default)]
+struct FileDiagnostics {
+    /// Each engine's latest diagnostics per file, indexed by `DiagnosticEngine`.
+    by_engine: [HashMap<Url, Vec<Diagnostic>>; 3],
+    /// Combined list last published per file (absent means none).
+    published: HashMap<Url, Vec<Diagnostic>>,
+}
+
+impl FileDiagnostics {
+    /// Replace `engine`'s diagnostics for one file. Returns the combined list
+    /// to publish if it changed.
+    fn set_file(
+        &mut self,
+        engine: DiagnosticEngine,
+        uri: Url,
+        diagnostics: Vec<Diagnostic>,
+    ) -> Option<(Url, Vec<Diagnostic>)> {
+        let files = &mut self.by_engine[engine as usize];
+        if diagnostics.is_empty() {
+            files.remove(&uri);
+        } else {
+            files.insert(uri.clone(), diagnostics);
+        }
+        self.recombine(&uri).map(|combined| (uri, combined))
+    }
+
+    /// Replace all of `engine`'s diagnostics with a workspace-wide result.
+    /// Returns the combined lists that changed, including files to clear.
+    fn set_all(
+        &mut self,
+        engine: DiagnosticEngine,
+        mut files: HashMap<Url, Vec<Diagnostic>>,
+    ) -> Vec<(Url, Vec<Diagnostic>)> {
+        files.retain(|_, d| !d.is_empty());
+        let previous = std::mem::replace(&mut self.by_engine[engine as usize], files);
+        let touched: HashSet<Url> = previous
+            .into_keys()
+            .chain(self.by_engine[engine as usize].keys().cloned())
+            .collect();
+        touched
+            .into_iter()
+            .filter_map(|uri| self.recombine(&uri).map(|combined| (uri, combined)))
+            .collect()
+    }
+
+    /// Rebuild the combined list for `uri`; `Some` if it differs from the last
+    /// published one.
+    fn recombine(&mut self, uri: &Url) -> Option<Vec<Diagnostic>> {
+        let combined: Vec<Diagnostic> = self
+            .by_engine
+            .iter()
+            .filter_map(|files| files.get(uri))
+            .flatten()
+            .cloned()
+            .collect();
+        let previous = self.published.get(uri).map_or(&[][..], Vec::as_slice);
+        if combined == previous {
+            return None;
+        }
+        if combined.is_empty() {
+            self.published.remove(uri);
+        } else {
+            self.published.insert(uri.clone(), combined.clone());
+        }
+        Some(combined)
+    }
+}
+
 /// Normalize LSP backend.
 struct NormalizeBackend {
     client: Client,
@@ -20,18 +116,24 @@ struct NormalizeBackend {
     index: Mutex<Option<FileIndex>>,
     /// Persistent extractor — avoids recreating grammar caches per request.
     extractor: SkeletonExtractor,
-    /// Files with syntax diagnostics in the last per-file run.
-    syntax_diagnosed_files: Arc<Mutex<HashSet<Url>>>,
-    /// Files with fact diagnostics in the last workspace-wide run.
-    fact_diagnosed_files: Arc<Mutex<HashSet<Url>>>,
+    /// Last skeleton per file, keyed by a hash of the content it was built from.
+    /// Editors fire document-symbol and hover requests in bursts against the same
+    /// buffer; unchanged content reuses the previous extraction instead of reparsing.
+    skeleton_cache: std::sync::Mutex<HashMap<PathBuf, (u64, Arc<ExtractResult>)>>,
+    /// Files with a per-file syntax run in flight, mapped to whether another
+    /// save arrived meanwhile and the run should repeat.
+    syntax_runs: Arc<std::sync::Mutex<HashMap<PathBuf, bool>>>,
+    /// Per-engine and published diagnostics for every file.
+    diagnostics: Arc<Mutex<FileDiagnostics>>,
     /// Generation counter for debouncing fact diagnostic runs.
     fact_diagnostics_generation: Arc<std::sync::atomic::AtomicU64>,
     /// Debounce interval for fact diagnostics in milliseconds.
     fact_debounce_ms: std::sync::atomic::AtomicU64,
-    /// Files with native rule diagnostics in the last workspace-wide run.
-    native_diagnosed_files: Arc<Mutex<HashSet<Url>>>,
     /// Generation counter for debouncing native diagnostic runs.
     native_diagnostics_generation: Arc<std::sync::atomic::AtomicU64>,
+    /// Whether the client accepts a dynamically registered
+    /// `workspace/didChangeWatchedFiles` watcher for config files.
+    watch_config_files: std::sync::atomic::AtomicBool,
 }
 
 impl NormalizeBackend {
@@ -41,15 +143,46 @@ impl NormalizeBackend {
             root: Mutex::new(None),
             index: Mutex::new(None),
             extractor: SkeletonExtractor::new(),
-            syntax_diagnosed_files: Arc::new(Mutex::new(HashSet::new())),
-            fact_diagnosed_files: Arc::new(Mutex::new(HashSet::new())),
+            skeleton_cache: std::sync::Mutex::new(HashMap::new()),
+            syntax_runs: Arc::new(std::sync::Mutex::new(HashMap::new())),
+            diagnostics: Arc::new(Mutex::new(FileDiagnostics::default())),
             fact_diagnostics_generation: Arc::new(std::sync::atomic::AtomicU64::new(0)),
             fact_debounce_ms: std::sync::atomic::AtomicU64::new(
                 super::ServeConfig::default().fact_debounce_ms(),
             ),
-            native_diagnosed_files: Arc::new(Mutex::new(HashSet::new())),
             native_diagnostics_generation: Arc::new(std::sync::atomic::AtomicU64::new(0)),
+            watch_config_files: std::sync::atomic::AtomicBool::new(false),
+        }
+    }
+
+    /// Extract symbols for `path`, reusing the cached result when `content` is
+    /// unchanged since the last extraction of that path.
+    fn extract_skeleton(&self, path: &std::path::Path, content: &str) -> Arc<ExtractResult> {
+        use std::hash::{Hash, Hasher};
+        let mut hasher = std::collections::hash_map::DefaultHasher::new();
+        content.hash(&mut hasher);
+        let content_hash = hasher.finish();
+
+        if let Some((hash, result)) = self
+            .skeleton_cache
+            .lock()
+            .unwrap_or_else(|e| e.into_inner())
+            .get(path)
+            && *hash == content_hash
+        {
+            return Arc::clone(result);
         }
+
+        let result = Arc::new(self.extractor.extract(path, content));
+        let mut cache = self
+            .skeleton_cache
+            .lock()
+            .unwrap_or_else(|e| e.into_inner());
+        if cache.len() >= SKELETON_CACHE_CAPACITY && !cache.contains_key(path) {
+            cache.clear();
+        }
+        cache.insert(path.to_path_buf(), (content_hash, Arc::clone(&result)));
+        result
     }
 
     /// Initialize index for the workspace root.
@@ -58,16 +191,55 @@ impl NormalizeBackend {
             *self.index.lock().await = Some(idx);
         }
 
-        // Load configurable debounce from project config
-        let config = crate::config::NormalizeConfig::load(&root);
+        self.apply_config(&root);
+
+        *self.root.lock().await = Some(root.clone());
+
+        // Run initial diagnostics (all rules, no debounce)
+        self.schedule_all_diagnostics().await;
+    }
+
+    /// Pick up settings the server holds onto from the project config.
+    ///
+    /// Everything else re-reads config per run (`NormalizeConfig::load` is
+    /// cached and revalidated against file stamps), so only values copied into
+    /// the backend need refreshing here.
+    fn apply_config(&self, root: &std::path::Path) {
+        let config = crate::config::NormalizeConfig::load_shared(root);
         self.fact_debounce_ms.store(
             config.serve.fact_debounce_ms(),
             std::sync::atomic::Ordering::Relaxed,
         );
+    }
 
-        *self.root.lock().await = Some(root.clone());
+    /// Ask the client to report config edits made outside the editor too.
+    /// Clients without dynamic registration still reload on did_save.
+    async fn register_config_watch(&self) {
+        let watchers = DidChangeWatchedFilesRegistrationOptions {
+            watchers: vec![FileSystemWatcher {
+                glob_pattern: GlobPattern::String("**/.normalize/config.toml".to_string()),
+                kind: None,
+            }],
+        };
+        let registration = Registration {
+            id: "normalize-config-watch".to_string(),
+            method: "workspace/didChangeWatchedFiles".to_string(),
+            register_options: serde_json::to_value(watchers).ok(),
+        };
+        if let Err(e) = self.client.register_capability(vec![registration]).await {
+            tracing::debug!("config file watch not registered: {e}");
+        }
+    }
 
-        // Run initial diagnostics (all rules, no debounce)
+    /// Reload config after a `.normalize/config.toml` change and re-run every
+    /// engine, since rule settings may have changed for all files.
+    async fn reload_config(&self) {
+        let root = self.root.lock().await.clone();
+        let Some(root) = root else { return };
+        self.apply_config(&root);
+        self.client
+            .log_message(MessageType::INFO, "normalize config reloaded")
+            .await;
         self.schedule_all_diagnostics().await;
     }
 
@@ -77,36 +249,24 @@ impl NormalizeBackend {
         let Some(root) = root else { return };
 
         let client = self.client.clone();
-        let syntax_diagnosed = Arc::clone(&self.syntax_diagnosed_files);
-        let fact_diagnosed = Arc::clone(&self.fact_diagnosed_files);
-        let native_diagnosed = Arc::clone(&self.native_diagnosed_files);
+        let diagnostics = Arc::clone(&self.diagnostics);
 
         tokio::spawn(async move {
-            run_and_publish_diagnostics(
-                &client,
-                &root,
-                &normalize_rules::RuleKind::Syntax,
-                &syntax_diagnosed,
-            )
-            .await;
-            run_and_publish_diagnostics(
-                &client,
-                &root,
-                &normalize_rules::RuleKind::Fact,
-                &fact_diagnosed,
-            )
-            .await;
-            run_and_publish_diagnostics(
-                &client,
-                &root,
-                &normalize_rules::RuleKind::Native,
-                &native_diagnosed,
-            )
-            .await;
+            for engine in [
+                DiagnosticEngine::Syntax,
+                DiagnosticEngine::Fact,
+                DiagnosticEngine::Native,
+            ] {
+                run_and_publish_diagnostics(&client, &root, engine, &diagnostics).await;
+            }
         });
     }
 
     /// Run syntax diagnostics immediately for a single file.
+    ///
+    /// Bursts of saves for the same file (save-all, format-on-save) are
+    /// coalesced: while a run is in flight, further saves only ask it to go
+    /// once more when it finishes, so N saves cost at most two runs.
     async fn run_syntax_diagnostics_for_file(&self, uri: &Url) {
         let file_path = match uri.to_file_path() {
             Ok(p) => p,
@@ -116,65 +276,38 @@ impl NormalizeBackend {
         let root = self.root.lock().await.clone();
         let Some(root) = root else { return };
 
+        {
+            let mut runs = self.syntax_runs.lock().unwrap_or_else(|e| e.into_inner());
+            if let Some(rerun) = runs.get_mut(&file_path) {
+                *rerun = true;
+                return;
+            }
+            runs.insert(file_path.clone(), false);
+        }
+
         let client = self.client.clone();
-        let syntax_diagnosed = Arc::clone(&self.syntax_diagnosed_files);
-        let file_owned = file_path.clone();
-        let root_owned = root.clone();
+        let diagnostics = Arc::clone(&self.diagnostics);
+        let syntax_runs = Arc::clone(&self.syntax_runs);
 
         tokio::spawn(async move {
-            let report = tokio::task::spawn_blocking(move || {
-                let config = crate::config::NormalizeConfig::load(&root_owned);
-                let rules_config = normalize_rules::RulesRunConfig {
-                    rule_tags: config.rule_tags.0.clone(),
-                    rules: config.rules.clone(),
-                    walk: config.walk.clone(),
+            loop {
+                publish_syntax_diagnostics(&client, &root, &file_path, &diagnostics).await;
+                let again = {
+                    let mut runs = syntax_runs.lock().unwrap_or_else(|e| e.into_inner());
+                    match runs.get_mut(&file_path) {
+                        Some(rerun) if *rerun => {
+                            *rerun = false;
+                            true
+                        }
+                        _ => {
+                            runs.remove(&file_path);
+                            false
+                        }
+                    }
                 };
-                normalize_rules::run_rules_report(
-                    &file_owned,
-                    &root_owned,
-                    None,
-                    None,
-                    &normalize_rules::RuleKind::Syntax,
-                    &[],
-                    &rules_config,
-                    None,
-                    &normalize_rules_config::PathFilter::default(),
-                )
-            })
-            .await;
-
-            let report = match report {
-                Ok(r) => r,
-                Err(e) => {
-                    client
-                        .log_message(
-                            MessageType::ERROR,
-                            format!("Failed to run syntax diagnostics: {e}"),
-                        )
-                        .await;
-                    return;
-                }
-            };
-
-            let diagnostics: Vec<Diagnostic> =
-                report.issues.iter().map(issue_to_lsp_diagnostic).collect();
-
-            let uri = match Url::from_file_path(&file_path) {
-                Ok(u) => u,
-                Err(_) => return,
-            };
-
-            let mut prev = syntax_diagnosed.lock().await;
-            if diagnostics.is_empty() {
-                // Clear syntax diagnostics for this file if it had them before
-                if prev.remove(&uri) {
-                    client.publish_diagnostics(uri, vec![], None).await;
+                if !again {
+                    break;
                 }
-            } else {
-                client
-                    .publish_diagnostics(uri.clone(), diagnostics, None)
-                    .await;
-                prev.insert(uri);
             }
         });
     }
@@ -198,7 +331,7 @@ impl NormalizeBackend {
         });
 
         let client = self.client.clone();
-        let fact_diagnosed = Arc::clone(&self.fact_diagnosed_files);
+        let diagnostics = Arc::clone(&self.diagnostics);
         let gen_ref = Arc::clone(&self.fact_diagnostics_generation);
         let debounce_ms = self
             .fact_debounce_ms
@@ -222,13 +355,7 @@ impl NormalizeBackend {
                     .await;
             }
 
-            run_and_publish_diagnostics(
-                &client,
-                &root,
-                &normalize_rules::RuleKind::Fact,
-                &fact_diagnosed,
-            )
-            .await;
+            run_and_publish_diagnostics(&client, &root, DiagnosticEngine::Fact, &diagnostics).await;
         });
     }
 
@@ -244,7 +371,7 @@ impl NormalizeBackend {
         let Some(root) = root else { return };
 
         let client = self.client.clone();
-        let native_diagnosed = Arc::clone(&self.native_diagnosed_files);
+        let diagnostics = Arc::clone(&self.diagnostics);
         let gen_ref = Arc::clone(&self.native_diagnostics_generation);
         let debounce_ms = self
             .fact_debounce_ms
@@ -258,13 +385,8 @@ impl NormalizeBackend {
                 return; // superseded by a newer request
             }
 
-            run_and_publish_diagnostics(
-                &client,
-                &root,
-                &normalize_rules::RuleKind::Native,
-                &native_diagnosed,
-            )
-            .await;
+            run_and_publish_diagnostics(&client, &root, DiagnosticEngine::Native, &diagnostics)
+                .await;
         });
     }
 
@@ -290,6 +412,16 @@ impl NormalizeBackend {
 #[tower_lsp::async_trait]
 impl LanguageServer for NormalizeBackend {
     async fn initialize(&self, params: InitializeParams) -> Result<InitializeResult> {
+        let watch_config_files = params
+            .capabilities
+            .workspace
+            .as_ref()
+            .and_then(|w| w.did_change_watched_files.as_ref())
+            .and_then(|w| w.dynamic_registration)
+            .unwrap_or(false);
+        self.watch_config_files
+            .store(watch_config_files, std::sync::atomic::Ordering::Relaxed);
+
         // Get workspace root from params
         if let Some(root_uri) = params.root_uri
             && let Ok(path) = root_uri.to_file_path()
@@ -333,6 +465,13 @@ impl LanguageServer for NormalizeBackend {
     }
 
     async fn initialized(&self, _: InitializedParams) {
+        if self
+            .watch_config_files
+            .load(std::sync::atomic::Ordering::Relaxed)
+        {
+            self.register_config_watch().await;
+        }
+
         self.client
             .log_message(MessageType::INFO, "normalize LSP server initialized")
             .await;
@@ -344,6 +483,10 @@ impl LanguageServer for NormalizeBackend {
 
     async fn did_save(&self, params: DidSaveTextDocumentParams) {
         let uri = &params.text_document.uri;
+        if is_config_file(uri) {
+            self.reload_config().await;
+            return;
+        }
         // Fast: per-file syntax diagnostics (immediate)
         self.run_syntax_diagnostics_for_file(uri).await;
         // Slow: workspace-wide fact diagnostics (debounced)
@@ -364,7 +507,14 @@ impl LanguageServer for NormalizeBackend {
                 .map(|p| p.ends_with(".git/index"))
                 .unwrap_or(false)
         });
-        if is_git_index {
+        if params
+            .changes
+            .iter()
+            .any(|change| is_config_file(&change.uri))
+        {
+            // Re-runs native rules as well, so this covers a concurrent .git/index change.
+            self.reload_config().await;
+        } else if is_git_index {
             self.schedule_native_diagnostics().await;
         }
     }
@@ -385,8 +535,8 @@ impl LanguageServer for NormalizeBackend {
             Err(_) => return Ok(None),
         };
 
-        // Extract symbols using persistent extractor
-        let result = self.extractor.extract(&file_path, &content);
+        // Extract symbols, reusing the last result if the file is unchanged
+        let result = self.extract_skeleton(&file_path, &content);
 
         // Convert to LSP document symbols (nested structure)
         fn to_document_symbol(sym: &normalize_languages::Symbol) -> DocumentSymbol {
@@ -500,8 +650,8 @@ impl LanguageServer for NormalizeBackend {
             Err(_) => return Ok(None),
         };
 
-        // Extract symbols using persistent extractor
-        let result = self.extractor.extract(&file_path, &content);
+        // Extract symbols, reusing the last result if the file is unchanged
+        let result = self.extract_skeleton(&file_path, &content);
 
         // Find symbol at position (1-indexed line)
         let line = position.line as usize + 1;
@@ -927,10 +1077,16 @@ fn find_rename_edit(
     let mut pos = 0;
     while let Some(idx) = line[pos..].find(old_name) {
         let abs_idx = pos + idx;
-        let before_ok =
-            abs_idx == 0 || !is_identifier_char(line.chars().nth(abs_idx - 1).unwrap_or(' '));
-        let after_ok = abs_idx + old_name.len() >= line.len()
-            || !is_identifier_char(line.chars().nth(abs_idx + old_name.len()).unwrap_or(' '));
+        // `abs_idx` is a byte offset: look at the neighbouring chars by slicing
+        // rather than `chars().nth`, which counts chars and rescans the line.
+        let before_ok = line[..abs_idx]
+            .chars()
+            .next_back()
+            .is_none_or(|c| !is_identifier_char(c));
+        let after_ok = line[abs_idx + old_name.len()..]
+            .chars()
+            .next()
+            .is_none_or(|c| !is_identifier_char(c));
 
         if before_ok && after_ok {
             return Some(TextEdit {
@@ -1044,17 +1200,81 @@ fn issue_to_lsp_diagnostic(issue: &normalize_output::diagnostics::Issue) -> Diag
     }
 }
 
+/// Whether `uri` is a normalize project config file (`.normalize/config.toml`).
+fn is_config_file(uri: &Url) -> bool {
+    uri.to_file_path()
+        .is_ok_and(|p| p.ends_with(".normalize/config.toml"))
+}
+
+/// Run syntax rules on one file and publish its diagnostics if they changed.
+async fn publish_syntax_diagnostics(
+    client: &Client,
+    root: &std::path::Path,
+    file_path: &std::path::Path,
+    diagnostics: &Mutex<FileDiagnostics>,
+) {
+    let file_owned = file_path.to_path_buf();
+    let root_owned = root.to_path_buf();
+    let report = tokio::task::spawn_blocking(move || {
+        let config = crate::config::NormalizeConfig::load_shared(&root_owned);
+        let rules_config = normalize_rules::RulesRunConfig {
+            rule_tags: config.rule_tags.0.clone(),
+            rules: config.rules.clone(),
+            walk: config.walk.clone(),
+        };
+        normalize_rules::run_rules_report(
+            &file_owned,
+            &root_owned,
+            None,
+            None,
+            &normalize_rules::RuleKind::Syntax,
+            &[],
+            &rules_config,
+            None,
+            &normalize_rules_config::PathFilter::default(),
+        )
+    })
+    .await;
+
+    let report = match report {
+        Ok(r) => r,
+        Err(e) => {
+            client
+                .log_message(
+                    MessageType::ERROR,
+                    format!("Failed to run syntax diagnostics: {e}"),
+                )
+                .await;
+            return;
+        }
+    };
+
+    let file_diagnostics: Vec<Diagnostic> =
+        report.issues.iter().map(issue_to_lsp_diagnostic).collect();
+
+    let uri = match Url::from_file_path(file_path) {
+        Ok(u) => u,
+        Err(_) => return,
+    };
+
+    // Hold the lock while publishing so concurrent runs publish in order.
+    let mut state = diagnostics.lock().await;
+    if let Some((uri, combined)) = state.set_file(DiagnosticEngine::Syntax, uri, file_diagnostics) {
+        client.publish_diagnostics(uri, combined, None).await;
+    }
+}
+
 /// Run rules of a specific type and publish diagnostics to the LSP client.
 async fn run_and_publish_diagnostics(
     client: &Client,
     root: &std::path::Path,
-    rule_type: &normalize_rules::RuleKind,
-    diagnosed_files: &Mutex<HashSet<Url>>,
+    engine: DiagnosticEngine,
+    diagnostics: &Mutex<FileDiagnostics>,
 ) {
     let root_owned = root.to_path_buf();
-    let rule_type_owned = rule_type.clone();
+    let rule_type_owned = engine.rule_kind();
     let report = tokio::task::spawn_blocking(move || {
-        let config = crate::config::NormalizeConfig::load(&root_owned);
+        let config = crate::config::NormalizeConfig::load_shared(&root_owned);
         let rules_config = normalize_rules::RulesRunConfig {
             rule_tags: config.rule_tags.0.clone(),
             rules: config.rules.clone(),
@@ -1097,38 +1317,34 @@ async fn run_and_publish_diagnostics(
             .push(issue_to_lsp_diagnostic(issue));
     }
 
-    // Clear diagnostics for files that no longer have issues
-    let mut prev = diagnosed_files.lock().await;
-    let mut new_diagnosed = HashSet::new();
-
-    for (file, diagnostics) in &by_file {
-        let file_path = if std::path::Path::new(file).is_absolute() {
+    let file_count = by_file.len();
+    let mut by_uri = HashMap::with_capacity(file_count);
+    for (file, file_diagnostics) in by_file {
+        let file_path = if std::path::Path::new(&file).is_absolute() {
             std::path::PathBuf::from(file)
         } else {
             root.join(file)
         };
         if let Ok(uri) = Url::from_file_path(&file_path) {
-            client
-                .publish_diagnostics(uri.clone(), diagnostics.clone(), None)
-                .await;
-            new_diagnosed.insert(uri);
+            by_uri.insert(uri, file_diagnostics);
         }
     }
 
-    // Clear stale: files in prev but not in new_diagnosed
-    for uri in prev.difference(&new_diagnosed) {
-        client.publish_diagnostics(uri.clone(), vec![], None).await;
+    // Re-send only files whose combined diagnostics changed, including files
+    // this engine no longer reports on. Hold the lock while publishing so
+    // concurrent runs publish in order.
+    let mut state = diagnostics.lock().await;
+    for (uri, combined) in state.set_all(engine, by_uri) {
+        client.publish_diagnostics(uri, combined, None).await;
     }
 
-    *prev = new_diagnosed;
-
     client
         .log_message(
             MessageType::INFO,
             format!(
                 "Diagnostics: {} issues in {} files",
                 report.issues.len(),
-                by_file.len()
+                file_count
             ),
         )
         .await;
@@ -1139,6 +1355,10 @@ pub async fn run_lsp_server(root: Option<&std::path::Path>) -> i32 {
     let stdin = tokio::io::stdin();
     let stdout = tokio::io::stdout();
 
+    // Files are re-parsed after every edit: keep their trees so re-parses
+    // are incremental.
+    normalize_languages::parsers::grammar_loader().retain_recent_trees();
+
     let (service, socket) = LspService::new(NormalizeBackend::new);
 
     // If root is provided, initialize early (will be overridden by client's root)
@@ -1149,3 +1369,62 @@ pub async fn run_lsp_server(root: Option<&std::path::Path>) -> i32 {
     Server::new(stdin, stdout, socket).serve(service).await;
     0
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn uri(name: &str) -> Url {
+        Url::parse(&format!("file:///project/{name}")).unwrap()
+    }
+
+    fn diag(message: &str) -> Diagnostic {
+        Diagnostic {
+            message: message.to_string(),
+            ..Default::default()
+        }
+    }
+
+    #[test]
+    fn publishes_combined_diagnostics_across_engines() {
+        let mut state = FileDiagnostics::default();
+        let file = uri("a.rs");
+
+        let native = HashMap::from([(file.clone(), vec![diag("native")])]);
+        let sent = state.set_all(DiagnosticEngine::Native, native.clone());
+        assert_eq!(sent, vec![(file.clone(), vec![diag("native")])]);
+
+        // A syntax change must re-send the native diagnostics alongside it.
+        let sent = state.set_file(DiagnosticEngine::Syntax, file.clone(), vec![diag("syntax")]);
+        assert_eq!(
+            sent,
+            Some((file.clone(), vec![diag("syntax"), diag("native")]))
+        );
+
+        // An unchanged native re-run sends nothing.
+        assert!(state.set_all(DiagnosticEngine::Native, native).is_empty());
+    }
+
+    #[test]
+    fn clears_files_only_when_every_engine_is_empty() {
+        let mut state = FileDiagnostics::default();
+        let file = uri("a.rs");
+
+        state.set_file(DiagnosticEngine::Syntax, file.clone(), vec![diag("syntax")]);
+        state.set_all(
+            DiagnosticEngine::Fact,
+            HashMap::from([(file.clone(), vec![diag("fact")])]),
+        );
+
+        let sent = state.set_all(DiagnosticEngine::Fact, HashMap::new());
+        assert_eq!(sent, vec![(file.clone(), vec![diag("syntax")])]);
+
+        let sent = state.set_file(DiagnosticEngine::Syntax, file.clone(), vec![]);
+        assert_eq!(sent, Some((file.clone(), vec![])));
+        assert!(
+            state
+                .set_file(DiagnosticEngine::Syntax, file, vec![])
+                .is_none()
+        );
+    }
+}
@@ -14,8 +14,9 @@
 
 #[cfg(feature = "mcp")]
 mod implementation {
+    use std::path::PathBuf;
     use std::process::Command;
-    use std::sync::Arc;
+    use std::sync::{Arc, OnceLock};
 
     use rmcp::handler::server::router::tool::ToolRouter;
     use rmcp::handler::server::wrapper::Parameters;
@@ -57,24 +58,37 @@ mod implementation {
         ) -> Result<CallToolResult, McpError> {
             let root = self.root.clone();
             let command = req.command;
-            let result =
+            let outcome =
                 tokio::task::spawn_blocking(move || execute_normalize_command(&command, &root))
-                    .await
-                    .unwrap_or_else(|e| CommandResult {
-                        output: format!("Task panicked: {}", e),
-                        exit_code: 1,
-                    });
-
-            let content = if result.exit_code == 0 {
-                Content::text(&result.output)
+                    .await;
+
+            // Expected failures (a bad command, normalize exiting non-zero) go
+            // back to the caller as tool errors it can act on. Anything else is
+            // a server-side fault: log the details here and give the client a
+            // generic error rather than echoing internals.
+            let result = match outcome {
+                Ok(Ok(result)) => result,
+                Ok(Err(CommandError::Invalid(message))) => {
+                    return Ok(CallToolResult::error(vec![Content::text(message)]));
+                }
+                Ok(Err(CommandError::Launch(e))) => {
+                    tracing::error!("failed to launch normalize for MCP tool call: {e}");
+                    return Err(McpError::internal_error("failed to run normalize", None));
+                }
+                Err(e) => {
+                    tracing::error!("MCP tool call task failed: {e}");
+                    return Err(McpError::internal_error("failed to run normalize", None));
+                }
+            };
+
+            if result.exit_code == 0 {
+                Ok(CallToolResult::success(vec![Content::text(result.output)]))
             } else {
-                Content::text(format!(
+                Ok(CallToolResult::error(vec![Content::text(format!(
                     "Error (exit {}): {}",
                     result.exit_code, result.output
-                ))
-            };
-
-            Ok(CallToolResult::success(vec![content]))
+                ))]))
+            }
         }
     }
 
@@ -97,60 +111,53 @@ mod implementation {
         exit_code: i32,
     }
 
-    /// Execute a normalize CLI command.
-    fn execute_normalize_command(command: &str, root: &str) -> CommandResult {
-        let current_exe = match std::env::current_exe() {
-            Ok(exe) => exe,
-            Err(e) => {
-                return CommandResult {
-                    output: format!("Failed to get current executable: {}", e),
-                    exit_code: 1,
-                };
-            }
-        };
+    /// Why a command produced no [`CommandResult`].
+    enum CommandError {
+        /// The request itself is unusable; the message is safe to show the caller.
+        Invalid(String),
+        /// normalize could not be started; details are for the server log only.
+        Launch(String),
+    }
+
+    /// Path to the running normalize binary, resolved on the first tool call
+    /// and reused for every later one.
+    static CURRENT_EXE: OnceLock<Result<PathBuf, String>> = OnceLock::new();
 
+    /// Execute a normalize CLI command.
+    fn execute_normalize_command(command: &str, root: &str) -> Result<CommandResult, CommandError> {
         let args: Vec<&str> = command.split_whitespace().collect();
         if args.is_empty() {
-            return CommandResult {
-                output: "Empty command".to_string(),
-                exit_code: 1,
-            };
+            return Err(CommandError::Invalid("Empty command".to_string()));
         }
 
-        let output = match Command::new(&current_exe)
+        let current_exe = CURRENT_EXE
+            .get_or_init(|| std::env::current_exe().map_err(|e| e.to_string()))
+            .as_ref()
+            .map_err(|e| CommandError::Launch(format!("failed to get current executable: {e}")))?;
+
+        let output = Command::new(current_exe)
             .args(&args)
             .current_dir(root)
             .output()
-        {
-            Ok(out) => out,
-            Err(e) => {
-                return CommandResult {
-                    output: format!("Failed to execute command: {}", e),
-                    exit_code: 1,
-                };
-            }
-        };
+            .map_err(|e| CommandError::Launch(format!("failed to execute `{command}`: {e}")))?;
 
-        let stdout = String::from_utf8_lossy(&output.stdout).to_string();
-        let stderr = String::from_utf8_lossy(&output.stderr).to_string();
+        let stdout = bytes_to_string(output.stdout);
+        let stderr = bytes_to_string(output.stderr);
         let exit_code = output.status.code().unwrap_or(1);
 
-        if exit_code == 0 {
-            CommandResult {
-                output: stdout,
-                exit_code: 0,
-            }
-        } else if stderr.is_empty() {
-            CommandResult {
-                output: stdout,
-                exit_code,
-            }
+        let output = if exit_code == 0 || stderr.is_empty() {
+            stdout
         } else {
-            CommandResult {
-                output: format!("{}\nError: {}", stdout, stderr),
-                exit_code,
-            }
-        }
+            format!("{}\nError: {}", stdout, stderr)
+        };
+        Ok(CommandResult { output, exit_code })
+    }
+
+    /// Take ownership of captured output as a `String`, reusing the buffer when
+    /// it is valid UTF-8 and falling back to a lossy copy otherwise.
+    fn bytes_to_string(bytes: Vec<u8>) -> String {
+        String::from_utf8(bytes)
+            .unwrap_or_else(|e| String::from_utf8_lossy(e.as_bytes()).into_owned())
     }
 
     /// Run the MCP server.
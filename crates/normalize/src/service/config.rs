@@ -352,7 +352,7 @@ fn format_schema_annotated(
 pub struct ConfigError {
     /// Which file the error was found in.
     pub file: String,
-    /// Which validation phase caught the error: "toml", "schema", "deserialize", "rules".
+    /// Which validation phase caught the error: "toml", "schema", "deserialize", "alias", "rules".
     pub phase: String,
     /// Human-readable description of the error.
     pub message: String,
@@ -369,7 +369,8 @@ pub struct ConfigError {
 /// Runs multiple validation phases on each config file (project and global):
 /// 1. TOML syntax (catches duplicate keys, malformed syntax)
 /// 2. JSON Schema compliance (catches unknown sections, type mismatches)
-/// 3. Serde deserialization as `NormalizeConfig` (catches field type mismatches)
+/// 3. Serde deserialization as `NormalizeConfig` (catches field type mismatches),
+///    then command aliases against the CLI command tree
 /// 4. Rules config parsing (catches rules-specific deserialization errors)
 ///
 /// `valid` is true only when `errors` is empty.
@@ -557,6 +558,101 @@ fn validate_against_schema(
     }
 }
 
+/// Run the per-file validation phases (TOML, schema, deserialize + aliases, rules)
+/// on the contents of one config file.
+fn validate_config_contents(
+    config_path: &str,
+    raw: &str,
+    schema_json: &serde_json::Value,
+) -> Vec<ConfigError> {
+    let mut errors = Vec::new();
+
+    // Phase 1: TOML syntax (catches duplicate keys, malformed syntax)
+    let toml_value: Option<toml::Value> = match toml::from_str::<toml::Value>(raw) {
+        Ok(v) => Some(v),
+        Err(e) => {
+            let TomlSpan { line, column } = extract_toml_span(&e);
+            errors.push(ConfigError {
+                file: config_path.to_string(),
+                phase: "toml".to_string(),
+                message: e.message().to_string(),
+                line,
+                column,
+            });
+            None
+        }
+    };
+
+    // Phase 2: JSON Schema validation (catches unknown sections, type mismatches)
+    if let Some(ref tv) = toml_value
+        && let Ok(json_val) = serde_json::to_value(tv)
+    {
+        let schema_errors = validate_against_schema(schema_json, &json_val);
+        for msg in schema_errors {
+            errors.push(ConfigError {
+                file: config_path.to_string(),
+                phase: "schema".to_string(),
+                message: msg,
+                line: None,
+                column: None,
+            });
+        }
+    }
+
+    // Phase 3: Serde deserialization as NormalizeConfig (catches field type mismatches
+    // that schema validation may miss, e.g. wrong enum variants)
+    match toml::from_str::<NormalizeConfig>(raw) {
+        Ok(config) => {
+            // Phase 3b: command aliases against the CLI command tree. Kept out
+            // of config loading so ordinary runs don't build the clap tree.
+            for (name, msg) in crate::config::validate_command_aliases(&config.aliases) {
+                errors.push(ConfigError {
+                    file: config_path.to_string(),
+                    phase: "alias".to_string(),
+                    message: format!("@{name}: {msg}"),
+                    line: None,
+                    column: None,
+                });
+            }
+        }
+        Err(e) => {
+            let TomlSpan { line, column } = extract_toml_span(&e);
+            errors.push(ConfigError {
+                file: config_path.to_string(),
+                phase: "deserialize".to_string(),
+                message: e.message().to_string(),
+                line,
+                column,
+            });
+        }
+    }
+
+    // Phase 4: Rules config parsing (separate deserialization path used by rules engine)
+    #[derive(serde::Deserialize, Default)]
+    #[serde(default)]
+    struct RulesOnlyConfig {
+        rules: normalize_rules::RulesConfig,
+        #[serde(rename = "rule-tags")]
+        #[allow(dead_code)]
+        rule_tags: std::collections::HashMap<String, Vec<String>>,
+    }
+    match toml::from_str::<RulesOnlyConfig>(raw) {
+        Ok(_) => {}
+        Err(e) => {
+            let TomlSpan { line, column } = extract_toml_span(&e);
+            errors.push(ConfigError {
+                file: config_path.to_string(),
+                phase: "rules".to_string(),
+                message: e.message().to_string(),
+                line,
+                column,
+            });
+        }
+    }
+
+    errors
+}
+
 /// Convert a `serde_json::Value` to a pretty TOML string, falling back to JSON.
 fn json_to_toml_string(value: &serde_json::Value) -> String {
     // serde_json → toml::Value → toml string
@@ -787,7 +883,7 @@ impl ConfigService {
     }
 
     /// Validate config files: TOML syntax, JSON Schema compliance, serde deserialization,
-    /// and rules config parsing. Checks both project config (.normalize/config.toml) and
+    /// command aliases, and rules config parsing. Checks both project config (.normalize/config.toml) and
     /// global config (~/.config/normalize/config.toml) unless --file overrides.
     ///
     /// Examples:
@@ -859,76 +955,7 @@ impl ConfigService {
 
             files_checked.push(config_path.clone());
 
-            // Phase 1: TOML syntax (catches duplicate keys, malformed syntax)
-            let toml_value: Option<toml::Value> = match toml::from_str::<toml::Value>(&raw) {
-                Ok(v) => Some(v),
-                Err(e) => {
-                    let TomlSpan { line, column } = extract_toml_span(&e);
-                    all_errors.push(ConfigError {
-                        file: config_path.clone(),
-                        phase: "toml".to_string(),
-                        message: e.message().to_string(),
-                        line,
-                        column,
-                    });
-                    None
-                }
-            };
-
-            // Phase 2: JSON Schema validation (catches unknown sections, type mismatches)
-            if let Some(ref tv) = toml_value
-                && let Ok(json_val) = serde_json::to_value(tv)
-            {
-                let schema_errors = validate_against_schema(&schema_json, &json_val);
-                for msg in schema_errors {
-                    all_errors.push(ConfigError {
-                        file: config_path.clone(),
-                        phase: "schema".to_string(),
-                        message: msg,
-                        line: None,
-                        column: None,
-                    });
-                }
-            }
-
-            // Phase 3: Serde deserialization as NormalizeConfig (catches field type mismatches
-            // that schema validation may miss, e.g. wrong enum variants)
-            match toml::from_str::<NormalizeConfig>(&raw) {
-                Ok(_) => {}
-                Err(e) => {
-                    let TomlSpan { line, column } = extract_toml_span(&e);
-                    all_errors.push(ConfigError {
-                        file: config_path.clone(),
-                        phase: "deserialize".to_string(),
-                        message: e.message().to_string(),
-                        line,
-                        column,
-                    });
-                }
-            }
-
-            // Phase 4: Rules config parsing (separate deserialization path used by rules engine)
-            #[derive(serde::Deserialize, Default)]
-            #[serde(default)]
-            struct RulesOnlyConfig {
-                rules: normalize_rules::RulesConfig,
-                #[serde(rename = "rule-tags")]
-                #[allow(dead_code)]
-                rule_tags: std::collections::HashMap<String, Vec<String>>,
-            }
-            match toml::from_str::<RulesOnlyConfig>(&raw) {
-                Ok(_) => {}
-                Err(e) => {
-                    let TomlSpan { line, column } = extract_toml_span(&e);
-                    all_errors.push(ConfigError {
-                        file: config_path.clone(),
-                        phase: "rules".to_string(),
-                        message: e.message().to_string(),
-                        line,
-                        column,
-                    });
-                }
-            }
+            all_errors.extend(validate_config_contents(config_path, &raw, &schema_json));
         }
 
         let valid = all_errors.is_empty();
@@ -1020,17 +1047,13 @@ impl ConfigService {
             return Err(msg);
         }
 
-        // Read back the new value for reporting
-        let new_value: serde_json::Value = {
-            let tv: toml::Value =
-                toml::from_str(&new_doc_str).unwrap_or(toml::Value::String(value.clone()));
-            // Navigate to the key
-            let mut v = serde_json::to_value(&tv).unwrap_or(serde_json::Value::Null);
-            for k in &keys {
-                v = v.get(*k).cloned().unwrap_or(serde_json::Value::Null);
-            }
-            v
-        };
+        // Read back the new value for reporting from the instance just validated:
+        // borrow down to the key and clone only the leaf.
+        let new_value = keys
+            .iter()
+            .try_fold(&new_instance, |v, k| v.get(*k))
+            .cloned()
+            .unwrap_or(serde_json::Value::Null);
 
         let old_json = old_value.map(|tv| {
             serde_json::to_value(
@@ -1054,3 +1077,55 @@ impl ConfigService {
         })
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_validate_reports_unknown_alias_command() {
+        let schema_json = load_schema(None).unwrap_or_else(|e| panic!("schema: {e}"));
+        let raw = r#"
+[aliases.bogus-cmd]
+syntax = "command"
+value = "no-such-subcommand --root src/"
+
+[aliases.bogus-flag]
+syntax = "command"
+value = "config validate --no-such-flag"
+"#;
+
+        let errors = validate_config_contents("config.toml", raw, &schema_json);
+
+        let alias_errors: Vec<&ConfigError> =
+            errors.iter().filter(|e| e.phase == "alias").collect();
+        assert_eq!(alias_errors.len(), 2, "errors: {errors:?}");
+        assert!(
+            alias_errors
+                .iter()
+                .any(|e| e.message.starts_with("@bogus-cmd:"))
+        );
+        assert!(
+            alias_errors
+                .iter()
+                .any(|e| e.message.starts_with("@bogus-flag:"))
+        );
+        assert!(
+            errors.iter().all(|e| e.phase == "alias"),
+            "unexpected non-alias errors: {errors:?}"
+        );
+    }
+
+    #[test]
+    fn test_validate_accepts_known_alias_command() {
+        let schema_json = load_schema(None).unwrap_or_else(|e| panic!("schema: {e}"));
+        let raw = r#"
+[aliases.check]
+syntax = "command"
+value = "config validate --root src/"
+"#;
+
+        let errors = validate_config_contents("config.toml", raw, &schema_json);
+        assert!(errors.is_empty(), "errors: {errors:?}");
+    }
+}
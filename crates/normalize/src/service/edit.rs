@@ -1560,7 +1560,7 @@ impl EditService {
     ///   normalize edit inline-function src/utils.ts 12:1 --dry-run # preview
     ///   normalize edit inline-function src/utils.ts 12:1 --force   # inline even if called >1×
     #[cli(name = "inline-function", display_with = "display_inline_function")]
-    pub async fn inline_function(
+    pub fn inline_function(
         &self,
         #[param(positional, help = "File path")] file: String,
         #[param(positional, help = "Position in file (line:col, 1-based)")] position: String,
@@ -1577,7 +1577,6 @@ impl EditService {
             force,
             message.as_deref(),
         )
-        .await
     }
 
     /// Extract a block of code into a new function.
@@ -2447,7 +2446,7 @@ impl OutputFormatter for InlineFunctionReport {
     }
 }
 
-async fn do_inline_function(
+fn do_inline_function(
     file: &str,
     position: &str,
     root: Option<&Path>,
@@ -19,8 +19,9 @@ impl std::fmt::Display for HistoryListReport {
 
 impl std::fmt::Display for HistoryDiffReport {
     fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
-        use crate::output::OutputFormatter;
-        write!(f, "{}", self.format_text())
+        // Diffs can be large: write the text straight through rather than
+        // cloning it via format_text().
+        f.write_str(self.diff_text())
     }
 }
 
@@ -74,7 +75,12 @@ impl HistoryService {
             return Ok(HistoryListReport::empty());
         }
         let entries = shadow.history(file.as_deref(), limit);
-        let checkpoint = shadow.checkpoint();
+        // Unfiltered history already starts at the latest edit; a file filter
+        // may skip it, so only then does the checkpoint need its own lookup.
+        let checkpoint = match file {
+            None => shadow.checkpoint_from(&entries),
+            Some(_) => shadow.checkpoint(),
+        };
         let head = entries.first().map(|e| e.id);
         Ok(HistoryListReport::new(head, checkpoint, entries))
     }
@@ -123,7 +129,7 @@ impl HistoryService {
         )?;
         let shadow = Shadow::new(&root);
         let entries = shadow.history(None, 100);
-        let checkpoint = shadow.checkpoint();
+        let checkpoint = shadow.checkpoint_from(&entries);
         let count = entries
             .iter()
             .take_while(|e| {
@@ -88,6 +88,7 @@ impl SyntaxService {
     ///   normalize syntax ast src/main.rs --sexp      # output as S-expression
     ///   normalize syntax ast src/main.rs --depth 3   # show only 3 levels deep
     ///   normalize syntax ast src/main.rs --compact   # show node-type outline, no source text
+    ///   normalize syntax ast src/main.rs --named     # skip anonymous nodes (punctuation, keywords)
     #[cli(display_with = "display_ast")]
     pub fn ast(
         &self,
@@ -100,6 +101,8 @@ impl SyntaxService {
         )]
         depth: Option<i32>,
         compact: bool,
+        #[param(help = "Show only named nodes, skipping punctuation and keyword tokens")]
+        named: bool,
         #[param(
             help = "Force a specific language (name or grammar name), skipping extension/config/sniffing resolution — for ambiguous extensions like .m, .pl, .s/.S/.asm, .conf"
         )]
@@ -115,6 +118,7 @@ impl SyntaxService {
             sexp,
             depth_val,
             compact,
+            named,
             lang.as_deref(),
         )?;
         *self.ast_text.borrow_mut() = text;
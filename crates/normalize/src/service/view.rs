@@ -318,7 +318,7 @@ impl ViewService {
     ///   normalize view chunk src/main.rs --around "fn" --match-index 3  # 3rd match
     #[cli(display_with = "display_chunked")]
     #[allow(clippy::too_many_arguments)]
-    pub async fn chunk(
+    pub fn chunk(
         &self,
         #[param(positional, help = "File path to view")] target: String,
         #[param(short = 'r', help = "Root directory (defaults to current directory)")] root: Option<
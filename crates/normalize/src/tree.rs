@@ -8,6 +8,7 @@ use normalize_facts::grammar_loader;
 use normalize_languages::Symbol;
 use normalize_languages::{GrammarLoader, support_for_grammar, support_for_path};
 use nu_ansi_term::Color::{LightCyan, LightGreen, LightMagenta, Red, White as LightGray, Yellow};
+use rayon::prelude::*;
 use serde::Serialize;
 use std::collections::{BTreeMap, HashSet};
 use std::path::Path;
@@ -653,14 +654,22 @@ fn normalize_language_name(name: &str) -> String {
 
 /// Collect highlight spans using tree-sitter Query API.
 fn collect_query_spans(query: &Query, root: tree_sitter::Node, source: &str) -> Vec<HighlightSpan> {
+    // A query has a few dozen capture names but a file yields thousands of
+    // captures; map each name to its kind once, indexed by capture index.
+    let capture_kinds: Vec<Option<HighlightKind>> = query
+        .capture_names()
+        .iter()
+        .copied()
+        .map(capture_name_to_highlight_kind)
+        .collect();
+
     let mut cursor = QueryCursor::new();
     let mut spans = Vec::new();
 
     let mut matches = cursor.matches(query, root, source.as_bytes());
     while let Some(match_) = matches.next() {
         for capture in match_.captures {
-            let capture_name = &query.capture_names()[capture.index as usize];
-            if let Some(kind) = capture_name_to_highlight_kind(capture_name) {
+            if let Some(&Some(kind)) = capture_kinds.get(capture.index as usize) {
                 spans.push(HighlightSpan {
                     start: capture.node.start_byte(),
                     end: capture.node.end_byte(),
@@ -893,8 +902,88 @@ fn is_method_call_node(
 
 /// Collect highlight spans from AST nodes.
 pub fn collect_highlight_spans(node: tree_sitter::Node, spans: &mut Vec<HighlightSpan>) {
-    let kind = node.kind();
-    let highlight = classify_node_kind(kind);
+    let table = kind_table(&node.language());
+    collect_spans_with_table(node, &table, spans);
+}
+
+/// Classify every node kind of `language` once, indexed by kind id.
+///
+/// The manual fallback visits every node in the file; looking the kind up by
+/// `kind_id()` avoids re-running the `classify_node_kind` string match per node.
+fn kind_table(language: &tree_sitter::Language) -> Vec<HighlightKind> {
+    (0..language.node_kind_count())
+        .map(|id| {
+            language
+                .node_kind_for_id(id as u16)
+                .map_or(HighlightKind::Default, classify_node_kind)
+        })
+        .collect()
+}
+
+/// Field name of `node` within its parent, if any.
+fn field_name_in_parent(node: tree_sitter::Node) -> Option<&'static str> {
+    let parent = node.parent()?;
+    let mut cursor = parent.walk();
+    let index = parent
+        .children(&mut cursor)
+        .position(|child| child.id() == node.id())?;
+    parent.field_name_for_child(index as u32)
+}
+
+/// Visit `node` and its descendants in pre-order with a single cursor, passing
+/// each node's depth below `node` and its field name within its parent.
+/// Returning `false` from `visit` skips that node's children.
+///
+/// Iterative, so deep trees cannot overflow the stack, and field names come
+/// from the cursor instead of re-scanning each parent's children.
+pub(crate) fn walk_with_fields<'a>(
+    node: tree_sitter::Node<'a>,
+    mut visit: impl FnMut(tree_sitter::Node<'a>, usize, Option<&'static str>) -> bool,
+) {
+    let mut cursor = node.walk();
+    let mut depth = 0;
+    let mut field = field_name_in_parent(node);
+    loop {
+        if visit(cursor.node(), depth, field) && cursor.goto_first_child() {
+            depth += 1;
+        } else {
+            loop {
+                if depth == 0 {
+                    return;
+                }
+                if cursor.goto_next_sibling() {
+                    break;
+                }
+                cursor.goto_parent();
+                depth -= 1;
+            }
+        }
+        field = cursor.field_name();
+    }
+}
+
+/// Push spans for `root` and its descendants in pre-order, via the iterative
+/// [`walk_with_fields`] so deeply nested files can't exhaust the stack.
+fn collect_spans_with_table(
+    root: tree_sitter::Node,
+    table: &[HighlightKind],
+    spans: &mut Vec<HighlightSpan>,
+) {
+    walk_with_fields(root, |node, _, _| push_node_spans(node, table, spans));
+}
+
+/// Push the spans for a single node. Returns whether its children still need
+/// visiting.
+fn push_node_spans(
+    node: tree_sitter::Node,
+    table: &[HighlightKind],
+    spans: &mut Vec<HighlightSpan>,
+) -> bool {
+    // ERROR/MISSING nodes use ids outside the symbol table; classify those by name.
+    let highlight = table
+        .get(node.kind_id() as usize)
+        .copied()
+        .unwrap_or_else(|| classify_node_kind(node.kind()));
 
     // Comments, strings, attributes, numbers: highlight entire node (don't recurse into children)
     // Numbers are included because CSS integer_value/float_value have child nodes (unit)
@@ -910,7 +999,7 @@ pub fn collect_highlight_spans(node: tree_sitter::Node, spans: &mut Vec<Highligh
             end: node.end_byte(),
             kind: highlight,
         });
-        return; // Don't recurse - these are single units
+        return false; // Don't recurse - these are single units
     }
 
     // Only highlight leaf nodes (no children) to avoid duplication
@@ -933,11 +1022,7 @@ pub fn collect_highlight_spans(node: tree_sitter::Node, spans: &mut Vec<Highligh
         });
     }
 
-    // Recurse into children
-    let mut cursor = node.walk();
-    for child in node.children(&mut cursor) {
-        collect_highlight_spans(child, spans);
-    }
+    true
 }
 
 /// Classify a node kind into a highlight category.
@@ -1283,7 +1368,9 @@ fn tree_node_to_view_node(
         }
     });
 
-    // Handle single-child chain collapsing
+    // Handle single-child chain collapsing. Siblings are converted in parallel:
+    // with `include_symbols` every file is parsed, and files are independent.
+    // `collect` keeps the sorted order.
     let (final_name, final_path, mut children) = if options.collapse_single && node.is_dir {
         let chain = collect_single_chain_internal(node, name);
         let collapsed_path = if parent_path.is_empty() {
@@ -1295,7 +1382,7 @@ fn tree_node_to_view_node(
         let child_nodes: Vec<ViewNode> = chain
             .end_node
             .children
-            .iter()
+            .par_iter()
             .map(|(child_name, child_node)| {
                 tree_node_to_view_node(child_name, &collapsed_path, child_node, options, fs_root)
             })
@@ -1304,7 +1391,7 @@ fn tree_node_to_view_node(
         (chain.path, collapsed_path, child_nodes)
     } else {
         let child_nodes: Vec<ViewNode> = children_vec
-            .into_iter()
+            .into_par_iter()
             .map(|(child_name, child_node)| {
                 tree_node_to_view_node(child_name, &path, child_node, options, fs_root)
             })